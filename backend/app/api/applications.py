@@ -1,30 +1,52 @@
 import os
-import uuid
-from typing import Optional
+import time
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from app.db.database import get_db
 from app.models.user import User
 from app.models.job import Job
 from app.models.candidate import Candidate
 from app.models.application import Application
 from app.schemas.application import (
-    ApplicationResponse,
     ApplicationDetailResponse,
     ApplicationListResponse,
     ApplicationSubmitResponse,
+    BulkImportResponse,
+    CandidateSearchResponse,
+    SimilarApplicationListResponse,
     ApplicationAction,
     ApplicationNoteCreate,
     CandidateInfo
 )
 from app.schemas.job import JobPublicResponse
-from app.api.deps import get_current_user
-from app.ml.resume_parser import resume_parser
-from app.ml.scorer import scorer
-from app.ml.ai_analyzer import ai_analyzer
+from app.api.deps import cursor_position, get_current_user
+from app.services.applications import (
+    count_statement,
+    list_filters,
+    list_response,
+    list_sort_column,
+    list_statement,
+    scored_page,
+    search_response,
+    similar_applications,
+    unscored_page
+)
+from app.services.bulk_import import bulk_import_response, discard_files, import_resumes, stage_uploads
+from app.services.resumes import application_resume_data
+from app.services.scoring_queue import scoring_queue
+from app.services.search import (
+    search_count_statement,
+    search_filters,
+    search_page,
+    search_sort,
+    search_statement
+)
+from app.utils.metrics import stage_timer
+from app.utils.uploads import UploadTooLarge, save_stream
 from app.config import get_settings
 
 settings = get_settings()
@@ -32,6 +54,13 @@ settings = get_settings()
 router = APIRouter(tags=["Applications"])
 
 
+def _get_own_job(db: Session, job_id: UUID, user: User) -> Optional[Job]:
+    return db.query(Job).filter(
+        Job.id == job_id,
+        Job.user_id == user.id
+    ).first()
+
+
 # Public endpoints (no auth required)
 
 @router.get("/public/jobs/{public_link}", response_model=JobPublicResponse)
@@ -63,7 +92,7 @@ def get_public_job(public_link: str, db: Session = Depends(get_db)):
 
 
 @router.post("/public/apply/{public_link}", response_model=ApplicationSubmitResponse)
-async def submit_application(
+def submit_application(
     public_link: str,
     full_name: str = Form(...),
     email: str = Form(...),
@@ -73,6 +102,9 @@ async def submit_application(
     db: Session = Depends(get_db)
 ):
     """Submit an application (for candidates)"""
+    # A plain def route: the blocking queries and the copy of the spooled
+    # upload run in the threadpool, not on the event loop
+
     # Find the job
     job = db.query(Job).filter(
         Job.public_link == public_link,
@@ -99,14 +131,6 @@ async def submit_application(
             detail=f"File type not allowed. Allowed: {', '.join(settings.allowed_extensions)}"
         )
 
-    # Check file size
-    content = await resume.read()
-    if len(content) > settings.max_file_size:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size: {settings.max_file_size // 1024 // 1024}MB"
-        )
-
     # Find or create candidate
     candidate = db.query(Candidate).filter(Candidate.email == email).first()
     if not candidate:
@@ -136,65 +160,36 @@ async def submit_application(
             detail="You have already applied for this job"
         )
 
-    # Save resume file
-    os.makedirs(settings.upload_dir, exist_ok=True)
-    file_uuid = str(uuid.uuid4())
-    file_path = os.path.join(settings.upload_dir, f"{file_uuid}.{file_ext}")
-
-    with open(file_path, "wb") as f:
-        f.write(content)
-
-    # Parse resume
-    resume_data = resume_parser.parse(file_path)
-
-    # Use form years_of_experience if provided, otherwise use parsed value
-    if years_of_experience is not None:
-        resume_data["years_of_experience"] = years_of_experience
-
-    # Build job data for AI analysis
-    job_data = {
-        "title": job.title,
-        "description": job.description,
-        "requirements": job.requirements,
-        "skills": job.skills or [],
-        "min_experience": job.min_experience
-    }
-
-    # Use AI analyzer if available, fallback to rule-based scorer
-    if ai_analyzer.is_available() and resume_data.get("raw_text"):
-        score_result = ai_analyzer.analyze_resume(resume_data["raw_text"], job_data)
-        # Update resume_data with AI-extracted experience if not provided
-        if years_of_experience is None and score_result.get("years_of_experience"):
-            resume_data["years_of_experience"] = score_result["years_of_experience"]
-    else:
-        score_result = scorer.score(resume_data, job_data)
-
-    # Build full score breakdown with all AI analysis data
-    full_score_breakdown = {
-        **score_result.get("score_breakdown", {}),
-        "matched_skills": score_result.get("matched_skills", []),
-        "missing_skills": score_result.get("missing_skills", []),
-        "strengths": score_result.get("strengths", []),
-        "concerns": score_result.get("concerns", []),
-        "ai_powered": score_result.get("ai_powered", False)
-    }
-
-    # Create application
+    # Copy the spooled upload to disk, hashing it; BodySizeLimitMiddleware
+    # bounded the request body as it arrived
+    try:
+        with stage_timer("save_upload"):
+            stored = save_stream(resume.file, settings.upload_dir, file_ext, settings.max_file_size)
+    except UploadTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File too large. Maximum size: {settings.max_file_size // 1024 // 1024}MB"
+        )
+
+    # Create application; parsing and scoring happen in the background worker
     application = Application(
         job_id=job.id,
         candidate_id=candidate.id,
-        resume_path=file_path,
-        resume_parsed=resume_data,
-        ai_score=score_result["final_score"],
-        score_breakdown=full_score_breakdown,
-        explanation=score_result["explanation"]
+        resume_path=stored.path,
+        resume_hash=stored.sha256,
+        scoring_status="pending"
     )
     db.add(application)
-    db.commit()
+    db.flush()
+
+    scoring_queue.enqueue(db, application.id, years_of_experience)
+    with stage_timer("db_commit"):
+        db.commit()
 
     return ApplicationSubmitResponse(
         message="Application submitted successfully",
-        application_id=application.id
+        application_id=application.id,
+        scoring_status=application.scoring_status
     )
 
 
@@ -205,10 +200,24 @@ def list_applications(
     job_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    status: Optional[str] = None,
-    sort_by: str = "score"
+    status_filter: Optional[str] = Query(None, alias="status"),
+    sort_by: str = Query("score", pattern="^(score|date)$"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    skills: List[str] = Query([], alias="skill"),
+    include_total: bool = True
 ):
-    """List all applications for a job (sorted by AI score)"""
+    """
+    List applications for a job, best score first (or newest first)
+
+    Pages are keyset-based: pass `next_cursor` from the previous response as
+    `cursor`. Applications not scored yet come after all scored ones.
+    `skill` (repeatable) keeps applications with every listed skill, matched
+    whole and case-insensitively as in candidate search.
+    Ordering is (ai_score DESC, id DESC) or (applied_at DESC, id DESC), served
+    by the (job_id, ai_score, id) and (job_id, applied_at, id) indexes.
+    """
     # Verify job belongs to user
     job = db.query(Job).filter(
         Job.id == job_id,
@@ -221,41 +230,119 @@ def list_applications(
             detail="Job not found"
         )
 
-    query = db.query(Application).filter(Application.job_id == job_id)
-
-    if status:
-        query = query.filter(Application.status == status)
-
-    # Sort by score (descending) by default
-    if sort_by == "score":
-        query = query.order_by(desc(Application.ai_score))
-    elif sort_by == "date":
-        query = query.order_by(desc(Application.applied_at))
-
-    applications = query.all()
-
-    # Build response
-    app_responses = []
-    for app in applications:
-        candidate = app.candidate
-        app_responses.append(ApplicationResponse(
-            id=app.id,
-            candidate=CandidateInfo(
-                id=candidate.id,
-                full_name=candidate.full_name,
-                email=candidate.email,
-                phone=candidate.phone,
-                years_of_experience=candidate.years_of_experience
-            ),
-            ai_score=app.ai_score,
-            score_breakdown=app.score_breakdown,
-            explanation=app.explanation,
-            status=app.status,
-            applied_at=app.applied_at,
-            resume_path=app.resume_path
-        ))
-
-    return ApplicationListResponse(applications=app_responses, total=len(app_responses))
+    sort_column = list_sort_column(sort_by)
+    filters = list_filters(job_id, status_filter, min_score, skills)
+    statement = list_statement(filters)
+    last_value, last_id = cursor_position(cursor, sort_by)
+
+    # Rows with a sort value first, then rows where it is NULL; each part
+    # is a plain index range scan
+    rows = []
+    if cursor is None or last_value is not None:
+        rows = db.execute(scored_page(statement, sort_column, last_value, last_id, limit)).all()
+    if len(rows) <= limit:
+        rows += db.execute(unscored_page(statement, sort_column, last_value, last_id, limit + 1 - len(rows))).all()
+
+    total = db.scalar(count_statement(filters)) if include_total else None
+    return list_response(rows, limit, sort_by, total)
+
+
+@router.get("/jobs/{job_id}/applications/similar", response_model=SimilarApplicationListResponse)
+def list_similar_applications(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    """
+    Applications whose resumes are closest to the job description
+
+    Ranks by cosine similarity of local text embeddings (no LLM calls), as
+    a cheap pre-ranking before spending AI analysis on the top candidates.
+    Applications whose resume hasn't been parsed yet are not included.
+    """
+    job = db.query(Job).filter(
+        Job.id == job_id,
+        Job.user_id == current_user.id
+    ).first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    return similar_applications(db, job, limit)
+
+
+@router.post("/jobs/{job_id}/applications/import", response_model=BulkImportResponse)
+async def import_applications(
+    job_id: UUID,
+    files: List[UploadFile] = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Import many resumes into a job at once
+
+    Accepts ZIP archives of resumes and/or individual resume files in one
+    multipart request. Candidates are created from the name, email and phone
+    found in each resume. Returns a result for every file.
+    """
+    # Async so the uploads are staged with async reads; every query runs in
+    # the threadpool, never on the event loop
+    started = time.perf_counter()
+
+    job = await run_in_threadpool(_get_own_job, db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    imported, report = await stage_uploads(files)
+    try:
+        # Parsing and inserts are blocking; keep them off the event loop
+        report = await run_in_threadpool(import_resumes, db, job, imported, report)
+    except BaseException:
+        discard_files(imported)
+        raise
+
+    return bulk_import_response(report, started)
+
+
+# Declared before /applications/{application_id} so "search" isn't taken for an id
+@router.get("/applications/search", response_model=CandidateSearchResponse)
+def search_candidates(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    q: Optional[str] = Query(None, max_length=500),
+    skills: List[str] = Query([], alias="skill"),
+    min_experience: Optional[int] = Query(None, ge=0, le=50),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    include_total: bool = False
+):
+    """
+    Search candidates across all of the user's jobs
+
+    `q` is a web-search style query over resume text ("kubernetes -php",
+    "site reliability"), `skill` (repeatable) requires every listed skill and
+    `min_experience` a minimum of years. Results are ranked by text relevance
+    when `q` is given, otherwise newest first, and paged with `next_cursor`.
+    Both filters are served by GIN indexes, so cost follows the number of
+    matches rather than the table size; `include_total` adds a full count.
+    """
+    q = q.strip() if q else None
+    sort_column, sort_by = search_sort(q)
+    filters = search_filters(current_user.id, q, skills, min_experience)
+    last_value, last_id = cursor_position(cursor, sort_by)
+
+    rows = db.execute(search_page(search_statement(filters, sort_column), sort_column, last_value, last_id, limit)).all()
+
+    total = db.scalar(search_count_statement(filters)) if include_total else None
+    return search_response(rows, limit, sort_by, total)
 
 
 @router.get("/applications/{application_id}", response_model=ApplicationDetailResponse)
@@ -306,10 +393,11 @@ def get_application(
         ai_score=application.ai_score,
         score_breakdown=application.score_breakdown,
         explanation=application.explanation,
+        scoring_status=application.scoring_status,
         status=application.status,
         applied_at=application.applied_at,
         resume_path=application.resume_path,
-        resume_parsed=application.resume_parsed,
+        resume_parsed=application_resume_data(application),
         matched_skills=matched_skills,
         missing_skills=missing_skills,
         strengths=strengths,
@@ -0,0 +1,6 @@
+"""
+Async versions of the API routers, served when settings.database_async is on
+
+They expose the same paths and schemas as the sync routers in app.api, but
+run on the event loop with an AsyncSession instead of FastAPI's threadpool.
+"""
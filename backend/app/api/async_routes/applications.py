@@ -0,0 +1,471 @@
+import os
+import time
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
+from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from starlette.concurrency import run_in_threadpool
+from app.db.database import get_async_db, SessionLocal
+from app.models.user import User
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.models.application import Application
+from app.schemas.application import (
+    ApplicationDetailResponse,
+    ApplicationListResponse,
+    ApplicationSubmitResponse,
+    BulkImportResponse,
+    CandidateSearchResponse,
+    SimilarApplicationListResponse,
+    ApplicationAction,
+    ApplicationNoteCreate,
+    CandidateInfo
+)
+from app.schemas.job import JobPublicResponse
+from app.api.deps import cursor_position, get_current_user_async
+from app.services.applications import (
+    count_statement,
+    list_filters,
+    list_response,
+    list_sort_column,
+    list_statement,
+    scored_page,
+    search_response,
+    similar_applications,
+    unscored_page
+)
+from app.services.bulk_import import bulk_import_response, discard_files, import_resumes, stage_uploads
+from app.services.resumes import application_resume_data
+from app.services.scoring_queue import scoring_queue
+from app.services.search import (
+    search_count_statement,
+    search_filters,
+    search_page,
+    search_sort,
+    search_statement
+)
+from app.utils.metrics import stage_timer
+from app.utils.uploads import UploadTooLarge, save_upload
+from app.config import get_settings
+
+settings = get_settings()
+
+router = APIRouter(tags=["Applications"])
+
+
+async def _get_own_job(db: AsyncSession, job_id: UUID, user: User) -> Optional[Job]:
+    return await db.scalar(select(Job).where(
+        Job.id == job_id,
+        Job.user_id == user.id
+    ))
+
+
+async def _get_own_application(db: AsyncSession, application_id: UUID, user: User) -> Application:
+    """Load an application with its candidate, 404 unless the user owns its job"""
+    application = await db.scalar(
+        select(Application).join(
+            Job, Job.id == Application.job_id
+        ).where(
+            Application.id == application_id,
+            Job.user_id == user.id
+        ).options(joinedload(Application.candidate))
+    )
+
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+
+    return application
+
+
+# Public endpoints (no auth required)
+
+@router.get("/public/jobs/{public_link}", response_model=JobPublicResponse)
+async def get_public_job(public_link: str, db: AsyncSession = Depends(get_async_db)):
+    """Get job by public link (for candidates)"""
+    row = (await db.execute(
+        select(Job, User.company_name).join(
+            User, User.id == Job.user_id, isouter=True
+        ).where(
+            Job.public_link == public_link,
+            Job.status == "published"
+        )
+    )).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or no longer accepting applications"
+        )
+
+    job, company_name = row
+    return JobPublicResponse(
+        id=job.id,
+        title=job.title,
+        description=job.description,
+        requirements=job.requirements,
+        skills=job.skills or [],
+        min_experience=job.min_experience,
+        company_name=company_name
+    )
+
+
+@router.post("/public/apply/{public_link}", response_model=ApplicationSubmitResponse)
+async def submit_application(
+    public_link: str,
+    full_name: str = Form(...),
+    email: str = Form(...),
+    phone: Optional[str] = Form(None),
+    years_of_experience: Optional[int] = Form(None),
+    resume: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Submit an application (for candidates)"""
+    # Find the job
+    job = await db.scalar(select(Job).where(
+        Job.public_link == public_link,
+        Job.status == "published"
+    ))
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or no longer accepting applications"
+        )
+
+    # Validate file
+    if not resume.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Resume file is required"
+        )
+
+    file_ext = resume.filename.split('.')[-1].lower()
+    if file_ext not in settings.allowed_extensions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File type not allowed. Allowed: {', '.join(settings.allowed_extensions)}"
+        )
+
+    # Find or create candidate
+    candidate = await db.scalar(select(Candidate).where(Candidate.email == email).limit(1))
+    if not candidate:
+        candidate = Candidate(
+            email=email,
+            full_name=full_name,
+            phone=phone,
+            years_of_experience=years_of_experience
+        )
+        db.add(candidate)
+        await db.flush()
+    else:
+        # Update candidate info
+        candidate.full_name = full_name
+        candidate.phone = phone or candidate.phone
+        candidate.years_of_experience = years_of_experience or candidate.years_of_experience
+
+    # Check if already applied
+    existing_app = await db.scalar(select(Application.id).where(
+        Application.job_id == job.id,
+        Application.candidate_id == candidate.id
+    ))
+
+    if existing_app:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already applied for this job"
+        )
+
+    # Copy the spooled upload to disk, hashing it; BodySizeLimitMiddleware
+    # bounded the request body as it arrived
+    try:
+        with stage_timer("save_upload"):
+            stored = await save_upload(resume, settings.upload_dir, file_ext, settings.max_file_size)
+    except UploadTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File too large. Maximum size: {settings.max_file_size // 1024 // 1024}MB"
+        )
+
+    # Create application; parsing and scoring happen in the background worker
+    application = Application(
+        job_id=job.id,
+        candidate_id=candidate.id,
+        resume_path=stored.path,
+        resume_hash=stored.sha256,
+        scoring_status="pending"
+    )
+    db.add(application)
+    await db.flush()
+
+    # Queues hook into the ORM session underneath the async one
+    scoring_queue.enqueue(db.sync_session, application.id, years_of_experience)
+    with stage_timer("db_commit"):
+        await db.commit()
+
+    return ApplicationSubmitResponse(
+        message="Application submitted successfully",
+        application_id=application.id,
+        scoring_status=application.scoring_status
+    )
+
+
+# Protected endpoints (auth required)
+
+@router.get("/jobs/{job_id}/applications", response_model=ApplicationListResponse)
+async def list_applications(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    sort_by: str = Query("score", pattern="^(score|date)$"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    skills: List[str] = Query([], alias="skill"),
+    include_total: bool = True
+):
+    """
+    List applications for a job, best score first (or newest first)
+
+    Same keyset pagination as the sync route: pass `next_cursor` from the
+    previous response as `cursor`.
+    """
+    job = await _get_own_job(db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    sort_column = list_sort_column(sort_by)
+    filters = list_filters(job_id, status_filter, min_score, skills)
+    statement = list_statement(filters)
+    last_value, last_id = cursor_position(cursor, sort_by)
+
+    rows = []
+    if cursor is None or last_value is not None:
+        rows = (await db.execute(scored_page(statement, sort_column, last_value, last_id, limit))).all()
+    if len(rows) <= limit:
+        rows += (await db.execute(
+            unscored_page(statement, sort_column, last_value, last_id, limit + 1 - len(rows))
+        )).all()
+
+    total = await db.scalar(count_statement(filters)) if include_total else None
+    return list_response(rows, limit, sort_by, total)
+
+
+def _similar_with_sync_session(job_id: UUID, limit: int) -> SimilarApplicationListResponse:
+    db = SessionLocal()
+    try:
+        return similar_applications(db, db.get(Job, job_id), limit)
+    finally:
+        db.close()
+
+
+@router.get("/jobs/{job_id}/applications/similar", response_model=SimilarApplicationListResponse)
+async def list_similar_applications(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    """
+    Applications whose resumes are closest to the job description
+
+    Ranking is CPU-bound NumPy work over a cached matrix, so it runs in the
+    thread pool on a sync session, like bulk import.
+    """
+    job = await _get_own_job(db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    return await run_in_threadpool(_similar_with_sync_session, job_id, limit)
+
+
+def _import_with_sync_session(job_id: UUID, imported: list, report):
+    db = SessionLocal()
+    try:
+        return import_resumes(db, db.get(Job, job_id), imported, report)
+    finally:
+        db.close()
+
+
+@router.post("/jobs/{job_id}/applications/import", response_model=BulkImportResponse)
+async def import_applications(
+    job_id: UUID,
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """
+    Import many resumes into a job at once
+
+    Accepts ZIP archives of resumes and/or individual resume files in one
+    multipart request. Returns a result for every file.
+    """
+    started = time.perf_counter()
+
+    job = await _get_own_job(db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    imported, report = await stage_uploads(files)
+    try:
+        # Parsing dominates and is blocking; run it on a sync session in the threadpool
+        report = await run_in_threadpool(_import_with_sync_session, job.id, imported, report)
+    except BaseException:
+        discard_files(imported)
+        raise
+
+    return bulk_import_response(report, started)
+
+
+# Declared before /applications/{application_id} so "search" isn't taken for an id
+@router.get("/applications/search", response_model=CandidateSearchResponse)
+async def search_candidates(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    q: Optional[str] = Query(None, max_length=500),
+    skills: List[str] = Query([], alias="skill"),
+    min_experience: Optional[int] = Query(None, ge=0, le=50),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    include_total: bool = False
+):
+    """
+    Search candidates across all of the user's jobs
+
+    Same query parameters, ranking and cursors as the sync route.
+    """
+    q = q.strip() if q else None
+    sort_column, sort_by = search_sort(q)
+    filters = search_filters(current_user.id, q, skills, min_experience)
+    last_value, last_id = cursor_position(cursor, sort_by)
+
+    rows = (await db.execute(
+        search_page(search_statement(filters, sort_column), sort_column, last_value, last_id, limit)
+    )).all()
+
+    total = await db.scalar(search_count_statement(filters)) if include_total else None
+    return search_response(rows, limit, sort_by, total)
+
+
+@router.get("/applications/{application_id}", response_model=ApplicationDetailResponse)
+async def get_application(
+    application_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Get a specific application with full details"""
+    application = await _get_own_application(db, application_id, current_user)
+    candidate = application.candidate
+    # The resume and its legacy inline copy are not loaded with the application
+    await db.refresh(application, ["resume", "resume_parsed"])
+
+    # Extract matched/missing skills from score_breakdown if available
+    score_data = application.score_breakdown or {}
+
+    return ApplicationDetailResponse(
+        id=application.id,
+        candidate=CandidateInfo(
+            id=candidate.id,
+            full_name=candidate.full_name,
+            email=candidate.email,
+            phone=candidate.phone,
+            years_of_experience=candidate.years_of_experience
+        ),
+        ai_score=application.ai_score,
+        score_breakdown=application.score_breakdown,
+        explanation=application.explanation,
+        scoring_status=application.scoring_status,
+        status=application.status,
+        applied_at=application.applied_at,
+        resume_path=application.resume_path,
+        resume_parsed=application_resume_data(application),
+        matched_skills=score_data.get("matched_skills", []),
+        missing_skills=score_data.get("missing_skills", []),
+        strengths=score_data.get("strengths", []),
+        concerns=score_data.get("concerns", []),
+        notes=application.notes
+    )
+
+
+@router.put("/applications/{application_id}/notes")
+async def update_application_notes(
+    application_id: UUID,
+    note_data: ApplicationNoteCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Update notes for an application"""
+    application = await _get_own_application(db, application_id, current_user)
+
+    application.notes = note_data.note
+    await db.commit()
+
+    return {"message": "Notes updated successfully"}
+
+
+@router.post("/applications/{application_id}/action")
+async def application_action(
+    application_id: UUID,
+    action_data: ApplicationAction,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Take action on an application (interview, reject, hire)"""
+    application = await _get_own_application(db, application_id, current_user)
+
+    valid_actions = ["interview", "reject", "hire", "reviewed"]
+    if action_data.action not in valid_actions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid action. Valid actions: {', '.join(valid_actions)}"
+        )
+
+    application.status = action_data.action
+    await db.commit()
+
+    return {"message": f"Application marked as {action_data.action}"}
+
+
+@router.get("/applications/{application_id}/resume")
+async def download_resume(
+    application_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Download resume file for an application"""
+    application = await _get_own_application(db, application_id, current_user)
+
+    # Check if file exists
+    if not application.resume_path or not os.path.exists(application.resume_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume file not found"
+        )
+
+    # Get candidate name for filename
+    candidate = application.candidate
+    filename = f"{candidate.full_name.replace(' ', '_')}_resume{os.path.splitext(application.resume_path)[1]}"
+
+    return FileResponse(
+        path=application.resume_path,
+        filename=filename,
+        media_type="application/octet-stream"
+    )
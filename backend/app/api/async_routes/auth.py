@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
+from app.models.user import User
+from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse
+from app.utils.security import HashingBusy, create_access_token, password_hasher
+from app.api.deps import get_current_user_async, hashing_busy
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+
+@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """Register a new user"""
+    # Check if user exists
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+
+    # bcrypt is CPU-bound; it runs on the password hashing pool
+    try:
+        password_hash = await password_hasher.hash_async(user_data.password)
+    except HashingBusy:
+        raise hashing_busy()
+
+    # Create new user
+    user = User(
+        email=user_data.email,
+        password_hash=password_hash,
+        company_name=user_data.company_name
+    )
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+
+    # Generate token
+    access_token = create_access_token(str(user.id))
+
+    return TokenResponse(
+        access_token=access_token,
+        user=UserResponse.model_validate(user)
+    )
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    """Login and get access token"""
+    user = await db.scalar(select(User).where(User.email == user_data.email))
+
+    try:
+        valid = user is not None and await password_hasher.verify_async(user_data.password, user.password_hash)
+        # Upgrade hashes made with a different work factor while we have the password
+        if valid and password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = await password_hasher.hash_async(user_data.password)
+            await db.commit()
+            await db.refresh(user)
+    except HashingBusy:
+        raise hashing_busy()
+
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password"
+        )
+
+    access_token = create_access_token(str(user.id))
+
+    return TokenResponse(
+        access_token=access_token,
+        user=UserResponse.model_validate(user)
+    )
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_me(current_user: User = Depends(get_current_user_async)):
+    """Get current user info"""
+    return UserResponse.model_validate(current_user)
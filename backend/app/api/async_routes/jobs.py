@@ -0,0 +1,217 @@
+from typing import Dict, Optional
+from uuid import UUID
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.db.database import get_async_db, SessionLocal
+from app.models.user import User
+from app.models.job import Job
+from app.models.application import Application
+from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobListResponse, RescoreResponse
+from app.api.deps import get_current_user_async
+from app.services.jobs import application_counts_statement, group_counts, job_response
+from app.services.rescoring import (
+    RescoreProgress,
+    get_rescore_progress,
+    rescore_job,
+    run_rescore_in_background,
+    start_rescore
+)
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+async def _application_counts(db: AsyncSession, *filters) -> Dict[UUID, Dict[str, int]]:
+    return group_counts((await db.execute(application_counts_statement(*filters))).all())
+
+
+async def _get_own_job(db: AsyncSession, job_id: UUID, user: User) -> Optional[Job]:
+    return await db.scalar(select(Job).where(
+        Job.id == job_id,
+        Job.user_id == user.id
+    ))
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
+async def create_job(
+    job_data: JobCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Create a new job posting"""
+    job = Job(
+        user_id=current_user.id,
+        title=job_data.title,
+        description=job_data.description,
+        requirements=job_data.requirements,
+        skills=job_data.skills,
+        min_experience=job_data.min_experience,
+        cascade_min_rule_score=job_data.cascade_min_rule_score,
+        cascade_top_k=job_data.cascade_top_k
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+
+    return job_response(job)
+
+
+@router.get("", response_model=JobListResponse)
+async def list_jobs(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    status: Optional[str] = None
+):
+    """List all jobs for current user"""
+    query = select(Job).where(Job.user_id == current_user.id)
+
+    if status:
+        query = query.where(Job.status == status)
+
+    jobs = (await db.scalars(query.order_by(Job.created_at.desc()))).all()
+
+    # Get application counts for all jobs at once
+    counts = await _application_counts(db, Job.user_id == current_user.id)
+    job_responses = [job_response(job, counts.get(job.id)) for job in jobs]
+
+    return JobListResponse(jobs=job_responses, total=len(job_responses))
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Get a specific job by ID"""
+    job = await _get_own_job(db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    counts = await _application_counts(db, Application.job_id == job.id)
+    return job_response(job, counts.get(job.id))
+
+
+@router.patch("/{job_id}", response_model=JobResponse)
+async def update_job(
+    job_id: UUID,
+    job_data: JobUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Update a job posting"""
+    job = await _get_own_job(db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    update_data = job_data.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(job, field, value)
+
+    await db.commit()
+    await db.refresh(job)
+
+    counts = await _application_counts(db, Application.job_id == job.id)
+    return job_response(job, counts.get(job.id))
+
+
+@router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_job(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Delete a job posting"""
+    job = await _get_own_job(db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    await db.delete(job)
+    await db.commit()
+
+
+def _rescore_inline(job_id: UUID, progress: RescoreProgress) -> None:
+    """Rule-based re-scoring with a sync session, run in the threadpool"""
+    db = SessionLocal()
+    try:
+        job = db.get(Job, job_id)
+        rescore_job(db, job, progress=progress)
+    finally:
+        db.close()
+
+
+@router.post("/{job_id}/rescore", response_model=RescoreResponse)
+async def rescore_applications(
+    job_id: UUID,
+    background_tasks: BackgroundTasks,
+    use_ai: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """
+    Re-score all applications of a job against its current requirements
+
+    The rule-based scorer runs inline and returns the finished run. With
+    use_ai=true the run continues in the background; poll GET /rescore.
+    """
+    job = await _get_own_job(db, job_id, current_user)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    progress = start_rescore(job.id, use_ai)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Re-scoring is already running for this job"
+        )
+
+    if use_ai:
+        background_tasks.add_task(run_rescore_in_background, job.id, progress)
+        return RescoreResponse(**progress.to_dict())
+
+    try:
+        await run_in_threadpool(_rescore_inline, job.id, progress)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Re-scoring failed: {progress.error}"
+        )
+
+    return RescoreResponse(**progress.to_dict())
+
+
+@router.get("/{job_id}/rescore", response_model=RescoreResponse)
+async def get_rescore_status(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Get progress of the latest re-scoring run for a job"""
+    job = await _get_own_job(db, job_id, current_user)
+
+    progress = get_rescore_progress(job_id) if job else None
+
+    if not progress:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No re-scoring run found for this job"
+        )
+
+    return RescoreResponse(**progress.to_dict())
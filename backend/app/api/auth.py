@@ -1,34 +1,54 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse
-from app.utils.security import hash_password, verify_password, create_access_token
-from app.api.deps import get_current_user
+from app.utils.security import HashingBusy, create_access_token, password_hasher
+from app.api.deps import get_current_user, hashing_busy
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# register and login are async so they wait on the password hashing pool
+# without holding one of FastAPI's request threads for the whole bcrypt run;
+# their short queries still go through the threadpool
+
+
+def _user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.query(User).filter(User.email == email).first()
+
+
+def _save_user(db: Session, user: User) -> User:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
     # Check if user exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_in_threadpool(_user_by_email, db, user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
+    try:
+        password_hash = await password_hasher.hash_async(user_data.password)
+    except HashingBusy:
+        raise hashing_busy()
+
     # Create new user
     user = User(
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=password_hash,
         company_name=user_data.company_name
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    user = await run_in_threadpool(_save_user, db, user)
 
     # Generate token
     access_token = create_access_token(str(user.id))
@@ -40,11 +60,20 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """Login and get access token"""
-    user = db.query(User).filter(User.email == user_data.email).first()
+    user = await run_in_threadpool(_user_by_email, db, user_data.email)
+
+    try:
+        valid = user is not None and await password_hasher.verify_async(user_data.password, user.password_hash)
+        # Upgrade hashes made with a different work factor while we have the password
+        if valid and password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = await password_hasher.hash_async(user_data.password)
+            user = await run_in_threadpool(_save_user, db, user)
+    except HashingBusy:
+        raise hashing_busy()
 
-    if not user or not verify_password(user_data.password, user.password_hash):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -1,31 +1,39 @@
-from typing import Generator
+import hmac
+from typing import Generator, Optional, Tuple
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
 from app.models.user import User
-from app.utils.security import decode_token
+from app.services.applications import InvalidCursor, decode_cursor
+from app.utils.auth_cache import auth_cache
+from app.config import get_settings
+
+settings = get_settings()
 
 security = HTTPBearer()
+metrics_security = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token"""
-    token = credentials.credentials
-    user_id = decode_token(token)
+def _token_user_id(credentials: HTTPAuthorizationCredentials) -> UUID:
+    """Return the user id from a bearer token, or raise 401"""
+    user_id = auth_cache.user_id_for_token(credentials.credentials)
 
-    if user_id is None:
+    try:
+        # A UUID rather than the raw claim, so lookups work on every dialect
+        return UUID(user_id)
+    except (TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
 
+def _require_user(user) -> User:
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,3 +42,82 @@ def get_current_user(
         )
 
     return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token
+
+    Repeat requests are served from auth_cache without touching the
+    database; the returned User is then a detached snapshot (id, email,
+    company_name, created_at) that may be up to auth_cache_ttl_seconds old
+    when the user was changed or deleted by another process.
+    """
+    user_id = _token_user_id(credentials)
+
+    user = auth_cache.get_user(user_id)
+    if user is None:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None:
+            auth_cache.put_user(user)
+
+    return _require_user(user)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """Get current authenticated user from JWT token (async session)"""
+    user_id = _token_user_id(credentials)
+
+    user = auth_cache.get_user(user_id)
+    if user is None:
+        user = await db.scalar(select(User).where(User.id == user_id))
+        if user is not None:
+            auth_cache.put_user(user)
+
+    return _require_user(user)
+
+
+def require_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(metrics_security)
+) -> None:
+    """Allow a metrics scrape with settings.metrics_token; 404 while none is set"""
+    if not settings.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode(), settings.metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+def cursor_position(cursor: Optional[str], sort_by: str) -> Tuple[Optional[object], Optional[UUID]]:
+    """Sort value and id to continue a page after, or raise 400 for a bad cursor"""
+    if not cursor:
+        return None, None
+
+    try:
+        return decode_cursor(cursor, sort_by)
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def hashing_busy() -> HTTPException:
+    """503 for when the password hashing pool is saturated"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in requests, please retry shortly",
+        headers={"Retry-After": "1"}
+    )
@@ -1,14 +1,20 @@
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from app.db.database import get_db
 from app.models.user import User
 from app.models.job import Job
 from app.models.application import Application
-from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobListResponse
+from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobListResponse, RescoreResponse
 from app.api.deps import get_current_user
+from app.services.jobs import application_counts, job_response
+from app.services.rescoring import (
+    get_rescore_progress,
+    rescore_job,
+    run_rescore_in_background,
+    start_rescore
+)
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
@@ -26,26 +32,15 @@ def create_job(
         description=job_data.description,
         requirements=job_data.requirements,
         skills=job_data.skills,
-        min_experience=job_data.min_experience
+        min_experience=job_data.min_experience,
+        cascade_min_rule_score=job_data.cascade_min_rule_score,
+        cascade_top_k=job_data.cascade_top_k
     )
     db.add(job)
     db.commit()
     db.refresh(job)
 
-    return JobResponse(
-        **{
-            "id": job.id,
-            "title": job.title,
-            "description": job.description,
-            "requirements": job.requirements,
-            "skills": job.skills or [],
-            "min_experience": job.min_experience,
-            "public_link": job.public_link,
-            "status": job.status,
-            "created_at": job.created_at,
-            "applications_count": 0
-        }
-    )
+    return job_response(job)
 
 
 @router.get("", response_model=JobListResponse)
@@ -62,25 +57,9 @@ def list_jobs(
 
     jobs = query.order_by(Job.created_at.desc()).all()
 
-    # Get application counts
-    job_responses = []
-    for job in jobs:
-        app_count = db.query(func.count(Application.id)).filter(
-            Application.job_id == job.id
-        ).scalar()
-
-        job_responses.append(JobResponse(
-            id=job.id,
-            title=job.title,
-            description=job.description,
-            requirements=job.requirements,
-            skills=job.skills or [],
-            min_experience=job.min_experience,
-            public_link=job.public_link,
-            status=job.status,
-            created_at=job.created_at,
-            applications_count=app_count
-        ))
+    # Get application counts for all jobs at once
+    counts = application_counts(db, Job.user_id == current_user.id)
+    job_responses = [job_response(job, counts.get(job.id)) for job in jobs]
 
     return JobListResponse(jobs=job_responses, total=len(job_responses))
 
@@ -103,22 +82,8 @@ def get_job(
             detail="Job not found"
         )
 
-    app_count = db.query(func.count(Application.id)).filter(
-        Application.job_id == job.id
-    ).scalar()
-
-    return JobResponse(
-        id=job.id,
-        title=job.title,
-        description=job.description,
-        requirements=job.requirements,
-        skills=job.skills or [],
-        min_experience=job.min_experience,
-        public_link=job.public_link,
-        status=job.status,
-        created_at=job.created_at,
-        applications_count=app_count
-    )
+    counts = application_counts(db, Application.job_id == job.id)
+    return job_response(job, counts.get(job.id))
 
 
 @router.patch("/{job_id}", response_model=JobResponse)
@@ -147,22 +112,8 @@ def update_job(
     db.commit()
     db.refresh(job)
 
-    app_count = db.query(func.count(Application.id)).filter(
-        Application.job_id == job.id
-    ).scalar()
-
-    return JobResponse(
-        id=job.id,
-        title=job.title,
-        description=job.description,
-        requirements=job.requirements,
-        skills=job.skills or [],
-        min_experience=job.min_experience,
-        public_link=job.public_link,
-        status=job.status,
-        created_at=job.created_at,
-        applications_count=app_count
-    )
+    counts = application_counts(db, Application.job_id == job.id)
+    return job_response(job, counts.get(job.id))
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -185,3 +136,73 @@ def delete_job(
 
     db.delete(job)
     db.commit()
+
+
+@router.post("/{job_id}/rescore", response_model=RescoreResponse)
+def rescore_applications(
+    job_id: UUID,
+    background_tasks: BackgroundTasks,
+    use_ai: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Re-score all applications of a job against its current requirements
+
+    The rule-based scorer runs inline and returns the finished run. With
+    use_ai=true the run continues in the background; poll GET /rescore.
+    """
+    job = db.query(Job).filter(
+        Job.id == job_id,
+        Job.user_id == current_user.id
+    ).first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    progress = start_rescore(job.id, use_ai)
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Re-scoring is already running for this job"
+        )
+
+    if use_ai:
+        background_tasks.add_task(run_rescore_in_background, job.id, progress)
+        return RescoreResponse(**progress.to_dict())
+
+    try:
+        rescore_job(db, job, progress=progress)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Re-scoring failed: {progress.error}"
+        )
+
+    return RescoreResponse(**progress.to_dict())
+
+
+@router.get("/{job_id}/rescore", response_model=RescoreResponse)
+def get_rescore_status(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get progress of the latest re-scoring run for a job"""
+    job = db.query(Job).filter(
+        Job.id == job_id,
+        Job.user_id == current_user.id
+    ).first()
+
+    progress = get_rescore_progress(job_id) if job else None
+
+    if not progress:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No re-scoring run found for this job"
+        )
+
+    return RescoreResponse(**progress.to_dict())
@@ -0,0 +1,139 @@
+"""
+Management commands
+
+Usage (from the backend directory):
+    python -m app.cli upgrade-schema
+    python -m app.cli warm-parse-cache [--dir ./uploads/resumes]
+    python -m app.cli rescore JOB_ID [--ai] [--chunk-size 500]
+    python -m app.cli index-search [--chunk-size 500]
+    python -m app.cli migrate-resumes [--chunk-size 500] [--vacuum]
+"""
+import argparse
+import json
+from uuid import UUID
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def upgrade_schema(args: argparse.Namespace) -> None:
+    """Add tables, columns and indexes missing from an older database"""
+    from app.db.database import engine
+    from app.db.schema import upgrade_schema as upgrade
+
+    print(json.dumps({"applied": upgrade(engine)}, indent=2))
+
+
+def warm_parse_cache(args: argparse.Namespace) -> None:
+    """Parse stored resumes into the parse cache"""
+    from app.ml.parse_cache import parse_cache
+    from app.services.extraction import extraction_pool
+
+    try:
+        result = parse_cache.warm(args.dir, extract=extraction_pool.extract_and_parse)
+    finally:
+        extraction_pool.shutdown()
+    print(json.dumps({**result, **parse_cache.stats()}, indent=2))
+
+
+def rescore(args: argparse.Namespace) -> None:
+    """Re-score all applications of a job from stored resume data"""
+    from app.db.database import SessionLocal
+    from app.models.job import Job
+    from app.services.rescoring import rescore_job
+
+    def report(progress):
+        print(f"{progress.processed}/{progress.total} processed, "
+              f"{progress.updated} updated, {progress.elapsed_seconds}s")
+
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.id == args.job_id).first()
+        if not job:
+            raise SystemExit(f"Job not found: {args.job_id}")
+
+        progress = rescore_job(
+            db,
+            job,
+            use_ai=args.ai,
+            chunk_size=args.chunk_size,
+            on_progress=report
+        )
+        print(json.dumps(progress.to_dict(), indent=2, default=str))
+    finally:
+        db.close()
+
+
+def index_search(args: argparse.Namespace) -> None:
+    """Fill candidate search columns for existing resumes and applications"""
+    from app.db.database import SessionLocal, engine
+    from app.db.schema import upgrade_schema as upgrade
+    from app.services.search import reindex_search
+
+    upgrade(engine)
+    db = SessionLocal()
+    try:
+        updated = reindex_search(
+            db,
+            chunk_size=args.chunk_size,
+            on_progress=lambda count, elapsed: print(f"{count} indexed, {elapsed}s")
+        )
+        print(json.dumps({"updated": updated}, indent=2))
+    finally:
+        db.close()
+
+
+def migrate_resumes(args: argparse.Namespace) -> None:
+    """Move parsed resumes stored on applications into the resumes table"""
+    from app.db.database import SessionLocal, engine
+    from app.db.schema import upgrade_schema as upgrade
+    from app.services.resumes import migrate_resumes as migrate, table_bytes, vacuum_applications
+
+    upgrade(engine)
+    db = SessionLocal()
+    try:
+        result = migrate(
+            db,
+            chunk_size=args.chunk_size,
+            on_progress=lambda count, elapsed: print(f"{count} migrated, {elapsed}s")
+        )
+        if args.vacuum:
+            vacuum_applications()
+            result["applications_bytes_after"] = table_bytes(db, "applications")
+        print(json.dumps(result, indent=2))
+    finally:
+        db.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="HR AI management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upgrade_parser = subparsers.add_parser("upgrade-schema", help=upgrade_schema.__doc__)
+    upgrade_parser.set_defaults(func=upgrade_schema)
+
+    warm = subparsers.add_parser("warm-parse-cache", help=warm_parse_cache.__doc__)
+    warm.add_argument("--dir", default=settings.upload_dir, help="Directory of resume files")
+    warm.set_defaults(func=warm_parse_cache)
+
+    rescore_parser = subparsers.add_parser("rescore", help=rescore.__doc__)
+    rescore_parser.add_argument("job_id", type=UUID, help="Job to re-score")
+    rescore_parser.add_argument("--ai", action="store_true", help="Use the AI analyzer when configured")
+    rescore_parser.add_argument("--chunk-size", type=int, default=None)
+    rescore_parser.set_defaults(func=rescore)
+
+    index_parser = subparsers.add_parser("index-search", help=index_search.__doc__)
+    index_parser.add_argument("--chunk-size", type=int, default=None)
+    index_parser.set_defaults(func=index_search)
+
+    migrate_parser = subparsers.add_parser("migrate-resumes", help=migrate_resumes.__doc__)
+    migrate_parser.add_argument("--chunk-size", type=int, default=None)
+    migrate_parser.add_argument("--vacuum", action="store_true", help="Rewrite the applications table afterwards")
+    migrate_parser.set_defaults(func=migrate_resumes)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,81 @@
 from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.utils.metrics import db_pool_checkout
 from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
-)
+POOL_OPTIONS = {
+    "pool_pre_ping": True,
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout,
+    "pool_recycle": settings.db_pool_recycle
+}
+
+# Async drivers for the sync database URLs in settings
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite"
+}
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+    engine_label = "sync"
+
+    def connect(self):
+        with db_pool_checkout.time(engine=self.engine_label):
+            return super().connect()
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waited"""
+    engine_label = "async"
+
+    def connect(self):
+        with db_pool_checkout.time(engine=self.engine_label):
+            return super().connect()
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    """Store JSONB columns as JSON on SQLite, used as a local stand-in for Postgres"""
+    return "JSON"
+
+
+engine = create_engine(settings.database_url, poolclass=TimedQueuePool, **POOL_OPTIONS)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+def async_database_url(database_url: str) -> str:
+    """Rewrite a database URL to use the async driver for its backend"""
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+# The sync engine stays in use for create_all, the scoring worker and CLI
+# commands; the async engine only serves API routes when enabled
+async_engine = None
+AsyncSessionLocal = None
+if settings.database_async:
+    async_engine = create_async_engine(
+        async_database_url(settings.database_url),
+        poolclass=TimedAsyncQueuePool,
+        **POOL_OPTIONS
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
 def get_db():
     """Dependency for getting database session"""
     db = SessionLocal()
@@ -23,3 +83,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,63 @@
+"""
+Idempotent schema upgrade for databases created by an older version
+
+Base.metadata.create_all creates missing tables (resumes, scoring_tasks)
+but never alters existing ones, so columns and indexes added to the models
+since a database was created would be missing. upgrade_schema adds them
+with ALTER TABLE ... ADD COLUMN and CREATE INDEX IF NOT EXISTS, and is safe
+to run on every start. Run it before data backfills such as
+migrate-resumes and index-search, which write the new columns.
+"""
+from typing import List
+from sqlalchemy import Column, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex
+from app.db.database import Base
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+
+def _add_column_statement(conn: Connection, column: Column) -> str:
+    """ALTER TABLE adding `column`; existing rows get its scalar default"""
+    dialect = conn.dialect
+    quote = dialect.identifier_preparer.quote
+    if_not_exists = "IF NOT EXISTS " if dialect.name == "postgresql" else ""
+    statement = (
+        f"ALTER TABLE {quote(column.table.name)} ADD COLUMN {if_not_exists}"
+        f"{quote(column.name)} {column.type.compile(dialect=dialect)}"
+    )
+
+    default = column.default.arg if column.default is not None and column.default.is_scalar else None
+    if default is not None:
+        statement += f" DEFAULT {column.type.literal_processor(dialect)(default)}"
+    if not column.nullable:
+        if default is None:
+            raise RuntimeError(f"Cannot add NOT NULL column {column.table.name}.{column.name} without a default")
+        statement += " NOT NULL"
+    return statement
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """
+    Create missing tables, then add missing columns and indexes of the models
+
+    Returns:
+        list: The ALTER TABLE statements that were run (empty when the
+        schema was already current)
+    """
+    Base.metadata.create_all(bind=engine)
+
+    applied = []
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    statement = _add_column_statement(conn, column)
+                    conn.execute(text(statement))
+                    applied.append(statement)
+
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+
+    return applied
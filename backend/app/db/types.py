@@ -0,0 +1,57 @@
+"""
+Column types for candidate search that fall back to plain types off Postgres
+"""
+from sqlalchemy import JSON, Text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+# Text search configuration for resume documents and queries
+TEXT_SEARCH_CONFIG = "english"
+
+
+class to_search_vector(FunctionElement):
+    """to_tsvector() on Postgres; the text itself elsewhere"""
+    type = Text()
+    inherit_cache = True
+
+
+@compiles(to_search_vector)
+def _compile_to_search_vector(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(to_search_vector, "postgresql")
+def _compile_to_search_vector_postgresql(element, compiler, **kw):
+    return f"to_tsvector('{TEXT_SEARCH_CONFIG}', {compiler.process(element.clauses, **kw)})"
+
+
+class SearchVector(TypeDecorator):
+    """
+    tsvector on Postgres, text elsewhere
+
+    Bound as plain text and converted by the database, so ORM writes and
+    executemany inserts store a document string.
+    """
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(TSVECTOR())
+        return dialect.type_descriptor(Text())
+
+    def bind_expression(self, bindvalue):
+        return to_search_vector(bindvalue)
+
+
+class SkillArray(TypeDecorator):
+    """text[] on Postgres (GIN-indexable), a JSON list elsewhere"""
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(Text))
+        return dialect.type_descriptor(JSON())
@@ -1,13 +1,48 @@
-from fastapi import FastAPI
+import logging
+import time
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import auth, jobs, applications
-from app.db.database import engine, Base
+from fastapi.responses import PlainTextResponse
+from app.api.deps import require_metrics_token
+from app.db.database import engine, async_engine
+from app.db.schema import upgrade_schema
+from app.services.embedding_index import embedding_index
+from app.services.extraction import extraction_pool
+from app.services.scoring_worker import scoring_worker
+from app.utils.auth_cache import auth_cache
+from app.utils.metrics import http_request_duration, metrics
+from app.utils.security import password_hasher
+from app.utils.uploads import MULTIPART_OVERHEAD, BodySizeLimitMiddleware
 from app.config import get_settings
 
 settings = get_settings()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# The app's own loggers (scoring worker, metrics) at INFO, libraries at WARNING;
+# uvicorn keeps its own handlers
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logging.getLogger("app").setLevel(logging.INFO)
+
+if settings.database_async:
+    from app.api.async_routes import auth, jobs, applications
+else:
+    from app.api import auth, jobs, applications
+
+# Create database tables, and add columns and indexes missing from older databases
+upgrade_schema(engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the background scoring worker alongside the API"""
+    if settings.scoring_worker_enabled:
+        scoring_worker.start()
+    yield
+    scoring_worker.stop()
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
 
 app = FastAPI(
     title="HR AI API",
@@ -15,7 +50,16 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    lifespan=lifespan
+)
+
+# Request body limits, enforced before Starlette buffers multipart uploads;
+# added before CORS so rejections still carry CORS headers
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=settings.max_file_size + MULTIPART_OVERHEAD,
+    path_limits=[(r"^/api/jobs/[^/]+/applications/import$", settings.bulk_import_max_bytes)]
 )
 
 # CORS middleware
@@ -27,6 +71,73 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_duration(request: Request, call_next):
+    """Time each request, labelled by route template to keep label values bounded"""
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        http_request_duration.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=_route_template(request),
+            status=status_code
+        )
+
+
+def _route_template(request: Request) -> str:
+    """Request path with path parameter values put back as {name}, e.g. /api/jobs/{job_id}"""
+    if request.scope.get("route") is None:
+        return "unmatched"
+    names = {str(value): f"{{{name}}}" for name, value in request.path_params.items()}
+    return "/".join(names.get(segment, segment) for segment in request.url.path.split("/"))
+
+
+def _pool_connections():
+    engines = {"sync": engine.pool}
+    if async_engine is not None:
+        engines["async"] = async_engine.pool
+    values = {}
+    for name, pool in engines.items():
+        values[(name, "checked_out")] = pool.checkedout()
+        values[(name, "idle")] = pool.checkedin()
+    return values
+
+
+def _numeric(stats: dict) -> dict:
+    return {key: value for key, value in stats.items() if isinstance(value, (int, float))}
+
+
+metrics.gauge(
+    "hrai_db_pool_connections",
+    "Database pool connections by state",
+    _pool_connections,
+    ["engine", "state"]
+)
+metrics.gauge(
+    "hrai_auth_cache",
+    "Authenticated user cache counters and sizes",
+    lambda: _numeric(auth_cache.stats()),
+    ["stat"]
+)
+metrics.gauge(
+    "hrai_extraction_pool",
+    "Resume extraction pool counters",
+    lambda: _numeric(extraction_pool.stats()),
+    ["stat"]
+)
+metrics.gauge(
+    "hrai_embedding_index",
+    "Embedding index cache counters and sizes",
+    lambda: _numeric(embedding_index.stats()),
+    ["stat"]
+)
+
 # Include routers
 app.include_router(auth.router, prefix="/api")
 app.include_router(jobs.router, prefix="/api")
@@ -47,3 +158,9 @@ def root():
         "docs": "/api/docs",
         "health": "/api/health"
     }
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_token)])
+def get_metrics():
+    """Process metrics in the Prometheus text format, for scrapers holding METRICS_TOKEN"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,21 +1,107 @@
 """
 AI-powered resume analysis using OpenAI GPT
 """
+import asyncio
 import json
-from typing import Dict, List, Optional
-from openai import OpenAI
+import time
+from typing import Dict, List, Optional, Sequence
+import openai
+from openai import AsyncOpenAI, OpenAI
+from app.ml.analysis_cache import analysis_cache, request_hash
+from app.ml.condenser import resume_condenser
+from app.ml.resume_parser import resume_parser
+from app.ml.scorer import scorer
+from app.utils.metrics import llm_batch_entries, llm_errors, llm_tokens, stage_timer
+from app.utils.resilience import CircuitBreaker, ConcurrencyLimiter, backoff_delay
 from app.config import get_settings
 
 settings = get_settings()
 
+MODEL = "gpt-4o-mini"
+TEMPERATURE = 0.3
+MAX_TOKENS = 1000
+
+SYSTEM_PROMPT = """You are an expert HR recruiter AI assistant. Analyze resumes against job requirements and provide objective scoring.
+
+Always respond with valid JSON in this exact format:
+{
+    "final_score": <number 0-100>,
+    "skills_score": <number 0-100>,
+    "experience_score": <number 0-100>,
+    "matched_skills": ["skill1", "skill2"],
+    "missing_skills": ["skill1", "skill2"],
+    "years_of_experience": <number or null>,
+    "explanation": "Brief 2-3 sentence explanation of the score",
+    "strengths": ["strength1", "strength2"],
+    "concerns": ["concern1", "concern2"]
+}"""
+
+# Completion budget per resume in a batched request
+BATCH_TOKENS_PER_RESUME = 400
+
+BATCH_SYSTEM_PROMPT = """You are an expert HR recruiter AI assistant. Analyze resumes against job requirements and provide objective scoring.
+
+You will be given several candidates. Score each one independently.
+
+Always respond with a valid JSON array containing one object per candidate, in the order given, each in this exact format:
+{
+    "candidate": <candidate number>,
+    "final_score": <number 0-100>,
+    "skills_score": <number 0-100>,
+    "experience_score": <number 0-100>,
+    "matched_skills": ["skill1", "skill2"],
+    "missing_skills": ["skill1", "skill2"],
+    "years_of_experience": <number or null>,
+    "explanation": "Brief 2-3 sentence explanation of the score",
+    "strengths": ["strength1", "strength2"],
+    "concerns": ["concern1", "concern2"]
+}"""
+
+ANALYSIS_INSTRUCTIONS = """1. Extract the candidate's skills from the resume (look for explicit mentions and implied skills)
+2. Determine years of experience (look for dates, explicit mentions, or estimate from career progression)
+3. Compare skills against required skills (consider synonyms like React/React.js, PostgreSQL/Postgres)
+4. Score skills match (0-100): percentage of required skills the candidate has
+5. Score experience match (0-100): based on meeting/exceeding minimum years requirement
+6. Calculate final score: weighted average (40% skills, 60% experience)
+7. Identify strengths and potential concerns"""
+
+
+class ProviderUnavailable(Exception):
+    """Raised when the circuit breaker rejects a call to the provider"""
+
+
+def is_retryable(error: Exception) -> bool:
+    """Rate limits, timeouts, connection errors and 5xx responses are worth retrying"""
+    if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
 
 class AIAnalyzer:
     """Analyze resumes and score candidates using OpenAI GPT"""
 
     def __init__(self):
         self.client = None
+        self.async_client = None
         if settings.openai_api_key:
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            # Retries are handled here so backoff and the circuit breaker see every failure
+            client_options = {
+                "api_key": settings.openai_api_key,
+                "base_url": settings.openai_base_url,
+                "timeout": settings.openai_timeout_seconds,
+                "max_retries": 0
+            }
+            self.client = OpenAI(**client_options)
+            self.async_client = AsyncOpenAI(**client_options)
+
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.openai_circuit_failure_threshold,
+            reset_seconds=settings.openai_circuit_reset_seconds
+        )
+        # One cap on in-flight requests for worker threads and coroutines alike
+        self._slots = ConcurrencyLimiter(settings.openai_max_concurrency)
 
     def is_available(self) -> bool:
         """Check if AI analysis is available"""
@@ -38,112 +124,368 @@ class AIAnalyzer:
         try:
             prompt = self._build_analysis_prompt(resume_text, job_data)
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are an expert HR recruiter AI assistant. Analyze resumes against job requirements and provide objective scoring.
+            cache_key = self._cache_key(prompt)
+            cached = self._cached_analysis(cache_key)
+            if cached is not None:
+                return cached
 
-Always respond with valid JSON in this exact format:
-{
-    "final_score": <number 0-100>,
-    "skills_score": <number 0-100>,
-    "experience_score": <number 0-100>,
-    "matched_skills": ["skill1", "skill2"],
-    "missing_skills": ["skill1", "skill2"],
-    "years_of_experience": <number or null>,
-    "explanation": "Brief 2-3 sentence explanation of the score",
-    "strengths": ["strength1", "strength2"],
-    "concerns": ["concern1", "concern2"]
-}"""
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=1000
-            )
+            result_text = self._complete_with_retry(prompt)
+            return self._store_analysis(cache_key, self._parse_response(result_text))
 
-            result_text = response.choices[0].message.content.strip()
+        except Exception as e:
+            print(f"AI analysis error: {e}")
+            llm_errors.inc(error=type(e).__name__)
+            return self._fallback_analysis(resume_text, job_data)
 
-            # Parse JSON from response
-            if result_text.startswith("```"):
-                result_text = result_text.split("```")[1]
-                if result_text.startswith("json"):
-                    result_text = result_text[4:]
+    async def analyze_resume_async(self, resume_text: str, job_data: Dict) -> Dict:
+        """
+        Async version of analyze_resume using AsyncOpenAI
 
-            result = json.loads(result_text)
+        Requests count against the same `openai_max_concurrency` cap and
+        circuit breaker as the sync path, with the same retries and backoff.
+        """
+        if not self.is_available():
+            return self._fallback_analysis(resume_text, job_data)
 
-            return {
-                "final_score": min(100, max(0, result.get("final_score", 50))),
-                "score_breakdown": {
-                    "skills": result.get("skills_score", 50),
-                    "experience": result.get("experience_score", 50)
-                },
-                "matched_skills": result.get("matched_skills", []),
-                "missing_skills": result.get("missing_skills", []),
-                "years_of_experience": result.get("years_of_experience"),
-                "explanation": result.get("explanation", "AI analysis completed."),
-                "strengths": result.get("strengths", []),
-                "concerns": result.get("concerns", []),
-                "ai_powered": True
-            }
+        try:
+            prompt = self._build_analysis_prompt(resume_text, job_data)
+
+            cache_key = self._cache_key(prompt)
+            cached = self._cached_analysis(cache_key)
+            if cached is not None:
+                return cached
+
+            result_text = await self._complete_with_retry_async(prompt)
+            return self._store_analysis(cache_key, self._parse_response(result_text))
 
         except Exception as e:
             print(f"AI analysis error: {e}")
+            llm_errors.inc(error=type(e).__name__)
             return self._fallback_analysis(resume_text, job_data)
 
-    def _build_analysis_prompt(self, resume_text: str, job_data: Dict) -> str:
-        """Build the analysis prompt for GPT"""
-        job_title = job_data.get("title", "Unknown Position")
-        job_description = job_data.get("description", "")
-        job_requirements = job_data.get("requirements", "")
-        required_skills = job_data.get("skills", [])
-        min_experience = job_data.get("min_experience", 0)
+    def analyze_batch(self, resume_texts: Sequence[str], job_data: Dict) -> List[Dict]:
+        """
+        Analyze several resumes against one job, several per request
 
-        # Truncate resume if too long
-        max_resume_length = 4000
-        if len(resume_text) > max_resume_length:
-            resume_text = resume_text[:max_resume_length] + "... [truncated]"
+        Uncached resumes are packed `ai_batch_size` at a time into one
+        request, so the system prompt and job details are sent once per
+        batch instead of once per resume. Each resume is condensed to
+        `ai_batch_resume_tokens`. Entries of the JSON array reply are
+        validated one by one; a resume whose entry is missing or malformed
+        (or whose whole batch failed) gets an individual analyze_resume call.
+        Batch entries are cached under their own key (see _batch_cache_key),
+        so analyze_resume never serves them; a cached single-resume analysis
+        is reused here.
 
-        return f"""Analyze this resume against the job requirements:
+        Returns:
+            list: One analyze_resume-style result per resume, in order
+        """
+        if not self.is_available():
+            return [self._fallback_analysis(text, job_data) for text in resume_texts]
+
+        results: List[Optional[Dict]] = [None] * len(resume_texts)
+        cache_keys = [self._batch_cache_key(text, job_data) for text in resume_texts]
+
+        pending = []
+        for i, cache_key in enumerate(cache_keys):
+            results[i] = self._cached_analysis(self._cache_key(self._build_analysis_prompt(resume_texts[i], job_data)))
+            if results[i] is None:
+                results[i] = self._cached_analysis(cache_key)
+            if results[i] is None:
+                pending.append(i)
+
+        batch_size = max(1, settings.ai_batch_size)
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            analyses = self._analyze_chunk([resume_texts[i] for i in chunk], job_data) if len(chunk) > 1 else [None]
+            for i, analysis in zip(chunk, analyses):
+                if analysis is None:
+                    if len(chunk) > 1:
+                        llm_batch_entries.inc(result="fallback")
+                    results[i] = self.analyze_resume(resume_texts[i], job_data)
+                else:
+                    llm_batch_entries.inc(result="ok")
+                    results[i] = self._store_analysis(cache_keys[i], analysis)
+
+        return results
+
+    def _analyze_chunk(self, resume_texts: Sequence[str], job_data: Dict) -> List[Optional[Dict]]:
+        """One batched request; None for every resume without a valid entry"""
+        try:
+            result_text = self._complete_with_retry(
+                self._build_batch_prompt(resume_texts, job_data),
+                system_prompt=BATCH_SYSTEM_PROMPT,
+                max_tokens=BATCH_TOKENS_PER_RESUME * len(resume_texts)
+            )
+            return self._parse_batch_response(result_text, len(resume_texts))
+        except Exception as e:
+            print(f"AI batch analysis error: {e}")
+            llm_errors.inc(error=type(e).__name__)
+            return [None] * len(resume_texts)
+
+    def _messages(self, prompt: str, system_prompt: str = SYSTEM_PROMPT) -> List[Dict]:
+        return [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    def _complete_with_retry(
+        self,
+        prompt: str,
+        system_prompt: str = SYSTEM_PROMPT,
+        max_tokens: int = MAX_TOKENS
+    ) -> str:
+        """Run a chat completion with backoff, concurrency limit and circuit breaker"""
+        attempt = 0
+        while True:
+            attempt += 1
+            if not self.circuit_breaker.allow():
+                raise ProviderUnavailable("OpenAI circuit breaker is open")
+
+            try:
+                with self._slots, stage_timer("llm_request"):
+                    response = self.client.chat.completions.create(
+                        model=MODEL,
+                        messages=self._messages(prompt, system_prompt),
+                        temperature=TEMPERATURE,
+                        max_tokens=max_tokens
+                    )
+            except Exception as e:
+                time.sleep(self._failure_delay(e, attempt))
+                continue
+
+            self.circuit_breaker.record_success()
+            self._record_usage(response)
+            return response.choices[0].message.content.strip()
+
+    async def _complete_with_retry_async(self, prompt: str) -> str:
+        """Async version of _complete_with_retry"""
+        attempt = 0
+        while True:
+            attempt += 1
+            if not self.circuit_breaker.allow():
+                raise ProviderUnavailable("OpenAI circuit breaker is open")
+
+            try:
+                async with self._slots:
+                    with stage_timer("llm_request"):
+                        response = await self.async_client.chat.completions.create(
+                            model=MODEL,
+                            messages=self._messages(prompt),
+                            temperature=TEMPERATURE,
+                            max_tokens=MAX_TOKENS
+                        )
+            except Exception as e:
+                await asyncio.sleep(self._failure_delay(e, attempt))
+                continue
+
+            self.circuit_breaker.record_success()
+            self._record_usage(response)
+            return response.choices[0].message.content.strip()
+
+    def _failure_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Record a failed attempt with the circuit breaker and return the delay
+        before the next one; re-raise `error` when it is not worth retrying
+        """
+        if not is_retryable(error):
+            # The provider answered; the request itself was bad
+            self.circuit_breaker.record_success()
+            raise error
+        self.circuit_breaker.record_failure()
+        if attempt > settings.openai_max_retries:
+            raise error
+        return self._retry_delay(error, attempt)
+
+    def _record_usage(self, response) -> None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        llm_tokens.inc(usage.prompt_tokens or 0, type="prompt")
+        llm_tokens.inc(usage.completion_tokens or 0, type="completion")
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Jittered exponential backoff, stretched to honour Retry-After"""
+        delay = backoff_delay(
+            attempt,
+            settings.openai_backoff_base_seconds,
+            settings.openai_backoff_max_seconds
+        )
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            if retry_after:
+                delay = max(delay, min(float(retry_after), settings.openai_backoff_max_seconds))
+        except ValueError:
+            pass
+        return delay
+
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        if not settings.ai_cache_enabled:
+            return None
+        return request_hash(MODEL, SYSTEM_PROMPT, prompt, TEMPERATURE, MAX_TOKENS)
+
+    def _batch_cache_key(self, resume_text: str, job_data: Dict) -> Optional[str]:
+        """
+        Key for one resume's entry in a batched request: the batch system
+        prompt and the resume condensed to the batch budget, as a batch of one
+        """
+        if not settings.ai_cache_enabled:
+            return None
+        prompt = self._build_batch_prompt([resume_text], job_data)
+        return request_hash(MODEL, BATCH_SYSTEM_PROMPT, prompt, TEMPERATURE, BATCH_TOKENS_PER_RESUME)
+
+    def _cached_analysis(self, cache_key: Optional[str]) -> Optional[Dict]:
+        if cache_key is None:
+            return None
+        cached = analysis_cache.get(cache_key)
+        if cached is None:
+            return None
+        return {**cached, "cached": True}
+
+    def _store_analysis(self, cache_key: Optional[str], analysis: Dict) -> Dict:
+        if cache_key:
+            analysis_cache.put(cache_key, analysis)
+        return {**analysis, "cached": False}
+
+    def _load_json(self, result_text: str):
+        """JSON from a reply, without a ```json fence if the model added one"""
+        if result_text.startswith("```"):
+            result_text = result_text.split("```")[1]
+            if result_text.startswith("json"):
+                result_text = result_text[4:]
+        return json.loads(result_text)
+
+    def _parse_response(self, result_text: str) -> Dict:
+        """Parse the JSON analysis returned by the model"""
+        return self._analysis_from(self._load_json(result_text))
 
-## JOB DETAILS
-**Title:** {job_title}
-**Description:** {job_description}
-**Requirements:** {job_requirements}
+    def _parse_batch_response(self, result_text: str, count: int) -> List[Optional[Dict]]:
+        """
+        Split a batched reply into per-resume analyses
+
+        Entries are matched by their "candidate" number (1-based); entries
+        that are missing, duplicated or fail validation come back as None.
+        """
+        analyses: List[Optional[Dict]] = [None] * count
+        try:
+            entries = self._load_json(result_text)
+        except ValueError:
+            return analyses
+        if isinstance(entries, dict):
+            entries = entries.get("candidates")
+        if not isinstance(entries, list):
+            return analyses
+
+        for entry in entries:
+            if not self._is_valid_entry(entry):
+                continue
+            index = entry.get("candidate")
+            if isinstance(index, int) and not isinstance(index, bool) and 1 <= index <= count \
+                    and analyses[index - 1] is None:
+                analyses[index - 1] = self._analysis_from(entry)
+        return analyses
+
+    def _is_valid_entry(self, entry) -> bool:
+        """Check a batch entry has a numeric score and list-valued skill fields"""
+        if not isinstance(entry, dict):
+            return False
+        for key in ("final_score", "skills_score", "experience_score"):
+            value = entry.get(key, 0)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+        if "final_score" not in entry:
+            return False
+        for key in ("matched_skills", "missing_skills", "strengths", "concerns"):
+            if not isinstance(entry.get(key, []), list):
+                return False
+        return True
+
+    def _analysis_from(self, result: Dict) -> Dict:
+        return {
+            "final_score": min(100, max(0, result.get("final_score", 50))),
+            "score_breakdown": {
+                "skills": result.get("skills_score", 50),
+                "experience": result.get("experience_score", 50)
+            },
+            "matched_skills": result.get("matched_skills", []),
+            "missing_skills": result.get("missing_skills", []),
+            "years_of_experience": result.get("years_of_experience"),
+            "explanation": result.get("explanation", "AI analysis completed."),
+            "strengths": result.get("strengths", []),
+            "concerns": result.get("concerns", []),
+            "ai_powered": True
+        }
+
+    def _job_details(self, job_data: Dict) -> str:
+        required_skills = job_data.get("skills", [])
+        return f"""## JOB DETAILS
+**Title:** {job_data.get("title", "Unknown Position")}
+**Description:** {job_data.get("description", "")}
+**Requirements:** {job_data.get("requirements", "")}
 **Required Skills:** {', '.join(required_skills) if required_skills else 'Not specified'}
-**Minimum Experience:** {min_experience} years
+**Minimum Experience:** {job_data.get("min_experience", 0)} years"""
+
+    def _build_analysis_prompt(self, resume_text: str, job_data: Dict) -> str:
+        """Build the analysis prompt for GPT"""
+        return f"""Analyze this resume against the job requirements:
+
+{self._job_details(job_data)}
 
 ## CANDIDATE RESUME
-{resume_text}
+{resume_condenser.condense(resume_text).text}
 
 ## ANALYSIS INSTRUCTIONS
-1. Extract the candidate's skills from the resume (look for explicit mentions and implied skills)
-2. Determine years of experience (look for dates, explicit mentions, or estimate from career progression)
-3. Compare skills against required skills (consider synonyms like React/React.js, PostgreSQL/Postgres)
-4. Score skills match (0-100): percentage of required skills the candidate has
-5. Score experience match (0-100): based on meeting/exceeding minimum years requirement
-6. Calculate final score: weighted average (40% skills, 60% experience)
-7. Identify strengths and potential concerns
+{ANALYSIS_INSTRUCTIONS}
 
 Provide your analysis as JSON."""
 
+    def _build_batch_prompt(self, resume_texts: Sequence[str], job_data: Dict) -> str:
+        """Build one prompt analyzing several resumes against the same job"""
+        candidates = "\n\n".join(
+            f"## CANDIDATE {number}\n{resume_condenser.condense(text, settings.ai_batch_resume_tokens).text}"
+            for number, text in enumerate(resume_texts, 1)
+        )
+        return f"""Analyze each of these {len(resume_texts)} resumes against the job requirements:
+
+{self._job_details(job_data)}
+
+{candidates}
+
+## ANALYSIS INSTRUCTIONS
+For each candidate separately:
+{ANALYSIS_INSTRUCTIONS}
+
+Provide your analysis as a JSON array with one object per candidate, in order, each with its "candidate" number."""
+
     def _fallback_analysis(self, resume_text: str, job_data: Dict) -> Dict:
         """Fallback to rule-based analysis if AI is not available"""
+        if not resume_text:
+            return {
+                "final_score": 50,
+                "score_breakdown": {
+                    "skills": 50,
+                    "experience": 50
+                },
+                "matched_skills": [],
+                "missing_skills": job_data.get("skills", []),
+                "years_of_experience": None,
+                "explanation": "AI analysis not available. Using default score.",
+                "strengths": [],
+                "concerns": ["AI analysis unavailable"],
+                "ai_powered": False
+            }
+
+        resume_data = resume_parser.parse_text(resume_text)
         return {
-            "final_score": 50,
-            "score_breakdown": {
-                "skills": 50,
-                "experience": 50
-            },
-            "matched_skills": [],
-            "missing_skills": job_data.get("skills", []),
-            "years_of_experience": None,
-            "explanation": "AI analysis not available. Using default score.",
+            **scorer.score(resume_data, job_data),
+            "years_of_experience": resume_data.get("years_of_experience"),
             "strengths": [],
             "concerns": ["AI analysis unavailable"],
             "ai_powered": False
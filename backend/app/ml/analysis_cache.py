@@ -0,0 +1,205 @@
+"""
+Persistent cache of LLM resume analysis results
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+# Hits update last_used in batches, once this many are pending or this old
+TOUCH_FLUSH_ENTRIES = 100
+TOUCH_FLUSH_SECONDS = 10.0
+# Eviction trims down to this share of max_entries, so it runs rarely
+EVICT_TO_RATIO = 0.9
+# Expired entries not read again are swept by a put at most this often
+EXPIRE_SWEEP_SECONDS = 600.0
+
+
+def request_hash(model: str, system_prompt: str, prompt: str, temperature: float, max_tokens: int) -> str:
+    """Deterministic key for a chat completion request"""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system": system_prompt,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        },
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """
+    SQLite-backed cache of analysis results keyed by request hash
+
+    Entries expire after `ttl_seconds`; when `max_entries` is set the least
+    recently used entries are evicted beyond it. As in ParseCache, the entry
+    count is tracked in memory so a put only scans the table when it has to
+    evict, and hits write their recency back in batches.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: Optional[int] = None):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._entries = 0
+        self._touched: Dict[str, float] = {}
+        self._touched_at = time.monotonic()
+        self._swept_at = time.monotonic()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    request_hash TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_analysis_cache_last_used ON analysis_cache (last_used)")
+            self._delete_expired(conn)
+            conn.commit()
+            self._entries = self._stored_entries(conn)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a cached result, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT result, created_at FROM analysis_cache WHERE request_hash = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    conn.execute("DELETE FROM analysis_cache WHERE request_hash = ?", (key,))
+                    conn.commit()
+                    self._entries -= 1
+                    self._touched.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_FLUSH_ENTRIES or \
+                    time.monotonic() - self._touched_at >= TOUCH_FLUSH_SECONDS:
+                self._flush_touched(conn)
+                conn.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, result: Dict) -> None:
+        """Store a result, evicting least recently used entries over the limit"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            replaced = conn.execute(
+                "SELECT 1 FROM analysis_cache WHERE request_hash = ?",
+                (key,)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result), now, now)
+            )
+            self._touched.pop(key, None)
+            if replaced is None:
+                self._entries += 1
+
+            if self.max_entries and self._entries > self.max_entries:
+                self._evict(conn)
+            elif time.monotonic() - self._swept_at >= EXPIRE_SWEEP_SECONDS:
+                self._entries -= self._delete_expired(conn)
+            conn.commit()
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """Write the recency of pending hits"""
+        if self._touched:
+            conn.executemany(
+                "UPDATE analysis_cache SET last_used = ? WHERE request_hash = ?",
+                [(last_used, key) for key, last_used in self._touched.items()]
+            )
+            self._touched = {}
+        self._touched_at = time.monotonic()
+
+    def _delete_expired(self, conn: sqlite3.Connection) -> int:
+        """Delete expired entries and return how many there were"""
+        self._swept_at = time.monotonic()
+        return conn.execute(
+            "DELETE FROM analysis_cache WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,)
+        ).rowcount
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete expired entries, then least recently used ones down to EVICT_TO_RATIO of max_entries"""
+        self._flush_touched(conn)
+        self._delete_expired(conn)
+        # Other processes may share the file, so start from the stored count
+        self._entries = self._stored_entries(conn)
+        excess = self._entries - int(self.max_entries * EVICT_TO_RATIO)
+        if excess > 0:
+            conn.execute("""
+                DELETE FROM analysis_cache WHERE request_hash IN (
+                    SELECT request_hash FROM analysis_cache
+                    ORDER BY last_used, rowid
+                    LIMIT ?
+                )
+            """, (excess,))
+            self._entries -= excess
+
+    def _stored_entries(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current entry count"""
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM analysis_cache")
+            conn.commit()
+            self._entries = 0
+            self._touched = {}
+
+
+# Singleton instance
+analysis_cache = AnalysisCache(
+    settings.ai_cache_path,
+    settings.ai_cache_ttl_seconds,
+    settings.ai_cache_max_entries
+)
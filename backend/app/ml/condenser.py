@@ -0,0 +1,272 @@
+"""
+Token-budgeted resume condensation for LLM prompts
+
+Instead of cutting resume text at a fixed character count, the text is
+cleaned (whitespace collapsed, repeated page headers/footers, "Page N" /
+"N of M" page numbers and separator lines dropped), split into sections by their headings, and
+the most useful sections are packed into a token budget: contact header,
+summary, skills and experience first, then projects, certifications and
+education, with interests and references last. Sections that fit whole are
+packed first, so a long work history does not push out a short education
+section; the remaining budget then goes to the leading lines (usually the
+most recent roles) of the sections that did not fit. Sections are emitted
+in their original order.
+
+Tokens are counted with tiktoken when it is installed and its encoding can
+be loaded, otherwise estimated from word lengths.
+"""
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from app.config import get_settings
+
+settings = get_settings()
+
+# Tokenizer of gpt-4o-mini
+TIKTOKEN_ENCODING = "o200k_base"
+
+# Section kinds in the order they are packed into the budget
+SECTION_PRIORITY = {
+    "header": 0,
+    "summary": 1,
+    "skills": 2,
+    "experience": 3,
+    "projects": 4,
+    "certifications": 5,
+    "education": 6,
+    "other": 7,
+    "interests": 8,
+}
+
+SECTION_HEADINGS = {
+    "summary": (
+        "summary", "professional summary", "career summary", "profile", "professional profile",
+        "objective", "career objective", "about me", "about"
+    ),
+    "skills": (
+        "skills", "technical skills", "key skills", "core skills", "core competencies", "competencies",
+        "technologies", "tech stack", "tools", "skills and tools", "skills & tools", "expertise",
+        "areas of expertise"
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment", "employment history", "work history", "career history", "career", "positions held"
+    ),
+    "projects": ("projects", "personal projects", "selected projects", "key projects", "open source"),
+    "certifications": (
+        "certifications", "certificates", "licenses", "licenses and certifications",
+        "licenses & certifications", "certifications and licenses", "training", "courses"
+    ),
+    "education": ("education", "academic background", "qualifications", "education and training"),
+    "other": (
+        "languages", "awards", "honors", "honors and awards", "achievements", "publications",
+        "volunteer", "volunteering", "volunteer experience", "activities", "leadership", "memberships"
+    ),
+    "interests": ("interests", "hobbies", "hobbies and interests", "personal interests", "references"),
+}
+HEADING_KINDS = {heading: kind for kind, headings in SECTION_HEADINGS.items() for heading in headings}
+# Headings that are also common one-word content lines (a skill list entry,
+# a role); they only start a section when written like a heading
+AMBIGUOUS_HEADINGS = {"leadership", "tools", "career", "training"}
+
+HEADING_NOISE_PATTERN = re.compile(r'[^a-z&/ ]+')
+BOILERPLATE_PATTERNS = (
+    # "Page 2", "Page 2 of 3", "2 of 3", "2/3"; bare numbers such as years are content
+    re.compile(r'^(?:page\s*\d+(?:\s*(?:of|/)\s*\d+)?|\d{1,3}\s*(?:of|/)\s*\d{1,3})$', re.IGNORECASE),
+    re.compile(r'^(?:curriculum vitae|resume|résumé|cv)$', re.IGNORECASE),
+    re.compile(r'references (?:are )?available (?:up)?on request', re.IGNORECASE),
+    re.compile(r'^([-_=*~•·.])\1{2,}$'),
+)
+# Lines at least this long are dropped when repeated (page headers and footers)
+MIN_DEDUPE_LENGTH = 25
+# Longer lines are split at spaces so a section can be cut between sentences
+MAX_LINE_LENGTH = 300
+TRUNCATION_MARKER = "[...]"
+
+
+@dataclass
+class Section:
+    kind: str
+    heading: Optional[str] = None
+    lines: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CondensedResume:
+    """Condensed text and what was kept"""
+    text: str
+    original_tokens: int
+    tokens: int
+    truncated_sections: List[str] = field(default_factory=list)
+    dropped_sections: List[str] = field(default_factory=list)
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(0, self.original_tokens - self.tokens)
+
+
+class ResumeCondenser:
+    """Pack the most useful parts of a resume into a token budget"""
+
+    def __init__(self, max_tokens: int = 1000, tokenizer: str = "tiktoken"):
+        self.max_tokens = max_tokens
+        self.tokenizer = tokenizer
+
+        self._lock = threading.Lock()
+        self._encoding = None
+        self._encoding_loaded = False
+
+    def count_tokens(self, text: str) -> int:
+        """Tokens in `text` for the analysis model, or an estimate without tiktoken"""
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode_ordinary(text))
+        # About one token per four characters of each word
+        return sum((len(word) + 3) // 4 for word in text.split())
+
+    def sections(self, text: str) -> List[Section]:
+        """Cleaned lines grouped under their headings; text before the first one is the header"""
+        sections = [Section("header")]
+        seen = set()
+        for raw_line in text.splitlines():
+            line = " ".join(raw_line.split())
+            if not line or any(pattern.search(line) for pattern in BOILERPLATE_PATTERNS):
+                continue
+
+            kind = self._heading_kind(line)
+            if kind:
+                sections.append(Section(kind, line))
+                continue
+
+            if len(line) >= MIN_DEDUPE_LENGTH:
+                if line in seen:
+                    continue
+                seen.add(line)
+            sections[-1].lines.extend(self._split_line(line))
+        return [section for section in sections if section.lines]
+
+    def condense(self, text: str, max_tokens: Optional[int] = None) -> CondensedResume:
+        """
+        Condense resume text to at most `max_tokens` tokens
+
+        Args:
+            text: Extracted resume text
+            max_tokens: Token budget, defaults to the condenser's
+
+        Returns:
+            CondensedResume with the packed text and token counts
+        """
+        text = text or ""
+        budget = max_tokens or self.max_tokens
+        sections = self.sections(text)
+
+        kept, truncated, dropped = self._pack(sections, budget)
+        parts = []
+        for i, section in enumerate(sections):
+            if i not in kept:
+                continue
+            if section.heading:
+                parts.append(section.heading)
+            parts.extend(section.lines[:kept[i]])
+            if i in truncated:
+                parts.append(TRUNCATION_MARKER)
+
+        condensed = "\n".join(parts)
+        return CondensedResume(
+            text=condensed,
+            original_tokens=self.count_tokens(text),
+            tokens=self.count_tokens(condensed),
+            truncated_sections=[sections[i].kind for i in sorted(truncated)],
+            dropped_sections=[sections[i].kind for i in dropped]
+        )
+
+    def fields(self, text: str) -> Dict:
+        """Condensed text and token counts stored with a parsed resume"""
+        condensed = self.condense(text)
+        return {
+            "condensed_text": condensed.text,
+            "text_tokens": condensed.original_tokens,
+            "condensed_tokens": condensed.tokens
+        }
+
+    def _pack(self, sections: List[Section], budget: int) -> Tuple[Dict[int, int], set, List[int]]:
+        """Lines kept per section index, the truncated sections and the dropped ones"""
+        marker_cost = self._line_cost(TRUNCATION_MARKER)
+
+        order = sorted(range(len(sections)), key=lambda i: (SECTION_PRIORITY[sections[i].kind], i))
+        costs = {i: [self._line_cost(line) for line in sections[i].lines] for i in order}
+        heading_costs = {i: self._line_cost(sections[i].heading) if sections[i].heading else 0 for i in order}
+
+        kept: Dict[int, int] = {}
+        remaining = budget
+        for i in order:
+            cost = heading_costs[i] + sum(costs[i])
+            if cost <= remaining:
+                kept[i] = len(costs[i])
+                remaining -= cost
+
+        # Leading lines of the rest, next to their heading and the truncation marker
+        truncated = set()
+        dropped = []
+        for i in order:
+            if i in kept:
+                continue
+            used = heading_costs[i] + marker_cost
+            count = 0
+            for cost in costs[i]:
+                if used + cost > remaining:
+                    break
+                used += cost
+                count += 1
+            if count:
+                kept[i] = count
+                truncated.add(i)
+                remaining -= used
+            else:
+                dropped.append(i)
+        return kept, truncated, sorted(dropped)
+
+    def _line_cost(self, line: str) -> int:
+        """Tokens of a line plus its newline, so the joined text stays within budget"""
+        return self.count_tokens(line) + 1
+
+    def _heading_kind(self, line: str) -> Optional[str]:
+        if len(line) > 40:
+            return None
+        heading = " ".join(HEADING_NOISE_PATTERN.sub(" ", line.lower()).split())
+        if heading in AMBIGUOUS_HEADINGS and not (line.isupper() or line.endswith(":")):
+            return None
+        return HEADING_KINDS.get(heading)
+
+    def _split_line(self, line: str) -> List[str]:
+        if len(line) <= MAX_LINE_LENGTH:
+            return [line]
+        pieces, current = [], ""
+        for word in line.split(" "):
+            if current and len(current) + 1 + len(word) > MAX_LINE_LENGTH:
+                pieces.append(current)
+                current = word
+            else:
+                current = f"{current} {word}" if current else word
+        if current:
+            pieces.append(current)
+        return pieces
+
+    def _get_encoding(self):
+        if self._encoding_loaded:
+            return self._encoding
+        with self._lock:
+            if not self._encoding_loaded:
+                if self.tokenizer == "tiktoken":
+                    try:
+                        import tiktoken
+                        self._encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+                    except Exception as e:
+                        print(f"tiktoken unavailable, estimating resume tokens: {e}")
+                self._encoding_loaded = True
+        return self._encoding
+
+
+# Singleton instance
+resume_condenser = ResumeCondenser(max_tokens=settings.resume_max_tokens, tokenizer=settings.resume_tokenizer)
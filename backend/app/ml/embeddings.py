@@ -0,0 +1,115 @@
+"""
+Cheap local text embeddings for semantic pre-ranking
+
+Resumes and jobs are embedded as signed, hashed bag-of-words vectors
+(unigrams and bigrams, skill synonyms folded to one term, sublinear term
+frequency, L2-normalized) stored as float32. No model or network call is
+involved, so embedding a resume costs about a millisecond. IDF weighting
+is applied at query time from the candidates being ranked.
+"""
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from app.ml.scorer import SKILL_REVERSE_LOOKUP
+from app.config import get_settings
+
+settings = get_settings()
+
+# Words, keeping the punctuation in skill names like c++, c#, node.js
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+DTYPE = np.float32
+
+
+class TextEmbedder:
+    """Embed text as a fixed-size hashed term vector"""
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+
+    def features(self, text: str) -> List[str]:
+        """Unigrams (skill synonyms folded to the canonical skill) and bigrams"""
+        tokens = [SKILL_REVERSE_LOOKUP.get(token, token) for token in TOKEN_PATTERN.findall(text.lower())]
+        return tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit-length float32 vector of `text`, all zeros if it has no terms"""
+        vector = np.zeros(self.dim, dtype=DTYPE)
+        features = self.features(text or "")
+        if not features:
+            return vector
+
+        hashes = np.fromiter(
+            (zlib.crc32(feature.encode()) for feature in features), dtype=np.uint32, count=len(features)
+        )
+        # Low bits pick the slot, the top bit the sign, so collisions tend to cancel out
+        signs = np.where(hashes >> 31, -1.0, 1.0).astype(DTYPE)
+        np.add.at(vector, hashes % self.dim, signs)
+
+        vector = np.sign(vector) * np.log1p(np.abs(vector))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_resume(self, resume_data: Dict) -> np.ndarray:
+        """Vector of a parsed resume's text and skills"""
+        return self.embed(" ".join([resume_data.get("raw_text") or "", *(resume_data.get("skills") or [])]))
+
+    def embed_job(self, job_data: Dict) -> np.ndarray:
+        """Vector of a job's title, description, requirements and skills"""
+        return self.embed(" ".join([
+            job_data.get("title") or "",
+            job_data.get("description") or "",
+            job_data.get("requirements") or "",
+            *(job_data.get("skills") or [])
+        ]))
+
+    def to_bytes(self, vector: np.ndarray) -> bytes:
+        return vector.astype(DTYPE).tobytes()
+
+    def from_bytes(self, data: Optional[bytes]) -> Optional[np.ndarray]:
+        """Stored vector, or None if missing or embedded with another dimension"""
+        if not data or len(data) != self.dim * np.dtype(DTYPE).itemsize:
+            return None
+        return np.frombuffer(data, dtype=DTYPE)
+
+
+def idf_weights(matrix: np.ndarray) -> np.ndarray:
+    """Smoothed inverse document frequency of each slot over the rows of `matrix`"""
+    rows = matrix.shape[0]
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    return (np.log((1 + rows) / (1 + document_frequency)) + 1).astype(DTYPE)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def top_k(matrix: np.ndarray, query: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    """
+    Rows of `matrix` most similar to `query` by dot product
+
+    Returns:
+        list: (row index, similarity) pairs, best first
+    """
+    if k <= 0 or matrix.shape[0] == 0:
+        return []
+    scores = matrix @ query
+    k = min(k, len(scores))
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best], kind="stable")]
+    return [(int(row), float(scores[row])) for row in best]
+
+
+def stack(vectors: Iterable[np.ndarray], dim: int) -> np.ndarray:
+    """Rows as one contiguous float32 matrix"""
+    vectors = list(vectors)
+    if not vectors:
+        return np.zeros((0, dim), dtype=DTYPE)
+    return np.vstack(vectors).astype(DTYPE, copy=False)
+
+
+# Singleton instance
+text_embedder = TextEmbedder(dim=settings.embedding_dim)
@@ -0,0 +1,272 @@
+"""
+Content-addressed cache of extracted resume text and parse results
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+from app.ml.resume_parser import PARSER_VERSION, resume_parser
+from app.utils.metrics import stage_timer
+from app.config import get_settings
+
+settings = get_settings()
+
+CHUNK_SIZE = 64 * 1024
+
+# Hits update last_used in batches, once this many are pending or this old
+TOUCH_FLUSH_ENTRIES = 100
+TOUCH_FLUSH_SECONDS = 10.0
+# Eviction frees space down to this share of max_bytes, so it runs rarely
+EVICT_TO_RATIO = 0.9
+
+
+def sha256_file(file_path: str) -> str:
+    """Hash a file's contents without loading it into memory"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_and_parse(file_path: str) -> Tuple[str, Dict]:
+    """Extract text and parse it; module-level so it can run in a worker process"""
+    with stage_timer("extract"):
+        text = resume_parser.extract_text(file_path)
+    with stage_timer("parse"):
+        return text, resume_parser.parse_text(text)
+
+
+class ParseCache:
+    """
+    SQLite-backed LRU cache of resume text and parse() output
+
+    Entries are keyed by the SHA-256 of the file contents and the parser
+    version, and evicted least-recently-used once the stored size exceeds
+    `max_bytes`. The total size is tracked in memory, so a put only scans
+    the table when it has to evict, and hits record their recency in
+    memory and write it back in batches instead of committing on every read.
+    """
+
+    def __init__(self, path: str, max_bytes: int, parser_version: str = PARSER_VERSION):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.parser_version = parser_version
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_size = 0
+        self._touched: Dict[str, float] = {}
+        self._touched_at = time.monotonic()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    content_hash TEXT NOT NULL,
+                    parser_version TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    parsed TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (content_hash, parser_version)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_parse_cache_last_used ON parse_cache (last_used)")
+
+            # Results from other parser versions can never be hit again
+            conn.execute("DELETE FROM parse_cache WHERE parser_version != ?", (self.parser_version,))
+            conn.commit()
+            self._total_size = self._stored_size(conn)
+            self._conn = conn
+        return self._conn
+
+    def get(self, content_hash: str) -> Optional[Tuple[str, Dict]]:
+        """Return cached (text, parsed) for a content hash, or None"""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT text, parsed FROM parse_cache WHERE content_hash = ? AND parser_version = ?",
+                (content_hash, self.parser_version)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._touched[content_hash] = time.time()
+            if len(self._touched) >= TOUCH_FLUSH_ENTRIES or \
+                    time.monotonic() - self._touched_at >= TOUCH_FLUSH_SECONDS:
+                self._flush_touched(conn)
+                conn.commit()
+            self.hits += 1
+            return row[0], json.loads(row[1])
+
+    def contains(self, content_hash: str) -> bool:
+        """Check for an entry without touching counters or recency"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT 1 FROM parse_cache WHERE content_hash = ? AND parser_version = ?",
+                (content_hash, self.parser_version)
+            ).fetchone()
+        return row is not None
+
+    def put(self, content_hash: str, text: str, parsed: Dict) -> bool:
+        """Store a result and evict least recently used entries over the size limit"""
+        parsed_json = json.dumps(parsed)
+        size = len(text.encode("utf-8")) + len(parsed_json)
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            conn = self._connect()
+            replaced = conn.execute(
+                "SELECT size FROM parse_cache WHERE content_hash = ? AND parser_version = ?",
+                (content_hash, self.parser_version)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, self.parser_version, text, parsed_json, size, time.time())
+            )
+            self._total_size += size - (replaced[0] if replaced else 0)
+            if self._total_size > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+        return True
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """Write the recency of pending hits"""
+        if self._touched:
+            conn.executemany(
+                "UPDATE parse_cache SET last_used = ? WHERE content_hash = ? AND parser_version = ?",
+                [(last_used, content_hash, self.parser_version) for content_hash, last_used in self._touched.items()]
+            )
+            self._touched = {}
+        self._touched_at = time.monotonic()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the size is under EVICT_TO_RATIO of max_bytes"""
+        self._flush_touched(conn)
+        # Other processes may share the file, so start from the stored total
+        self._total_size = self._stored_size(conn)
+        target = int(self.max_bytes * EVICT_TO_RATIO)
+
+        evicted = []
+        rows = conn.execute("SELECT rowid, size FROM parse_cache ORDER BY last_used, rowid")
+        for rowid, size in rows:
+            if self._total_size <= target:
+                break
+            evicted.append((rowid,))
+            self._total_size -= size
+        rows.close()
+        conn.executemany("DELETE FROM parse_cache WHERE rowid = ?", evicted)
+
+    def _stored_size(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()[0]
+
+    def parse(
+        self,
+        file_path: str,
+        custom_skills: Optional[Sequence[str]] = None,
+        content_hash: Optional[str] = None,
+        extract: Callable[[str], Tuple[str, Dict]] = extract_and_parse
+    ) -> Dict:
+        """
+        Parse a resume, reusing the cached result for identical file contents
+
+        Args:
+            file_path: Resume file on disk
+            custom_skills: Extra skills to detect (parsed from the cached text)
+            content_hash: SHA-256 of the file if already known
+            extract: Function returning (text, parsed) on a cache miss
+
+        Returns:
+            Same dict as ResumeParser.parse
+        """
+        content_hash = content_hash or sha256_file(file_path)
+
+        cached = self.get(content_hash)
+        if cached:
+            text, parsed = cached
+        else:
+            text, parsed = extract(file_path)
+            # Don't pin extraction failures in the cache
+            if text:
+                self.put(content_hash, text, parsed)
+
+        if custom_skills:
+            return resume_parser.parse_text(text, custom_skills)
+        return parsed
+
+    def warm(
+        self,
+        directory: str,
+        extract: Callable[[str], Tuple[str, Dict]] = extract_and_parse
+    ) -> Dict:
+        """Parse every resume in a directory that is not cached yet"""
+        added = 0
+        cached = 0
+        failed = 0
+        for name in sorted(os.listdir(directory)):
+            file_path = os.path.join(directory, name)
+            ext = name.rsplit(".", 1)[-1].lower()
+            if not os.path.isfile(file_path) or ext not in settings.allowed_extensions:
+                continue
+
+            content_hash = sha256_file(file_path)
+            if self.contains(content_hash):
+                cached += 1
+                continue
+
+            try:
+                text, parsed = extract(file_path)
+            except Exception as e:
+                print(f"Could not extract {name}: {type(e).__name__}: {e}")
+                failed += 1
+                continue
+            if text and self.put(content_hash, text, parsed):
+                added += 1
+
+        return {"added": added, "already_cached": cached, "failed": failed}
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current cache size"""
+        with self._lock:
+            entries, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parse_cache"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "parser_version": self.parser_version
+        }
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM parse_cache")
+            conn.commit()
+            self._total_size = 0
+            self._touched = {}
+
+
+# Singleton instance
+parse_cache = ParseCache(settings.parse_cache_path, settings.parse_cache_max_bytes)
@@ -1,7 +1,55 @@
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import pdfplumber
 from docx import Document
+from pypdf import PdfReader
+from app.ml.skill_matcher import SkillMatch, SkillMatcher, get_skill_matcher
+
+# Bump when text extraction or parse() output changes to invalidate cached results
+PARSER_VERSION = "3"
+
+# pypdf output below this density, or with more tiny lines than this ratio,
+# is re-extracted with pdfplumber
+MIN_PDF_CHARS_PER_PAGE = 200
+MAX_PDF_SHORT_LINE_RATIO = 0.3
+
+# Field patterns, compiled once. Phone patterns are tried in order, each
+# only at its first match, as are the experience patterns below.
+EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERNS = (
+    re.compile(r'\+?[\d\s\-\(\)]{10,}'),
+    re.compile(r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}'),
+    re.compile(r'\d{3}[-\s]?\d{3}[-\s]?\d{4}')
+)
+NON_DIGIT_PATTERN = re.compile(r'\D')
+LONG_NUMBER_PATTERN = re.compile(r'\d{5,}')
+
+# Years-of-experience patterns on the lowercased text, in priority order.
+# Every match contains "year" or "yr"; all but the third start at the run
+# of digits just before it, the third at the "experience" before that.
+EXPERIENCE_PATTERNS = (
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'),
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?experience'),
+    re.compile(r'experience\s*[:\-]?\s*(\d+)\s*years?'),
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:in|of|working)'),
+)
+EXPERIENCE_KEYWORD_PATTERN = re.compile(r'yr|year')
+# Patterns that can use a "year" / "yr" keyword, starting at the number before it
+NUMBER_FIRST_PATTERNS = {"year": (0, 1, 3), "yr": (3,)}
+EXPERIENCE_FIRST_PATTERN = 2
+
+
+def _number_start(text: str, keyword_start: int) -> Optional[int]:
+    """Start of the number in "<digits>[+] <keyword>", or None"""
+    i = keyword_start
+    while i > 0 and text[i - 1].isspace():
+        i -= 1
+    if i > 0 and text[i - 1] == '+':
+        i -= 1
+    end = i
+    while i > 0 and text[i - 1].isdecimal():
+        i -= 1
+    return i if i < end else None
 
 
 # Common technical skills to detect (expanded list)
@@ -56,106 +104,178 @@ SKILLS_DATABASE = [
 ]
 
 
+def _first_plausible_years(matches: List, stop_at_undecided: bool = False) -> Optional[int]:
+    for match in matches:
+        if match is None:
+            if stop_at_undecided:
+                return None
+            continue
+        years = int(match.group(1))
+        # Sanity check - max 50 years
+        if 0 < years <= 50:
+            return years
+    return None
+
+
 class ResumeParser:
     """Parse resume files and extract structured information"""
 
     def __init__(self):
-        self.skills_lower = {s.lower(): s for s in SKILLS_DATABASE}
+        self.skill_matcher = SkillMatcher(SKILLS_DATABASE)
+
+    def extract_text_from_pdf(self, file_path: str, max_pages: Optional[int] = None) -> str:
+        """Extract text from PDF file, trying pypdf before pdfplumber"""
+        try:
+            text, pages = self._extract_pdf_with_pypdf(file_path, max_pages)
+            if not self._needs_layout_extraction(text, pages):
+                return text
+        except MemoryError:
+            raise
+        except Exception as e:
+            print(f"pypdf extraction failed, falling back to pdfplumber: {e}")
 
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
         try:
             with pdfplumber.open(file_path) as pdf:
                 text_parts = []
-                for page in pdf.pages:
+                for page in pdf.pages[:max_pages]:
                     page_text = page.extract_text()
                     if page_text:
                         text_parts.append(page_text)
                 return "\n".join(text_parts)
+        except MemoryError:
+            raise
         except Exception as e:
             print(f"Error extracting PDF text: {e}")
             return ""
 
+    def _extract_pdf_with_pypdf(self, file_path: str, max_pages: Optional[int] = None) -> Tuple[str, int]:
+        """Fast text extraction for simple, text-based PDFs, returns (text, pages read)"""
+        reader = PdfReader(file_path)
+        pages = reader.pages[:max_pages]
+        text_parts = []
+        for page in pages:
+            page_text = page.extract_text()
+            if page_text:
+                text_parts.append(page_text)
+        return "\n".join(text_parts), len(pages)
+
+    def _needs_layout_extraction(self, text: str, pages: int) -> bool:
+        """
+        Decide whether pypdf output is too poor to use
+
+        Little text per page (scanned or unusually encoded files) or text
+        broken into many tiny lines (multi-column layouts) goes to pdfplumber.
+        """
+        lines = [line for line in text.splitlines() if line.strip()]
+        if not lines:
+            return True
+
+        if len(text.strip()) / max(pages, 1) < MIN_PDF_CHARS_PER_PAGE:
+            return True
+
+        short_lines = sum(1 for line in lines if len(line.strip()) <= 2)
+        return short_lines / len(lines) > MAX_PDF_SHORT_LINE_RATIO
+
     def extract_text_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file"""
         try:
             doc = Document(file_path)
             return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+        except MemoryError:
+            raise
         except Exception as e:
             print(f"Error extracting DOCX text: {e}")
             return ""
 
-    def extract_text(self, file_path: str) -> str:
+    def extract_text(self, file_path: str, max_pages: Optional[int] = None) -> str:
         """Extract text from resume file based on extension"""
         file_path_lower = file_path.lower()
         if file_path_lower.endswith('.pdf'):
-            return self.extract_text_from_pdf(file_path)
+            return self.extract_text_from_pdf(file_path, max_pages)
         elif file_path_lower.endswith('.docx') or file_path_lower.endswith('.doc'):
             return self.extract_text_from_docx(file_path)
         return ""
 
     def extract_email(self, text: str) -> Optional[str]:
         """Extract email address from text"""
-        pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        match = re.search(pattern, text)
+        if '@' not in text:
+            return None
+        match = EMAIL_PATTERN.search(text)
         return match.group() if match else None
 
     def extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number from text"""
-        patterns = [
-            r'\+?[\d\s\-\(\)]{10,}',
-            r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}',
-            r'\d{3}[-\s]?\d{3}[-\s]?\d{4}'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 phone = match.group().strip()
                 # Clean up and validate length
-                digits = re.sub(r'\D', '', phone)
+                digits = NON_DIGIT_PATTERN.sub('', phone)
                 if len(digits) >= 9:
                     return phone
         return None
 
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract skills from text"""
-        text_lower = text.lower()
-        found_skills = []
+    def extract_skills(self, text: str, custom_skills: Optional[Sequence[str]] = None) -> List[str]:
+        """Extract skills from text, optionally including a custom skill list"""
+        return self._skills(text.lower(), custom_skills)
 
-        for skill_lower, skill_original in self.skills_lower.items():
-            # Use word boundary matching for accurate detection
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill_original)
+    def find_skills(self, text: str, custom_skills: Optional[Sequence[str]] = None) -> List[SkillMatch]:
+        """Find skill occurrences with their offsets in the text"""
+        return self._find_skills(text.lower(), custom_skills)
 
-        return list(set(found_skills))
+    def _find_skills(self, text_lower: str, custom_skills: Optional[Sequence[str]] = None) -> List[SkillMatch]:
+        matches = self.skill_matcher.finditer_lower(text_lower)
+        if custom_skills:
+            matches += get_skill_matcher(tuple(custom_skills)).finditer_lower(text_lower)
+        return matches
+
+    def _skills(self, text_lower: str, custom_skills: Optional[Sequence[str]] = None) -> List[str]:
+        return list(dict.fromkeys(m.skill for m in self._find_skills(text_lower, custom_skills)))
 
     def extract_years_of_experience(self, text: str) -> Optional[int]:
         """Extract years of experience from text"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?experience',
-            r'experience\s*[:\-]?\s*(\d+)\s*years?',
-            r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:in|of|working)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                years = int(match.group(1))
-                # Sanity check - max 50 years
-                if 0 < years <= 50:
-                    return years
+        return self._years_of_experience(text.lower())
 
-        return None
+    def _years_of_experience(self, text_lower: str) -> Optional[int]:
+        """
+        Find the first match of each pattern from the "year" / "yr" keywords
+        in one scan, trying the patterns only where they can start
+
+        Same result as searching each pattern in turn: the first match of
+        each pattern, in priority order, is used if its years are plausible.
+        """
+        first_matches = [None] * len(EXPERIENCE_PATTERNS)
+        for keyword in EXPERIENCE_KEYWORD_PATTERN.finditer(text_lower):
+            position = keyword.start()
+
+            start = _number_start(text_lower, position)
+            if start is not None:
+                for index in NUMBER_FIRST_PATTERNS[keyword.group()]:
+                    if first_matches[index] is None:
+                        first_matches[index] = EXPERIENCE_PATTERNS[index].match(text_lower, start)
+
+            if keyword.group() == "year" and first_matches[EXPERIENCE_FIRST_PATTERN] is None:
+                start = text_lower.rfind("experience", 0, position)
+                if start >= 0:
+                    first_matches[EXPERIENCE_FIRST_PATTERN] = EXPERIENCE_PATTERNS[EXPERIENCE_FIRST_PATTERN].match(
+                        text_lower, start
+                    )
+
+            # Later keywords can't change the answer once the patterns ahead of
+            # the first plausible match have all been decided
+            years = _first_plausible_years(first_matches, stop_at_undecided=True)
+            if years is not None:
+                return years
+
+        return _first_plausible_years(first_matches)
 
     def extract_name(self, text: str) -> Optional[str]:
         """Try to extract name from first lines of resume"""
-        lines = text.strip().split('\n')
+        lines = text.strip().split('\n', 5)
         for line in lines[:5]:  # Check first 5 lines
             line = line.strip()
             # Skip if line contains common headers or has email/phone
-            if '@' in line or re.search(r'\d{5,}', line):
+            if '@' in line or LONG_NUMBER_PATTERN.search(line):
                 continue
             if len(line) < 50 and len(line.split()) <= 4:
                 # Looks like a name
@@ -166,10 +286,12 @@ class ResumeParser:
                         return line
         return None
 
-    def parse(self, file_path: str) -> Dict:
+    def parse(self, file_path: str, custom_skills: Optional[Sequence[str]] = None) -> Dict:
         """Parse resume and extract all information"""
-        text = self.extract_text(file_path)
+        return self.parse_text(self.extract_text(file_path), custom_skills)
 
+    def parse_text(self, text: str, custom_skills: Optional[Sequence[str]] = None) -> Dict:
+        """Extract all information from already extracted resume text"""
         if not text:
             return {
                 "raw_text": "",
@@ -181,13 +303,15 @@ class ResumeParser:
                 "error": "Could not extract text from file"
             }
 
+        # One lowercase copy shared by the skill and experience scans
+        text_lower = text.lower()
         return {
             "raw_text": text[:5000],  # Limit stored text
             "email": self.extract_email(text),
             "phone": self.extract_phone(text),
             "name": self.extract_name(text),
-            "skills": self.extract_skills(text),
-            "years_of_experience": self.extract_years_of_experience(text)
+            "skills": self._skills(text_lower, custom_skills),
+            "years_of_experience": self._years_of_experience(text_lower)
         }
 
 
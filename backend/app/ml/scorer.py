@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from decimal import Decimal
+import numpy as np
 
 
 # Skill synonyms and variations for fuzzy matching
@@ -150,7 +151,22 @@ class Scorer:
             experience_score * self.experience_weight
         )
 
-        # Build explanation
+        return self._build_result(
+            final_score, skills_score, experience_score,
+            matched_skills, missing_skills, candidate_exp, required_exp
+        )
+
+    def _build_result(
+        self,
+        final_score: float,
+        skills_score: float,
+        experience_score: float,
+        matched_skills: List[str],
+        missing_skills: List[str],
+        candidate_exp: Optional[int],
+        required_exp: int
+    ) -> Dict:
+        """Build the score dict with a human-readable explanation"""
         explanation_parts = []
 
         if matched_skills:
@@ -181,6 +197,109 @@ class Scorer:
             "explanation": ". ".join(explanation_parts)
         }
 
+    def score_arrays(
+        self,
+        resumes: Sequence[Dict],
+        job_data: Dict
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized scoring of many candidates against one job
+
+        Candidate skills are normalized and encoded as integer ids, giving a
+        sparse candidate x skill matrix in coordinate form. The substring
+        matching of calculate_skills_score is evaluated once per distinct
+        skill in the batch, so per-candidate work is plain array arithmetic.
+
+        Args:
+            resumes: Parsed resume dicts with skills and years_of_experience
+            job_data: Job requirements with skills and min_experience
+
+        Returns:
+            tuple: (final_scores, skills_scores, experience_scores, matched)
+            where matched is a boolean (candidates x required skills) array
+        """
+        required_skills = job_data.get("skills", [])
+        required_exp = job_data.get("min_experience", 0)
+        n = len(resumes)
+
+        # Encode candidate skills as ids into a batch vocabulary
+        skill_ids: Dict[str, int] = {}
+        normalized_cache: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, resume_data in enumerate(resumes):
+            for skill in resume_data.get("skills") or []:
+                skill_id = normalized_cache.get(skill)
+                if skill_id is None:
+                    skill_id = skill_ids.setdefault(self.normalize_skill(skill), len(skill_ids))
+                    normalized_cache[skill] = skill_id
+                rows.append(i)
+                cols.append(skill_id)
+
+        # Which vocabulary skills satisfy which required skill (exact or substring match)
+        vocabulary = list(skill_ids)
+        required_normalized = [self.normalize_skill(s) for s in required_skills]
+        satisfies = np.array(
+            [[req == cs or req in cs or cs in req for req in required_normalized] for cs in vocabulary],
+            dtype=bool
+        ).reshape(len(vocabulary), len(required_normalized))
+
+        rows_array = np.asarray(rows, dtype=np.int64)
+        cols_array = np.asarray(cols, dtype=np.int64)
+        matched = np.zeros((n, len(required_normalized)), dtype=bool)
+        for r in range(len(required_normalized)):
+            hits = satisfies[cols_array, r]
+            matched[rows_array[hits], r] = True
+
+        if required_skills:
+            skills_scores = (matched.sum(axis=1) / len(required_skills)) * 100
+        else:
+            skills_scores = np.full(n, 100.0)
+
+        if required_exp <= 0:
+            experience_scores = np.full(n, 100.0)
+        else:
+            years = np.array(
+                [np.nan if r.get("years_of_experience") is None else r.get("years_of_experience") for r in resumes],
+                dtype=np.float64
+            ).reshape(n)
+            experience_scores = np.where(
+                np.isnan(years),
+                50.0,
+                np.where(years >= required_exp, 100.0, (years / required_exp) * 100)
+            )
+
+        final_scores = (
+            skills_scores * self.skills_weight +
+            experience_scores * self.experience_weight
+        )
+
+        return final_scores, skills_scores, experience_scores, matched
+
+    def score_many(self, resumes: Sequence[Dict], job_data: Dict) -> List[Dict]:
+        """
+        Score many candidates against one job
+
+        Returns the same dicts as calling score() for each resume.
+        """
+        final_scores, skills_scores, experience_scores, matched = self.score_arrays(resumes, job_data)
+        required_skills = job_data.get("skills", [])
+        required_exp = job_data.get("min_experience", 0)
+
+        results = []
+        for i, resume_data in enumerate(resumes):
+            row = matched[i]
+            results.append(self._build_result(
+                float(final_scores[i]),
+                float(skills_scores[i]),
+                float(experience_scores[i]),
+                [s for s, m in zip(required_skills, row) if m],
+                [s for s, m in zip(required_skills, row) if not m],
+                resume_data.get("years_of_experience"),
+                required_exp
+            ))
+        return results
+
 
 # Singleton instance
 scorer = Scorer()
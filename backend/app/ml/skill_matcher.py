@@ -0,0 +1,117 @@
+"""
+Single-pass skill matching over resume text
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class SkillMatch:
+    """A skill occurrence in the text"""
+    skill: str
+    start: int
+    end: int
+
+
+def _is_word_char(ch: str) -> bool:
+    return re.match(r"\w", ch) is not None
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Build a regex from a character trie, longest alternatives tried first"""
+    is_end = "" in node
+    branches = [
+        re.escape(ch) + _trie_pattern(child)
+        for ch, child in sorted(node.items())
+        if ch != ""
+    ]
+
+    if not branches:
+        return ""
+    if len(branches) == 1 and not is_end:
+        return branches[0]
+
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if is_end else pattern
+
+
+class SkillMatcher:
+    """
+    Find every known skill in a text with one regex scan
+
+    Matches follow the same rules as searching each skill separately with
+    r'\\b<skill>\\b' on the lowercased text.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills_lower: Dict[str, str] = {s.lower(): s for s in skills if s}
+
+        self._pattern = self._compile(self.skills_lower)
+        self._implied = self._build_implied(self.skills_lower)
+
+    @staticmethod
+    def _compile(skills_lower: Dict[str, str]) -> "re.Pattern":
+        trie: Dict = {}
+        for skill in skills_lower:
+            node = trie
+            for ch in skill:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        if not trie:
+            return re.compile(r"(?!)")
+
+        # Lookahead keeps the scan zero-width so overlapping skills are found
+        return re.compile(r"(?=\b(" + _trie_pattern(trie) + r")\b)")
+
+    @staticmethod
+    def _build_implied(skills_lower: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+        """
+        For each skill, the shorter skills that also match wherever it matches
+
+        The regex reports only the longest skill at a position. A shorter skill
+        that is a prefix of it matches at the same position exactly when the
+        word boundary after the prefix holds, which depends only on the two
+        skill names.
+        """
+        implied = {}
+        for skill in skills_lower:
+            prefixes = []
+            for other in skills_lower:
+                if len(other) < len(skill) and skill.startswith(other):
+                    if _is_word_char(other[-1]) != _is_word_char(skill[len(other)]):
+                        prefixes.append(other)
+            implied[skill] = tuple(prefixes)
+        return implied
+
+    def finditer(self, text: str) -> List[SkillMatch]:
+        """Return every skill occurrence with offsets into the lowercased text"""
+        return self.finditer_lower(text.lower())
+
+    def finditer_lower(self, text_lower: str) -> List[SkillMatch]:
+        """Same as finditer, for text the caller already lowercased"""
+        matches = []
+
+        for match in self._pattern.finditer(text_lower):
+            found = match.group(1)
+            start = match.start(1)
+            matches.append(SkillMatch(self.skills_lower[found], start, start + len(found)))
+            for prefix in self._implied[found]:
+                matches.append(SkillMatch(self.skills_lower[prefix], start, start + len(prefix)))
+
+        return matches
+
+    def find(self, text: str) -> List[str]:
+        """Return distinct skills found in `text`, in order of first occurrence"""
+        return list(dict.fromkeys(m.skill for m in self.finditer(text)))
+
+    def __len__(self) -> int:
+        return len(self.skills_lower)
+
+
+@lru_cache(maxsize=256)
+def get_skill_matcher(skills: Tuple[str, ...]) -> SkillMatcher:
+    """Return a cached matcher for a custom skill list (e.g. per tenant)"""
+    return SkillMatcher(skills)
@@ -2,5 +2,7 @@ from app.models.user import User
 from app.models.job import Job
 from app.models.candidate import Candidate
 from app.models.application import Application
+from app.models.resume import Resume
+from app.models.scoring_task import ScoringTask
 
-__all__ = ["User", "Job", "Candidate", "Application"]
+__all__ = ["User", "Job", "Candidate", "Application", "Resume", "ScoringTask"]
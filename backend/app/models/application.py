@@ -1,9 +1,10 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Numeric, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Text, Integer, Numeric, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.db.database import Base
+from app.db.types import SkillArray
 
 
 class Application(Base):
@@ -13,15 +14,31 @@ class Application(Base):
     job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
     candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
 
-    # Resume data
+    # Resume data: text and parsed fields live in the resumes row of the
+    # file's hash and load only on access; the application's own years of
+    # experience (form-entered or AI-extracted) is years_of_experience below
     resume_path = Column(String(500), nullable=True)
-    resume_parsed = Column(JSONB, nullable=True)
+    resume_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the file
+    # Inline copy of rows stored before the resumes table, emptied by
+    # python -m app.cli migrate-resumes
+    resume_parsed = deferred(Column(JSONB, nullable=True))
 
     # AI scoring
     ai_score = Column(Numeric(5, 2), nullable=True)
     score_breakdown = Column(JSONB, nullable=True)
+    # Rule-based score, also kept when AI produced ai_score (scoring cascade)
+    rule_score = Column(Numeric(5, 2), nullable=True)
     explanation = Column(Text, nullable=True)
 
+    # Candidate search: normalized skills (the resume's and those matched
+    # when scoring) and experience, set by app.services.search.search_fields.
+    # The resume text document and embedding are per file, on resumes.
+    skills = Column(SkillArray, nullable=True)
+    years_of_experience = Column(Integer, nullable=True)
+
+    # Scoring state: pending, processing, completed, failed
+    scoring_status = Column(String(20), default="completed", nullable=False)
+
     # Status: applied, reviewed, interview, rejected, hired
     status = Column(String(30), default="applied")
 
@@ -34,10 +51,23 @@ class Application(Base):
     # Relationships
     job = relationship("Job", back_populates="applications")
     candidate = relationship("Candidate", back_populates="applications")
+    resume = relationship(
+        "Resume",
+        primaryjoin="foreign(Application.resume_hash) == Resume.content_hash",
+        viewonly=True,
+        lazy="select"
+    )
 
     # Constraints
     __table_args__ = (
         UniqueConstraint("job_id", "candidate_id", name="unique_job_candidate"),
+        # Keyset pagination of a job's applications by score and by date
+        Index("ix_applications_job_id_ai_score", "job_id", "ai_score", "id"),
+        Index("ix_applications_job_id_applied_at", "job_id", "applied_at", "id"),
+        # Running top-K of the scoring cascade
+        Index("ix_applications_job_id_rule_score", "job_id", "rule_score"),
+        # Candidate search across jobs
+        Index("ix_applications_skills", "skills", postgresql_using="gin"),
     )
 
     def __repr__(self):
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -20,5 +20,10 @@ class Candidate(Base):
     # Relationships
     applications = relationship("Application", back_populates="candidate", cascade="all, delete-orphan")
 
+    # Case-insensitive lookup of existing candidates during bulk import
+    __table_args__ = (
+        Index("ix_candidates_email_lower", func.lower(email)),
+    )
+
     def __repr__(self):
         return f"<Candidate {self.full_name}>"
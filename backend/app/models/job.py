@@ -24,6 +24,12 @@ class Job(Base):
     skills = Column(JSONB, default=list)
     min_experience = Column(Integer, default=0)
 
+    # Scoring cascade: only candidates whose rule-based score is at least
+    # cascade_min_rule_score and/or in the job's top cascade_top_k go on to
+    # AI analysis (None = the SCORING_CASCADE_* defaults)
+    cascade_min_rule_score = Column(Integer, nullable=True)
+    cascade_top_k = Column(Integer, nullable=True)
+
     public_link = Column(String(20), unique=True, default=generate_public_link, index=True)
     status = Column(String(20), default="published")  # draft, published, closed
 
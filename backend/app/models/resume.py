@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Dict
+from sqlalchemy import Column, String, Text, DateTime, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
+from app.db.database import Base
+from app.db.types import SearchVector
+
+
+class Resume(Base):
+    """Extracted text and parsed fields of a resume file, shared by every application of that file"""
+    __tablename__ = "resumes"
+
+    # SHA-256 of the file (applications.resume_hash)
+    content_hash = Column(String(64), primary_key=True)
+    # PARSER_VERSION that produced the row ("legacy" for rows moved from applications)
+    parser_version = Column(String(20), nullable=False)
+
+    # Extracted text as stored in raw_text
+    text = Column(Text, nullable=True)
+    # The other ResumeParser fields: email, phone, name, skills, years, condensed text
+    parsed = Column(JSONB, nullable=True)
+
+    # Candidate search: text search document and float32 text embedding of
+    # the resume, set by app.services.resumes.resume_row. Both load only on access.
+    search_vector = deferred(Column(SearchVector, nullable=True))
+    embedding = deferred(Column(LargeBinary, nullable=True))
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # Full-text candidate search
+        Index("ix_resumes_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    def data(self) -> Dict:
+        """The parsed resume in the shape ResumeParser returns"""
+        return {"raw_text": self.text or "", **(self.parsed or {})}
+
+    def __repr__(self):
+        return f"<Resume {self.content_hash}>"
@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.database import Base
+
+
+class ScoringTask(Base):
+    """Queued resume parsing/scoring work for an application"""
+    __tablename__ = "scoring_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    application_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("applications.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # Experience entered on the application form (overrides the parsed value)
+    years_of_experience = Column(Integer, nullable=True)
+
+    # Status: queued, running, failed
+    status = Column(String(20), default="queued", nullable=False, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ScoringTask {self.application_id} {self.status}>"
@@ -54,6 +54,7 @@ class ApplicationResponse(BaseModel):
     ai_score: Optional[Decimal]
     score_breakdown: Optional[dict]
     explanation: Optional[str]
+    scoring_status: str = "completed"
     status: str
     applied_at: datetime
     resume_path: Optional[str]
@@ -69,6 +70,7 @@ class ApplicationDetailResponse(BaseModel):
     ai_score: Optional[Decimal]
     score_breakdown: Optional[dict]
     explanation: Optional[str]
+    scoring_status: str = "completed"
     status: str
     applied_at: datetime
     resume_path: Optional[str]
@@ -86,9 +88,58 @@ class ApplicationDetailResponse(BaseModel):
 
 class ApplicationListResponse(BaseModel):
     applications: List[ApplicationResponse]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class SimilarApplicationResponse(ApplicationResponse):
+    similarity: float  # Cosine similarity of resume and job text embeddings
+
+
+class SimilarApplicationListResponse(BaseModel):
+    applications: List[SimilarApplicationResponse]
+
+
+class CandidateSearchResult(BaseModel):
+    application_id: UUID
+    job_id: UUID
+    job_title: str
+    candidate: CandidateInfo
+    skills: List[str] = []
+    years_of_experience: Optional[int] = None  # From the resume
+    ai_score: Optional[Decimal]
+    scoring_status: str
+    status: str
+    applied_at: datetime
+    rank: Optional[float] = None  # Full-text relevance, when searching by text
+
+
+class CandidateSearchResponse(BaseModel):
+    results: List[CandidateSearchResult]
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class ApplicationSubmitResponse(BaseModel):
     message: str
     application_id: UUID
+    scoring_status: str
+
+
+class BulkImportFileResult(BaseModel):
+    filename: str
+    status: str  # imported, duplicate, skipped, failed
+    detail: Optional[str] = None
+    application_id: Optional[UUID] = None
+    candidate_email: Optional[str] = None
+    ai_score: Optional[Decimal] = None
+
+
+class BulkImportResponse(BaseModel):
+    total: int
+    imported: int
+    duplicates: int
+    skipped: int
+    failed: int
+    elapsed_seconds: float
+    results: List[BulkImportFileResult]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 from datetime import datetime
 
@@ -11,6 +11,8 @@ class JobCreate(BaseModel):
     requirements: str
     skills: List[str] = []
     min_experience: int = 0
+    cascade_min_rule_score: Optional[int] = None
+    cascade_top_k: Optional[int] = None
 
 
 class JobUpdate(BaseModel):
@@ -19,6 +21,8 @@ class JobUpdate(BaseModel):
     requirements: Optional[str] = None
     skills: Optional[List[str]] = None
     min_experience: Optional[int] = None
+    cascade_min_rule_score: Optional[int] = None
+    cascade_top_k: Optional[int] = None
     status: Optional[str] = None
 
 
@@ -30,10 +34,13 @@ class JobResponse(BaseModel):
     requirements: str
     skills: List[str]
     min_experience: int
+    cascade_min_rule_score: Optional[int] = None
+    cascade_top_k: Optional[int] = None
     public_link: str
     status: str
     created_at: datetime
     applications_count: Optional[int] = 0
+    applications_by_status: Dict[str, int] = {}
 
     class Config:
         from_attributes = True
@@ -56,3 +63,18 @@ class JobPublicResponse(BaseModel):
 class JobListResponse(BaseModel):
     jobs: List[JobResponse]
     total: int
+
+
+class RescoreResponse(BaseModel):
+    """Progress of a job re-scoring run"""
+    job_id: UUID
+    use_ai: bool
+    status: str
+    total: int
+    processed: int
+    updated: int
+    skipped: int
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: float
+    error: Optional[str] = None
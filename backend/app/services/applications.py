@@ -0,0 +1,199 @@
+"""
+Query builders and responses shared by the sync and async application routes
+
+Lists are paged with keyset cursors: (ai_score, id) or (applied_at, id)
+for a job's applications, (rank or applied_at, id) for candidate search.
+"""
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import Select, desc, func, select, tuple_
+from sqlalchemy.orm import Session
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.models.application import Application
+from app.schemas.application import (
+    ApplicationResponse,
+    ApplicationListResponse,
+    CandidateInfo,
+    CandidateSearchResponse,
+    CandidateSearchResult,
+    SimilarApplicationListResponse,
+    SimilarApplicationResponse
+)
+from app.services.embedding_index import embedding_index
+from app.services.search import skill_filters
+
+
+class InvalidCursor(ValueError):
+    """Raised for a page cursor that can't be decoded"""
+
+
+def encode_cursor(sort_value, application_id: UUID) -> str:
+    """Opaque keyset cursor: last row's sort value and id"""
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else sort_value
+    payload = json.dumps({"v": None if value is None else str(value), "id": str(application_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Tuple[Optional[object], UUID]:
+    """Last row's sort value and id from a cursor made by encode_cursor"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        value = payload["v"]
+        if value is not None:
+            if sort_by == "date":
+                value = datetime.fromisoformat(value)
+            elif sort_by == "rank":
+                value = float(value)
+            else:
+                value = Decimal(value)
+        return value, UUID(payload["id"])
+    except (ValueError, KeyError, TypeError, InvalidOperation):
+        raise InvalidCursor(cursor)
+
+
+def list_sort_column(sort_by: str):
+    return Application.ai_score if sort_by == "score" else Application.applied_at
+
+
+def list_filters(
+    job_id: UUID,
+    status_filter: Optional[str],
+    min_score: Optional[float],
+    skills: List[str]
+) -> list:
+    filters = [Application.job_id == job_id]
+    if status_filter:
+        filters.append(Application.status == status_filter)
+    if min_score is not None:
+        filters.append(Application.ai_score >= min_score)
+    filters.extend(skill_filters(skills))
+    return filters
+
+
+def list_statement(filters: list) -> Select:
+    """Joined query selecting only the columns in the response (no per-row
+    candidate lookups, no resume_parsed)"""
+    return select(
+        Application.id,
+        Application.ai_score,
+        Application.score_breakdown,
+        Application.explanation,
+        Application.scoring_status,
+        Application.status,
+        Application.applied_at,
+        Application.resume_path,
+        Candidate.id.label("candidate_id"),
+        Candidate.full_name,
+        Candidate.email,
+        Candidate.phone,
+        Candidate.years_of_experience
+    ).join(
+        Candidate, Candidate.id == Application.candidate_id
+    ).where(*filters)
+
+
+def scored_page(statement: Select, sort_column, last_value, last_id: Optional[UUID], limit: int) -> Select:
+    """Rows with a sort value after the cursor, one extra to detect more pages"""
+    statement = statement.where(sort_column.isnot(None))
+    if last_id is not None:
+        statement = statement.where(tuple_(sort_column, Application.id) < tuple_(last_value, last_id))
+    return statement.order_by(desc(sort_column), desc(Application.id)).limit(limit + 1)
+
+
+def unscored_page(statement: Select, sort_column, last_value, last_id: Optional[UUID], limit: int) -> Select:
+    """Rows without a sort value after the cursor"""
+    statement = statement.where(sort_column.is_(None))
+    if last_value is None and last_id is not None:
+        statement = statement.where(Application.id < last_id)
+    return statement.order_by(desc(Application.id)).limit(limit)
+
+
+def count_statement(filters: list) -> Select:
+    return select(func.count(Application.id)).where(*filters)
+
+
+def application_fields(row) -> dict:
+    """ApplicationResponse fields from a list_statement row"""
+    return dict(
+        id=row.id,
+        candidate=CandidateInfo(
+            id=row.candidate_id,
+            full_name=row.full_name,
+            email=row.email,
+            phone=row.phone,
+            years_of_experience=row.years_of_experience
+        ),
+        ai_score=row.ai_score,
+        score_breakdown=row.score_breakdown,
+        explanation=row.explanation,
+        scoring_status=row.scoring_status,
+        status=row.status,
+        applied_at=row.applied_at,
+        resume_path=row.resume_path
+    )
+
+
+def list_response(rows: list, limit: int, sort_by: str, total: Optional[int]) -> ApplicationListResponse:
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(last.ai_score if sort_by == "score" else last.applied_at, last.id)
+
+    app_responses = [ApplicationResponse(**application_fields(row)) for row in rows]
+
+    return ApplicationListResponse(applications=app_responses, total=total, next_cursor=next_cursor)
+
+
+def search_response(rows: list, limit: int, sort_by: str, total: Optional[int]) -> CandidateSearchResponse:
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(last.sort_value, last.id)
+
+    results = [
+        CandidateSearchResult(
+            application_id=row.id,
+            job_id=row.job_id,
+            job_title=row.job_title,
+            candidate=CandidateInfo(
+                id=row.candidate_id,
+                full_name=row.full_name,
+                email=row.email,
+                phone=row.phone,
+                years_of_experience=row.years_of_experience
+            ),
+            skills=row.skills or [],
+            years_of_experience=row.resume_years_of_experience,
+            ai_score=row.ai_score,
+            scoring_status=row.scoring_status,
+            status=row.status,
+            applied_at=row.applied_at,
+            rank=row.sort_value if sort_by == "rank" else None
+        )
+        for row in rows
+    ]
+
+    return CandidateSearchResponse(results=results, total=total, next_cursor=next_cursor)
+
+
+def similar_applications(db: Session, job: Job, limit: int) -> SimilarApplicationListResponse:
+    ranked = embedding_index.rank(db, job, limit)
+    ids = [application_id for application_id, _ in ranked]
+    rows = {row.id: row for row in db.execute(list_statement([Application.id.in_(ids)])).all()}
+
+    return SimilarApplicationListResponse(applications=[
+        SimilarApplicationResponse(**application_fields(rows[application_id]), similarity=round(score, 4))
+        for application_id, score in ranked
+        if application_id in rows
+    ])
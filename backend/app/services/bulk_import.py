@@ -0,0 +1,365 @@
+"""
+Bulk import of resumes into a job from ZIP archives or many uploaded files
+"""
+import os
+import tempfile
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from uuid import UUID
+from fastapi import UploadFile
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.models.application import Application
+from app.ml.ai_analyzer import ai_analyzer
+from app.ml.parse_cache import parse_cache
+from app.ml.scorer import scorer
+from app.schemas.application import BulkImportFileResult, BulkImportResponse
+from app.services.extraction import ExtractionError, extraction_pool
+from app.services.resumes import resume_row, store_resumes
+from app.services.scoring import build_job_data, build_score_breakdown, rule_score_of
+from app.services.scoring_queue import scoring_queue
+from app.services.search import search_fields
+from app.utils.metrics import scoring_results, stage_timer
+from app.utils.uploads import StoredUpload, UploadTooLarge, save_stream, save_upload
+from app.config import get_settings
+
+settings = get_settings()
+
+# Rows per IN (...) lookup
+LOOKUP_CHUNK_SIZE = 500
+
+
+@dataclass
+class ImportFileResult:
+    """Outcome of importing one file"""
+    filename: str
+    status: str  # imported, duplicate, skipped, failed
+    detail: Optional[str] = None
+    application_id: Optional[UUID] = None
+    candidate_email: Optional[str] = None
+    ai_score: Optional[float] = None
+
+
+@dataclass
+class ImportedFile:
+    """A resume stored in the upload directory, waiting to be imported"""
+    filename: str
+    stored: StoredUpload
+
+
+@dataclass
+class ImportReport:
+    """Per-file results of a bulk import"""
+    results: List[ImportFileResult] = field(default_factory=list)
+
+    def count(self, result_status: str) -> int:
+        return sum(1 for result in self.results if result.status == result_status)
+
+
+def resume_extension(filename: str) -> Optional[str]:
+    """Lower-case extension if the file is an allowed resume type"""
+    if "." not in filename:
+        return None
+    ext = filename.rsplit(".", 1)[-1].lower()
+    return ext if ext in settings.allowed_extensions else None
+
+
+def iter_zip_resumes(zip_path: str, directory: str, max_files: int) -> Iterator[Union[ImportedFile, ImportFileResult]]:
+    """
+    Copy each resume in a ZIP archive to `directory`, one entry at a time
+
+    Entries are streamed out of the archive in chunks, so only one chunk is
+    held in memory. Yields an ImportedFile for every stored resume and an
+    ImportFileResult for every entry that was skipped or rejected.
+    """
+    stored = 0
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            name = info.filename
+            base_name = os.path.basename(name)
+            if info.is_dir() or name.startswith("__MACOSX/") or not base_name or base_name.startswith("."):
+                continue
+
+            ext = resume_extension(base_name)
+            if not ext:
+                yield ImportFileResult(name, "skipped", "File type not allowed")
+                continue
+            if stored >= max_files:
+                yield ImportFileResult(name, "failed", f"Import limit of {max_files} files reached")
+                continue
+            # Declared size is checked up front, actual size while copying
+            if info.file_size > settings.max_file_size:
+                yield ImportFileResult(name, "failed", "File too large")
+                continue
+
+            try:
+                with archive.open(info) as source:
+                    upload = save_stream(source, directory, ext, settings.max_file_size)
+            except UploadTooLarge:
+                yield ImportFileResult(name, "failed", "File too large")
+                continue
+            except (zipfile.BadZipFile, RuntimeError, NotImplementedError) as e:
+                # Corrupt, encrypted or unsupported compression
+                yield ImportFileResult(name, "failed", f"Could not read archive entry: {e}")
+                continue
+
+            stored += 1
+            yield ImportedFile(name, upload)
+
+
+async def stage_uploads(files: List[UploadFile]) -> Tuple[List[ImportedFile], ImportReport]:
+    """
+    Store uploaded resumes and the resumes inside uploaded ZIP archives
+
+    Archives are spooled to a temporary directory and removed once their
+    entries are copied out. Returns the stored resumes and a report holding
+    every file that was skipped or rejected.
+    """
+    report = ImportReport()
+    imported: List[ImportedFile] = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="hrai-import-") as archive_dir:
+            for upload in files:
+                filename = upload.filename or "unnamed"
+                remaining = settings.bulk_import_max_files - len(imported)
+
+                if filename.lower().endswith(".zip"):
+                    try:
+                        archive = await save_upload(upload, archive_dir, "zip", settings.bulk_import_max_bytes)
+                        entries = await run_in_threadpool(
+                            lambda: list(iter_zip_resumes(archive.path, settings.upload_dir, remaining))
+                        )
+                    except (UploadTooLarge, zipfile.BadZipFile) as e:
+                        report.results.append(ImportFileResult(filename, "failed", f"Could not read archive: {e}"))
+                        continue
+                    for entry in entries:
+                        if isinstance(entry, ImportedFile):
+                            imported.append(entry)
+                        else:
+                            report.results.append(entry)
+                    os.remove(archive.path)
+                    continue
+
+                ext = resume_extension(filename)
+                if not ext:
+                    report.results.append(ImportFileResult(filename, "skipped", "File type not allowed"))
+                    continue
+                if remaining <= 0:
+                    report.results.append(ImportFileResult(
+                        filename, "failed", f"Import limit of {settings.bulk_import_max_files} files reached"
+                    ))
+                    continue
+                try:
+                    stored = await save_upload(upload, settings.upload_dir, ext, settings.max_file_size)
+                except UploadTooLarge:
+                    report.results.append(ImportFileResult(filename, "failed", "File too large"))
+                    continue
+                imported.append(ImportedFile(filename, stored))
+    except BaseException:
+        discard_files(imported)
+        raise
+
+    return imported, report
+
+
+def discard_files(files: List[ImportedFile]) -> None:
+    """Remove stored copies of resumes that were not imported"""
+    for imported in files:
+        _discard(imported)
+
+
+def _parse(imported: ImportedFile) -> Dict:
+    try:
+        if settings.parse_cache_enabled:
+            return parse_cache.parse(
+                imported.stored.path,
+                content_hash=imported.stored.sha256,
+                extract=extraction_pool.extract_and_parse
+            )
+        return extraction_pool.extract_and_parse(imported.stored.path)[1]
+    except ExtractionError as e:
+        # Reported as a failed file; the rest of the import goes on
+        return {"error": f"Could not extract text from file: {e}"}
+
+
+def _discard(imported: ImportedFile) -> None:
+    if os.path.exists(imported.stored.path):
+        os.remove(imported.stored.path)
+
+
+def _chunks(items: List, size: int) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def import_resumes(
+    db: Session,
+    job: Job,
+    files: List[ImportedFile],
+    report: Optional[ImportReport] = None
+) -> ImportReport:
+    """
+    Parse stored resumes in parallel and create candidates and applications
+
+    Candidates are identified by the email address found in the resume.
+    Files without one, or whose candidate already applied to the job (or
+    appears earlier in the same import), are reported and their stored
+    copy removed. New candidates, resumes and applications are written with
+    one multi-row INSERT each. Without the AI analyzer, applications are scored
+    in the request with the vectorized rule-based scorer; otherwise they
+    are queued for the background worker like public applications.
+
+    Args:
+        db: Database session
+        job: Job to import into
+        files: Resumes already copied to the upload directory
+        report: Report to append to, e.g. with archive entries already skipped
+
+    Returns:
+        The report with one result per file
+    """
+    report = report or ImportReport()
+
+    with stage_timer("import_parse"), ThreadPoolExecutor(max_workers=extraction_pool.processes) as executor:
+        parsed_files = list(executor.map(_parse, files))
+
+    # Keep the first file per email address
+    candidates_by_email: Dict[str, tuple] = {}
+    for imported, parsed in zip(files, parsed_files):
+        email = (parsed.get("email") or "").strip()
+        if parsed.get("error"):
+            report.results.append(ImportFileResult(imported.filename, "failed", parsed["error"]))
+            _discard(imported)
+        elif not email:
+            report.results.append(ImportFileResult(imported.filename, "failed", "No email address found in resume"))
+            _discard(imported)
+        elif email.lower() in candidates_by_email:
+            report.results.append(ImportFileResult(
+                imported.filename, "duplicate", "Same candidate appears earlier in this import",
+                candidate_email=email
+            ))
+            _discard(imported)
+        else:
+            candidates_by_email[email.lower()] = (imported, parsed, email)
+
+    # Existing candidates and their applications to this job
+    # Compare lowercased on both sides so stored mixed-case addresses still match
+    existing_candidates: Dict[str, UUID] = {}
+    for chunk in _chunks(list(candidates_by_email), LOOKUP_CHUNK_SIZE):
+        matches = db.query(Candidate.id, Candidate.email).filter(func.lower(Candidate.email).in_(chunk))
+        for candidate_id, email in matches:
+            existing_candidates.setdefault(email.lower(), candidate_id)
+
+    already_applied = set()
+    for chunk in _chunks(list(existing_candidates.values()), LOOKUP_CHUNK_SIZE):
+        already_applied.update(candidate_id for (candidate_id,) in db.query(Application.candidate_id).filter(
+            Application.job_id == job.id,
+            Application.candidate_id.in_(chunk)
+        ))
+
+    candidate_rows = []
+    pending = []
+    for key, (imported, parsed, email) in candidates_by_email.items():
+        candidate_id = existing_candidates.get(key)
+        if candidate_id in already_applied:
+            report.results.append(ImportFileResult(
+                imported.filename, "duplicate", "Candidate already applied for this job",
+                candidate_email=email
+            ))
+            _discard(imported)
+            continue
+
+        if candidate_id is None:
+            candidate_id = uuid.uuid4()
+            name = parsed.get("name") or os.path.splitext(os.path.basename(imported.filename))[0]
+            phone = parsed.get("phone")
+            candidate_rows.append({
+                "id": candidate_id,
+                "email": email[:255],
+                "full_name": name[:255],
+                "phone": phone[:50] if phone else None,
+                "years_of_experience": parsed.get("years_of_experience"),
+                "created_at": datetime.utcnow()
+            })
+        pending.append((imported, parsed, email, candidate_id))
+
+    use_ai = ai_analyzer.is_available()
+    score_results = [None] * len(pending)
+    if not use_ai and pending:
+        with stage_timer("import_score"):
+            score_results = scorer.score_many([parsed for _, parsed, _, _ in pending], build_job_data(job))
+        scoring_results.inc(len(pending), method="rules")
+
+    now = datetime.utcnow()
+    application_rows = []
+    for (imported, parsed, email, candidate_id), score_result in zip(pending, score_results):
+        application_id = uuid.uuid4()
+        row = {
+            "id": application_id,
+            "job_id": job.id,
+            "candidate_id": candidate_id,
+            "resume_path": imported.stored.path,
+            "resume_hash": imported.stored.sha256,
+            "ai_score": None,
+            "score_breakdown": None,
+            "explanation": None,
+            "scoring_status": "pending",
+            "status": "applied",
+            "applied_at": now,
+            "updated_at": now,
+            **search_fields(parsed, score_result)
+        }
+        if score_result is not None:
+            row.update(
+                ai_score=score_result["final_score"],
+                rule_score=rule_score_of(score_result),
+                score_breakdown=build_score_breakdown(score_result),
+                explanation=score_result["explanation"],
+                scoring_status="completed"
+            )
+        application_rows.append(row)
+        report.results.append(ImportFileResult(
+            imported.filename, "imported",
+            application_id=application_id,
+            candidate_email=email,
+            ai_score=score_result["final_score"] if score_result else None
+        ))
+
+    try:
+        with stage_timer("import_insert"):
+            if candidate_rows:
+                db.execute(insert(Candidate), candidate_rows)
+            store_resumes(db, [resume_row(imported.stored.sha256, parsed) for imported, parsed, _, _ in pending])
+            if application_rows:
+                db.execute(insert(Application), application_rows)
+            if use_ai:
+                for row in application_rows:
+                    scoring_queue.enqueue(db, row["id"])
+            db.commit()
+    except Exception:
+        db.rollback()
+        discard_files([imported for imported, _, _, _ in pending])
+        raise
+
+    return report
+
+
+def bulk_import_response(report: ImportReport, started: float) -> BulkImportResponse:
+    """Response counting the results of an import that began at `started` (perf_counter)"""
+    return BulkImportResponse(
+        total=len(report.results),
+        imported=report.count("imported"),
+        duplicates=report.count("duplicate"),
+        skipped=report.count("skipped"),
+        failed=report.count("failed"),
+        elapsed_seconds=round(time.perf_counter() - started, 3),
+        results=[BulkImportFileResult(**asdict(result)) for result in report.results]
+    )
@@ -0,0 +1,153 @@
+"""
+Nearest-candidate ranking of a job's applications by embedding similarity
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from uuid import UUID
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.models.job import Job
+from app.models.application import Application
+from app.models.resume import Resume
+from app.ml.embeddings import TextEmbedder, idf_weights, normalize_rows, stack, text_embedder, top_k
+from app.services.scoring import build_job_data
+from app.config import get_settings
+
+settings = get_settings()
+
+
+@dataclass
+class JobMatrix:
+    """IDF-weighted, row-normalized embeddings of one job's applications"""
+    version: Tuple
+    application_ids: List[UUID]
+    matrix: np.ndarray
+    idf: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.nbytes + self.idf.nbytes
+
+
+class EmbeddingIndex:
+    """
+    Brute-force top-K over per-job float32 matrices, cached in process
+
+    A job's matrix is built from the embeddings of its applications'
+    resumes rows (one per file) and reused until the job's embedded
+    application count or the latest update of those applications or
+    resumes changes, so repeat rankings cost one aggregate query plus a
+    matrix-vector product. That product reads the whole matrix: 100k
+    candidates at 1024 dims is 400MB and about 35ms on one core, so lower
+    embedding_dim for very large jobs.
+
+    Matrices are evicted least-recently-used once their total size exceeds
+    `max_bytes`; a matrix larger than that on its own is used but not kept.
+    """
+
+    def __init__(self, embedder: TextEmbedder, max_bytes: int = 512 * 1024 * 1024):
+        self.embedder = embedder
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._matrices: "OrderedDict[UUID, JobMatrix]" = OrderedDict()
+        self._total_bytes = 0
+
+    def _version(self, db: Session, job_id: UUID) -> Tuple:
+        return tuple(db.execute(
+            select(
+                func.count(Resume.embedding),
+                func.max(Application.updated_at),
+                func.max(Resume.updated_at)
+            ).join(
+                Resume, Resume.content_hash == Application.resume_hash
+            ).where(
+                Application.job_id == job_id
+            )
+        ).one())
+
+    def _load(self, db: Session, job_id: UUID, version: Tuple) -> JobMatrix:
+        rows = db.execute(
+            select(Application.id, Resume.embedding).join(
+                Resume, Resume.content_hash == Application.resume_hash
+            ).where(
+                Application.job_id == job_id,
+                Resume.embedding.isnot(None)
+            )
+        ).all()
+
+        application_ids, vectors = [], []
+        for application_id, data in rows:
+            vector = self.embedder.from_bytes(data)
+            if vector is not None:
+                application_ids.append(application_id)
+                vectors.append(vector)
+
+        matrix = stack(vectors, self.embedder.dim)
+        idf = idf_weights(matrix)
+        return JobMatrix(version, application_ids, normalize_rows(matrix * idf), idf)
+
+    def job_matrix(self, db: Session, job_id: UUID) -> JobMatrix:
+        """The job's matrix, rebuilt if its applications changed since it was cached"""
+        version = self._version(db, job_id)
+        with self._lock:
+            entry = self._matrices.get(job_id)
+            if entry is not None and entry.version == version:
+                self._matrices.move_to_end(job_id)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = self._load(db, job_id, version)
+        if entry.nbytes > self.max_bytes:
+            return entry
+        with self._lock:
+            replaced = self._matrices.pop(job_id, None)
+            if replaced is not None:
+                self._total_bytes -= replaced.nbytes
+            self._matrices[job_id] = entry
+            self._total_bytes += entry.nbytes
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._matrices.popitem(last=False)
+                self._total_bytes -= evicted.nbytes
+        return entry
+
+    def rank(self, db: Session, job: Job, k: int) -> List[Tuple[UUID, float]]:
+        """
+        The job's applications closest to the job description
+
+        Args:
+            db: Database session
+            job: Job to rank applications for
+            k: Number of applications to return
+
+        Returns:
+            list: (application id, cosine similarity) pairs, best first
+        """
+        entry = self.job_matrix(db, job.id)
+        query = self.embedder.embed_job(build_job_data(job)) * entry.idf
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        return [(entry.application_ids[row], similarity) for row, similarity in top_k(entry.matrix, query, k)]
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and cached sizes"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "jobs": len(self._matrices),
+                "vectors": sum(len(entry.application_ids) for entry in self._matrices.values()),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
+# Singleton instance
+embedding_index = EmbeddingIndex(text_embedder, max_bytes=settings.embedding_cache_max_bytes)
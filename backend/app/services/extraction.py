@@ -0,0 +1,254 @@
+"""
+Resume text extraction in isolated, resource-limited worker processes
+"""
+import multiprocessing
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from app.ml.resume_parser import resume_parser
+from app.utils.metrics import stage_timer
+from app.config import get_settings
+
+settings = get_settings()
+
+# Seconds a new process may take to import the parsers before the pool gives up
+START_TIMEOUT = 60.0
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class ExtractionError(Exception):
+    """Raised when a document could not be extracted within its limits"""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Raised when extraction exceeds the per-document wall-clock limit"""
+
+
+def _set_memory_limit(memory_limit_mb: int) -> None:
+    if resource is None or memory_limit_mb <= 0:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError) as e:
+        print(f"Could not set extraction memory limit: {e}")
+
+
+def _worker_main(conn, max_pages: Optional[int], memory_limit_mb: int) -> None:
+    """Extraction process loop: receive a file path, send back (status, text or message)"""
+    _set_memory_limit(memory_limit_mb)
+    conn.send(("ready", None))
+    while True:
+        try:
+            file_path = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if file_path is None:
+            break
+
+        try:
+            conn.send(("ok", resume_parser.extract_text(file_path, max_pages)))
+        except MemoryError:
+            conn.send(("memory", "memory limit exceeded"))
+            # The heap may be fragmented past the limit, let the pool replace us
+            break
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+@dataclass
+class _Worker:
+    process: multiprocessing.Process
+    conn: object
+    tasks: int = 0
+
+
+class ExtractionPool:
+    """
+    Pool of processes that extract text from PDF/DOCX files
+
+    Each document gets `timeout` seconds of wall-clock time and at most
+    `max_pages` pages, and each process runs under an address-space limit of
+    `memory_limit_mb`. A process that times out is killed, one that dies or
+    runs out of memory is discarded, and every process is recycled after
+    `max_tasks_per_worker` documents. Processes are started lazily.
+    """
+
+    def __init__(
+        self,
+        processes: int = 0,
+        timeout: float = 20.0,
+        max_pages: Optional[int] = 20,
+        memory_limit_mb: int = 1024,
+        max_tasks_per_worker: int = 100
+    ):
+        self.processes = processes or os.cpu_count() or 1
+        self.timeout = timeout
+        self.max_pages = max_pages or None
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.start_timeout = START_TIMEOUT
+
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._slots: Optional[queue.Queue] = None
+        self._workers = []
+        self._counters = {"extracted": 0, "errors": 0, "timeouts": 0, "recycled": 0}
+
+    def extract_text(self, file_path: str, timeout: Optional[float] = None) -> str:
+        """
+        Extract text from a resume file in a worker process
+
+        Blocks until a worker is free (and started), then for at most
+        `timeout` seconds.
+
+        Raises:
+            ExtractionTimeout: if the document took too long; the worker is killed
+            ExtractionError: if the worker failed or died while extracting
+        """
+        timeout = self.timeout if timeout is None else timeout
+        slots = self._get_slots()
+        worker = slots.get()
+        try:
+            if worker is None or not worker.process.is_alive():
+                self._discard(worker)
+                worker = self._spawn()
+
+            worker.conn.send(file_path)
+            if not worker.conn.poll(timeout):
+                self._discard(worker, kill=True)
+                worker = None
+                self._count("timeouts")
+                raise ExtractionTimeout(f"Extraction exceeded {timeout}s: {os.path.basename(file_path)}")
+
+            try:
+                result, value = worker.conn.recv()
+            except (EOFError, OSError):
+                self._discard(worker)
+                worker = None
+                self._count("errors")
+                raise ExtractionError(f"Extraction worker died: {os.path.basename(file_path)}")
+
+            worker.tasks += 1
+            if result == "memory":
+                self._discard(worker)
+                worker = None
+            if result != "ok":
+                self._count("errors")
+                raise ExtractionError(value)
+
+            self._count("extracted")
+            return value
+        finally:
+            if worker is not None and worker.tasks >= self.max_tasks_per_worker:
+                self._discard(worker)
+                self._count("recycled")
+                worker = None
+            slots.put(worker)
+
+    def extract_and_parse(self, file_path: str) -> Tuple[str, Dict]:
+        """
+        Same contract as parse_cache.extract_and_parse, with extraction in the pool
+
+        Raises:
+            ExtractionError: if the worker timed out, died or failed to start;
+                callers retry or report it rather than parse empty text
+        """
+        with stage_timer("extract"):
+            text = self.extract_text(file_path)
+        with stage_timer("parse"):
+            return text, resume_parser.parse_text(text)
+
+    def shutdown(self) -> None:
+        """Stop all worker processes; the pool restarts on next use"""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._slots = None
+        for worker in workers:
+            self._stop_worker(worker)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            alive = sum(1 for worker in self._workers if worker.process.is_alive())
+            return {**self._counters, "processes": self.processes, "alive": alive}
+
+    def _get_slots(self) -> queue.Queue:
+        with self._lock:
+            if self._slots is None:
+                # None slots are filled with a process on first use; LIFO so
+                # warm processes are reused before new ones are started
+                self._slots = queue.LifoQueue()
+                for _ in range(self.processes):
+                    self._slots.put(None)
+            return self._slots
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.max_pages, self.memory_limit_mb),
+            name="resume-extraction",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        worker = _Worker(process=process, conn=parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+
+        # Don't charge interpreter start-up to the first document's timeout
+        try:
+            ready = parent_conn.poll(self.start_timeout) and parent_conn.recv()[0] == "ready"
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            self._discard(worker, kill=True)
+            raise ExtractionError("Extraction worker failed to start")
+        return worker
+
+    def _discard(self, worker: Optional[_Worker], kill: bool = False) -> None:
+        if worker is None:
+            return
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        self._stop_worker(worker, kill)
+
+    def _stop_worker(self, worker: _Worker, kill: bool = False) -> None:
+        process = worker.process
+        if not kill and process.is_alive():
+            try:
+                worker.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            process.join(1)
+
+        if process.is_alive():
+            process.terminate()
+            process.join(1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        worker.conn.close()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+# Singleton instance
+extraction_pool = ExtractionPool(
+    processes=settings.extraction_processes,
+    timeout=settings.extraction_timeout_seconds,
+    max_pages=settings.extraction_max_pages,
+    memory_limit_mb=settings.extraction_memory_limit_mb,
+    max_tasks_per_worker=settings.extraction_max_tasks_per_worker
+)
@@ -0,0 +1,53 @@
+"""
+Job queries and responses shared by the sync and async job routes
+"""
+from typing import Dict, Optional
+from uuid import UUID
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+from app.models.job import Job
+from app.models.application import Application
+from app.schemas.job import JobResponse
+
+
+def application_counts_statement(*filters) -> Select:
+    """Application counts per job and status in a single GROUP BY query"""
+    return select(
+        Application.job_id,
+        Application.status,
+        func.count(Application.id)
+    ).join(
+        Job, Job.id == Application.job_id
+    ).where(*filters).group_by(
+        Application.job_id, Application.status
+    )
+
+
+def application_counts(db: Session, *filters) -> Dict[UUID, Dict[str, int]]:
+    return group_counts(db.execute(application_counts_statement(*filters)).all())
+
+
+def group_counts(rows) -> Dict[UUID, Dict[str, int]]:
+    counts: Dict[UUID, Dict[str, int]] = {}
+    for job_id, app_status, count in rows:
+        counts.setdefault(job_id, {})[app_status] = count
+    return counts
+
+
+def job_response(job: Job, counts_by_status: Optional[Dict[str, int]] = None) -> JobResponse:
+    counts_by_status = counts_by_status or {}
+    return JobResponse(
+        id=job.id,
+        title=job.title,
+        description=job.description,
+        requirements=job.requirements,
+        skills=job.skills or [],
+        min_experience=job.min_experience,
+        cascade_min_rule_score=job.cascade_min_rule_score,
+        cascade_top_k=job.cascade_top_k,
+        public_link=job.public_link,
+        status=job.status,
+        created_at=job.created_at,
+        applications_count=sum(counts_by_status.values()),
+        applications_by_status=counts_by_status
+    )
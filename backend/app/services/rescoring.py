@@ -0,0 +1,213 @@
+"""
+Bulk re-scoring of a job's applications after its requirements change
+"""
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from uuid import UUID
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.job import Job
+from app.models.application import Application
+from app.models.resume import Resume
+from app.ml.scorer import scorer
+from app.services.scoring import (
+    build_job_data,
+    build_score_breakdown,
+    higher_rule_scores_counters,
+    rule_score_of,
+    score_resumes
+)
+from app.services.resumes import merge_resume_data, resume_data_columns
+from app.services.search import search_fields
+from app.config import get_settings
+
+settings = get_settings()
+
+# Applications the scoring worker still has to score
+QUEUED_STATUSES = ("pending", "processing")
+
+
+@dataclass
+class RescoreProgress:
+    """Progress of a re-scoring run for one job"""
+    job_id: UUID
+    use_ai: bool = False
+    status: str = "running"  # running, completed, failed
+    total: int = 0
+    processed: int = 0
+    updated: int = 0
+    skipped: int = 0
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+_progress: Dict[UUID, RescoreProgress] = {}
+_progress_lock = threading.Lock()
+
+
+def get_rescore_progress(job_id: UUID) -> Optional[RescoreProgress]:
+    """Return the latest re-scoring run for a job in this process"""
+    with _progress_lock:
+        return _progress.get(job_id)
+
+
+def start_rescore(job_id: UUID, use_ai: bool = False) -> Optional[RescoreProgress]:
+    """
+    Register a new run, replacing any finished one for the job
+
+    The check and the registration happen under one lock, so concurrent
+    callers cannot both start a run.
+
+    Returns:
+        RescoreProgress of the new run, or None if one is already running
+    """
+    with _progress_lock:
+        current = _progress.get(job_id)
+        if current is not None and current.status == "running":
+            return None
+        progress = RescoreProgress(job_id=job_id, use_ai=use_ai)
+        _progress[job_id] = progress
+    return progress
+
+
+def rescore_job(
+    db: Session,
+    job: Job,
+    use_ai: bool = False,
+    chunk_size: Optional[int] = None,
+    progress: Optional[RescoreProgress] = None,
+    on_progress: Optional[Callable[[RescoreProgress], None]] = None
+) -> RescoreProgress:
+    """
+    Re-score every scored application of a job from its stored parsed resume
+
+    Applications are read in primary-key order in chunks of `chunk_size`,
+    selecting only id and the parsed resume (joined from resumes), and each
+    chunk is written back with one executemany UPDATE and a single commit.
+    Applications still waiting for the worker (pending or processing) are
+    counted as skipped and left alone; the worker scores them against the
+    current job.
+
+    Args:
+        db: Database session
+        job: Job whose applications should be re-scored
+        use_ai: Use the AI analyzer (when configured, several resumes per
+            request) instead of the rule-based scorer
+        chunk_size: Applications per chunk, defaults to settings.rescore_chunk_size
+        progress: Progress record to update, created if not given
+        on_progress: Called after every chunk
+
+    Returns:
+        The final progress record
+    """
+    chunk_size = chunk_size or settings.rescore_chunk_size
+    progress = progress or start_rescore(job.id, use_ai)
+    job_data = build_job_data(job)
+    started = time.perf_counter()
+
+    try:
+        queued = Application.scoring_status.in_(QUEUED_STATUSES)
+        progress.total, queued_count = db.query(
+            func.count(Application.id),
+            func.count(case((queued, 1)))
+        ).filter(Application.job_id == job.id).one()
+        progress.processed += queued_count
+        progress.skipped += queued_count
+
+        base_query = db.query(Application.id, *resume_data_columns()).outerjoin(
+            Resume, Resume.content_hash == Application.resume_hash
+        ).filter(
+            Application.job_id == job.id,
+            Application.scoring_status.notin_(QUEUED_STATUSES)
+        )
+
+        last_id = None
+        while True:
+            query = base_query
+            if last_id is not None:
+                query = query.filter(Application.id > last_id)
+            rows = query.order_by(Application.id).limit(chunk_size).all()
+            if not rows:
+                break
+
+            resumes = [(application_id, merge_resume_data(*columns)) for application_id, *columns in rows]
+            scored = [(application_id, resume_parsed) for application_id, resume_parsed in resumes
+                      if resume_parsed is not None]
+            # Applications without a resumes row keep their parsed resume inline
+            inline = {application_id for application_id, _, parsed, _, legacy in rows
+                      if parsed is None and legacy is not None}
+            progress.skipped += len(rows) - len(scored)
+
+            if use_ai:
+                results = score_resumes(
+                    [dict(resume_parsed) for _, resume_parsed in scored],
+                    job_data,
+                    higher_rule_scores=higher_rule_scores_counters(
+                        db, job_data, job.id, [application_id for application_id, _ in scored]
+                    )
+                )
+            else:
+                score_results = scorer.score_many([resume_parsed for _, resume_parsed in scored], job_data)
+                results = [(resume_parsed, score_result)
+                           for (_, resume_parsed), score_result in zip(scored, score_results)]
+
+            updates = []
+            for (application_id, _), (resume_data, score_result) in zip(scored, results):
+                values = {
+                    "id": application_id,
+                    "ai_score": score_result["final_score"],
+                    "rule_score": rule_score_of(score_result),
+                    "score_breakdown": build_score_breakdown(score_result),
+                    "explanation": score_result["explanation"],
+                    "scoring_status": "completed",
+                    **search_fields(resume_data, score_result)
+                }
+                if use_ai and application_id in inline:
+                    values["resume_parsed"] = resume_data
+                updates.append(values)
+
+            if updates:
+                db.execute(update(Application), updates)
+            db.commit()
+
+            progress.processed += len(rows)
+            progress.updated += len(updates)
+            progress.elapsed_seconds = round(time.perf_counter() - started, 3)
+            last_id = rows[-1][0]
+
+            if on_progress:
+                on_progress(progress)
+
+        progress.status = "completed"
+    except Exception as e:
+        db.rollback()
+        progress.status = "failed"
+        progress.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        progress.elapsed_seconds = round(time.perf_counter() - started, 3)
+        progress.finished_at = datetime.utcnow()
+
+    return progress
+
+
+def run_rescore_in_background(job_id: UUID, progress: RescoreProgress) -> None:
+    """Re-score with a fresh session after the response has been sent"""
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job:
+            rescore_job(db, job, use_ai=progress.use_ai, progress=progress)
+    except Exception as e:
+        print(f"Rescore error for job {job_id}: {e}")
+    finally:
+        db.close()
@@ -0,0 +1,268 @@
+"""
+Shared resume storage: one resumes row per file content hash
+
+Applications reference their resume by resume_hash, so a file sent to
+several jobs is extracted, parsed, indexed for text search and embedded
+once, and the applications table only carries scores, skills and
+experience. Rows stored before the resumes table keep their parsed resume
+inline until migrate_resumes moves it over.
+"""
+import hashlib
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+from sqlalchemy import func, inspect, null, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.db.database import engine
+from app.ml.embeddings import text_embedder
+from app.ml.parse_cache import sha256_file
+from app.ml.resume_parser import PARSER_VERSION
+from app.models.application import Application
+from app.models.resume import Resume
+from app.config import get_settings
+
+settings = get_settings()
+
+# parser_version of rows moved from applications.resume_parsed; they are
+# re-parsed the next time their application is scored
+LEGACY_PARSER_VERSION = "legacy"
+
+# Per-file search columns that applications carried before resumes had them
+LEGACY_APPLICATION_INDEXES = ("ix_applications_search_vector",)
+LEGACY_APPLICATION_COLUMNS = ("search_vector", "embedding")
+
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
+    """Lowercase, whitespace-collapsed skills without duplicates, in first-seen order"""
+    normalized = (" ".join(skill.lower().split()) for skill in skills if isinstance(skill, str))
+    return list(dict.fromkeys(skill for skill in normalized if skill))
+
+
+def search_document(resume_data: Dict) -> str:
+    """Text indexed for full-text search: name, resume text and skills"""
+    skills = normalize_skills(resume_data.get("skills") or [])
+    parts = [resume_data.get("name"), resume_data.get("raw_text"), ", ".join(skills)]
+    return "\n".join(part for part in parts if part).lower()
+
+
+def resume_search_columns(resume_data: Dict) -> Dict:
+    """search_vector and embedding column values of a parsed resume"""
+    return {
+        "search_vector": search_document(resume_data),
+        "embedding": text_embedder.to_bytes(text_embedder.embed_resume(resume_data))
+    }
+
+
+def resume_row(content_hash: str, resume_data: Dict, parser_version: str = PARSER_VERSION) -> Dict:
+    """Column values of the resumes row for a parsed resume"""
+    parsed = {key: value for key, value in resume_data.items() if key != "raw_text"}
+    return {
+        "content_hash": content_hash,
+        "parser_version": parser_version,
+        "text": resume_data.get("raw_text") or "",
+        "parsed": parsed,
+        **resume_search_columns(resume_data)
+    }
+
+
+def store_resumes(db: Session, rows: Iterable[Dict], overwrite: bool = True) -> None:
+    """
+    Insert resumes rows in one executemany, replacing rows with the same hash
+    (or keeping them when `overwrite` is False)
+    """
+    rows = list({row["content_hash"]: row for row in rows}.values())
+    if not rows:
+        return
+
+    now = datetime.utcnow()
+    rows = [{**row, "created_at": now, "updated_at": now} for row in rows]
+    insert = postgresql.insert if engine.dialect.name == "postgresql" else sqlite.insert
+    statement = insert(Resume)
+    if overwrite:
+        statement = statement.on_conflict_do_update(
+            index_elements=[Resume.content_hash],
+            set_={
+                "parser_version": statement.excluded.parser_version,
+                "text": statement.excluded.text,
+                "parsed": statement.excluded.parsed,
+                "search_vector": statement.excluded.search_vector,
+                "embedding": statement.excluded.embedding,
+                "updated_at": statement.excluded.updated_at
+            }
+        )
+    else:
+        statement = statement.on_conflict_do_nothing(index_elements=[Resume.content_hash])
+    db.execute(statement, rows)
+
+
+def store_resume(db: Session, content_hash: str, resume_data: Dict) -> None:
+    """Store a freshly parsed resume unless parsing failed"""
+    if not resume_data.get("error"):
+        store_resumes(db, [resume_row(content_hash, resume_data)])
+
+
+def stored_resume(db: Session, content_hash: Optional[str]) -> Optional[Dict]:
+    """The stored parse of a file by the current parser version, if any"""
+    if not content_hash:
+        return None
+    resume = db.scalar(select(Resume).where(
+        Resume.content_hash == content_hash,
+        Resume.parser_version == PARSER_VERSION
+    ))
+    return resume.data() if resume else None
+
+
+def merge_resume_data(
+    text: Optional[str],
+    parsed: Optional[Dict],
+    years_of_experience: Optional[int],
+    legacy: Optional[Dict] = None
+) -> Optional[Dict]:
+    """
+    An application's parsed resume from its resumes row and its own years of
+    experience, or its inline legacy copy when it has no resumes row
+
+    Returns:
+        dict: Same shape as ResumeParser.parse, or None if never parsed
+    """
+    if parsed is None:
+        return legacy
+    data = {"raw_text": text or "", **parsed}
+    if years_of_experience is not None:
+        data["years_of_experience"] = years_of_experience
+    return data
+
+
+def application_resume_data(application: Application) -> Optional[Dict]:
+    """Parsed resume of a loaded application (lazy-loads its resumes row)"""
+    resume = application.resume
+    if resume is None:
+        return application.resume_parsed
+    return merge_resume_data(resume.text, resume.parsed, application.years_of_experience)
+
+
+def resume_data_columns() -> List:
+    """Columns for merge_resume_data, selected over an outer join to resumes"""
+    return [Resume.text, Resume.parsed, Application.years_of_experience, Application.resume_parsed]
+
+
+def table_bytes(db: Session, table: str) -> Optional[int]:
+    """On-disk size of a table with its indexes and TOAST data (Postgres only)"""
+    if engine.dialect.name != "postgresql":
+        return None
+    return db.scalar(select(func.pg_total_relation_size(table)))
+
+
+def migrate_resumes(
+    db: Session,
+    chunk_size: Optional[int] = None,
+    on_progress: Optional[Callable[[int, float], None]] = None
+) -> Dict:
+    """
+    Move parsed resumes stored inline on applications into the resumes table
+
+    Applications with a resume_parsed value are read in primary-key order
+    in chunks. Each resume is stored once per file hash (existing rows are
+    kept), applications without a hash get one from their file, or from
+    their text if the file is gone, the application's years of experience
+    is kept on the application, and resume_parsed is cleared. Each chunk is
+    one transaction, so the migration can be interrupted and re-run. Last,
+    the search columns older versions kept on applications are dropped
+    (see drop_legacy_search_columns).
+
+    Returns:
+        dict: Applications migrated, resumes rows in total, legacy columns
+        dropped and, on Postgres, the applications table size before and after
+    """
+    chunk_size = chunk_size or settings.rescore_chunk_size
+    started = time.perf_counter()
+    size_before = table_bytes(db, "applications")
+    migrated = 0
+
+    last_id = None
+    while True:
+        query = db.query(
+            Application.id,
+            Application.resume_hash,
+            Application.resume_path,
+            Application.resume_parsed,
+            Application.years_of_experience
+        ).filter(Application.resume_parsed.isnot(None))
+        if last_id is not None:
+            query = query.filter(Application.id > last_id)
+        rows = query.order_by(Application.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        resume_rows = []
+        updates = []
+        for application_id, content_hash, resume_path, resume_parsed, years in rows:
+            content_hash = content_hash or _legacy_hash(resume_path, resume_parsed)
+            resume_rows.append(resume_row(content_hash, resume_parsed, LEGACY_PARSER_VERSION))
+
+            # The inline copy carried the form-entered or AI-extracted years
+            parsed_years = resume_parsed.get("years_of_experience")
+            if years is None and isinstance(parsed_years, (int, float)):
+                years = int(parsed_years)
+            updates.append({"id": application_id, "resume_hash": content_hash, "years_of_experience": years})
+
+        store_resumes(db, resume_rows, overwrite=False)
+        db.execute(update(Application), updates)
+        db.execute(
+            update(Application).where(Application.id.in_([row[0] for row in rows])).values(resume_parsed=null())
+        )
+        db.commit()
+
+        migrated += len(rows)
+        last_id = rows[-1][0]
+        if on_progress:
+            on_progress(migrated, round(time.perf_counter() - started, 3))
+
+    dropped = drop_legacy_search_columns(db)
+
+    return {
+        "applications": migrated,
+        "resumes": db.scalar(select(func.count()).select_from(Resume)),
+        "dropped_columns": dropped,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        "applications_bytes_before": size_before,
+        "applications_bytes_after": table_bytes(db, "applications")
+    }
+
+
+def drop_legacy_search_columns(db: Session) -> List[str]:
+    """
+    Drop the per-file search columns (search_vector, embedding) that older
+    versions stored on every application; resumes rows carry them now, and
+    index-search fills those of rows stored before
+
+    Returns:
+        list: The columns dropped (empty when there were none)
+    """
+    existing = {column["name"] for column in inspect(db.connection()).get_columns("applications")}
+    dropped = [column for column in LEGACY_APPLICATION_COLUMNS if column in existing]
+    if not dropped:
+        return []
+
+    quote = engine.dialect.identifier_preparer.quote
+    for index in LEGACY_APPLICATION_INDEXES:
+        db.execute(text(f"DROP INDEX IF EXISTS {quote(index)}"))
+    for column in dropped:
+        db.execute(text(f"ALTER TABLE applications DROP COLUMN {quote(column)}"))
+    db.commit()
+    return dropped
+
+
+def vacuum_applications() -> None:
+    """Rewrite the applications table to release the space freed by migrate_resumes"""
+    statement = "VACUUM FULL applications" if engine.dialect.name == "postgresql" else "VACUUM"
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(statement))
+
+
+def _legacy_hash(resume_path: Optional[str], resume_parsed: Dict) -> str:
+    if resume_path and os.path.exists(resume_path):
+        return sha256_file(resume_path)
+    return hashlib.sha256((resume_parsed.get("raw_text") or "").encode("utf-8")).hexdigest()
@@ -0,0 +1,286 @@
+"""
+Resume scoring pipeline shared by the background worker and batch jobs
+"""
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import desc, select
+from sqlalchemy.orm import Session
+from app.models.job import Job
+from app.models.application import Application
+from app.ml.scorer import scorer
+from app.ml.ai_analyzer import ai_analyzer
+from app.ml.condenser import resume_condenser
+from app.services.search import search_fields
+from app.utils.metrics import (
+    cascade_decisions,
+    cascade_saved_seconds,
+    resume_tokens,
+    scoring_results,
+    stage_duration,
+    stage_timer
+)
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def build_job_data(job: Job) -> Dict:
+    """Build the job requirements dict consumed by the scorers"""
+    return {
+        "title": job.title,
+        "description": job.description,
+        "requirements": job.requirements,
+        "skills": job.skills or [],
+        "min_experience": job.min_experience,
+        # Scoring cascade gates, falling back to the global defaults
+        "cascade_min_rule_score": _first_set(job.cascade_min_rule_score, settings.scoring_cascade_min_rule_score),
+        "cascade_top_k": _first_set(job.cascade_top_k, settings.scoring_cascade_top_k)
+    }
+
+
+def _first_set(*values):
+    return next((value for value in values if value is not None), None)
+
+
+def cascade_decision(
+    rule_score: float,
+    job_data: Dict,
+    higher_rule_scores: Optional[Callable[[float], int]] = None
+) -> Optional[str]:
+    """
+    Whether a candidate goes on to AI analysis given its rule-based score
+
+    A candidate is shortlisted when it passes every gate the job sets: a
+    minimum rule score and/or a place in the job's running top-K by rule
+    score. The top-K gate needs `higher_rule_scores`, which counts the job's
+    other applications with a higher rule score.
+
+    Returns:
+        None when the job sets no gates, otherwise "shortlisted",
+        "below_min_score" or "outside_top_k"
+    """
+    min_score = job_data.get("cascade_min_rule_score")
+    top_k = job_data.get("cascade_top_k")
+    if top_k is not None and higher_rule_scores is None:
+        top_k = None
+    if min_score is None and top_k is None:
+        return None
+
+    if min_score is not None and rule_score < min_score:
+        return "below_min_score"
+    if top_k is not None and higher_rule_scores(rule_score) >= top_k:
+        return "outside_top_k"
+    return "shortlisted"
+
+
+def higher_rule_scores_counters(
+    db: Session,
+    job_data: Dict,
+    job_id: UUID,
+    application_ids: Sequence[UUID]
+) -> List[Optional[Callable[[float], int]]]:
+    """
+    Per application, a counter of the job's other applications with a
+    higher rule score, for the cascade's top-K gate
+
+    All counters share one query, made on first use, for the job's
+    top_k + 1 best rule scores: enough to count exactly up to top_k, which
+    is all the gate compares against. None when the job sets no top-K gate.
+    """
+    top_k = job_data.get("cascade_top_k")
+    if top_k is None:
+        return [None] * len(application_ids)
+
+    best: List[Tuple[UUID, float]] = []
+    loaded = False
+
+    def best_rule_scores() -> List[Tuple[UUID, float]]:
+        nonlocal best, loaded
+        if not loaded:
+            best = db.execute(select(Application.id, Application.rule_score).where(
+                Application.job_id == job_id,
+                Application.rule_score.isnot(None)
+            ).order_by(desc(Application.rule_score)).limit(top_k + 1)).all()
+            loaded = True
+        return best
+
+    def counter(application_id: UUID) -> Callable[[float], int]:
+        def count(rule_score: float) -> int:
+            return sum(1 for other_id, score in best_rule_scores() if other_id != application_id and score > rule_score)
+        return count
+
+    return [counter(application_id) for application_id in application_ids]
+
+
+def score_resume(
+    resume_data: Dict,
+    job_data: Dict,
+    years_of_experience: Optional[int] = None,
+    higher_rule_scores: Optional[Callable[[float], int]] = None
+) -> Tuple[Dict, Dict]:
+    """
+    Score parsed resume data against a job
+
+    The rule-based score is always computed (it is cheap) and kept as
+    "rule_score". When AI is configured, it only scores candidates the
+    job's cascade shortlists; the rest keep their rule-based score.
+
+    Args:
+        resume_data: Output of ResumeParser.parse
+        job_data: Output of build_job_data
+        years_of_experience: Value entered on the application form, if any
+        higher_rule_scores: Counts the job's other applications with a higher
+            rule score, for the cascade's top-K gate (see higher_rule_scores_counters)
+
+    Returns:
+        tuple: (resume_data, score_result)
+    """
+    return score_resumes([resume_data], job_data, [years_of_experience], [higher_rule_scores])[0]
+
+
+def score_resumes(
+    resumes: Sequence[Dict],
+    job_data: Dict,
+    years_of_experience: Optional[Sequence[Optional[int]]] = None,
+    higher_rule_scores: Optional[Sequence[Optional[Callable[[float], int]]]] = None
+) -> List[Tuple[Dict, Dict]]:
+    """
+    Score several parsed resumes against the same job
+
+    Like score_resume, but the shortlisted resumes are analyzed together
+    with AIAnalyzer.analyze_batch, several per LLM request.
+
+    Args:
+        resumes: Outputs of ResumeParser.parse
+        job_data: Output of build_job_data
+        years_of_experience: Form value per resume, if any
+        higher_rule_scores: Per-resume counters for the cascade's top-K gate
+
+    Returns:
+        list: (resume_data, score_result) per resume, in order
+    """
+    years_of_experience = years_of_experience or [None] * len(resumes)
+    higher_rule_scores = higher_rule_scores or [None] * len(resumes)
+
+    rule_results, decisions, shortlisted = [], [], []
+    for i, (resume_data, years) in enumerate(zip(resumes, years_of_experience)):
+        # Use form years_of_experience if provided, otherwise use parsed value
+        if years is not None:
+            resume_data["years_of_experience"] = years
+
+        with stage_timer("score_rules"):
+            rule_results.append(scorer.score(resume_data, job_data))
+
+        decision = None
+        # Use AI analyzer if available and the cascade lets the candidate through
+        if ai_analyzer.is_available() and resume_data.get("raw_text"):
+            decision = cascade_decision(rule_results[i]["final_score"], job_data, higher_rule_scores[i])
+            if decision in (None, "shortlisted"):
+                shortlisted.append(i)
+            else:
+                record_skipped_analysis()
+            cascade_decisions.inc(decision=decision or "disabled")
+        decisions.append(decision)
+
+    ai_results = {}
+    if shortlisted:
+        texts = [analysis_text(resumes[i]) for i in shortlisted]
+        started = time.perf_counter()
+        if len(texts) == 1:
+            analyses = [ai_analyzer.analyze_resume(texts[0], job_data)]
+        else:
+            analyses = ai_analyzer.analyze_batch(texts, job_data)
+        # Each resume's share of the batch, so score_ai stays a per-resume time
+        share = (time.perf_counter() - started) / len(texts)
+        for i, analysis in zip(shortlisted, analyses):
+            stage_duration.observe(share, stage="score_ai")
+            ai_results[i] = analysis
+
+    scored = []
+    for i, resume_data in enumerate(resumes):
+        score_result = ai_results.get(i, rule_results[i])
+        # Update resume_data with AI-extracted experience if not provided
+        if i in ai_results and years_of_experience[i] is None and score_result.get("years_of_experience"):
+            resume_data["years_of_experience"] = score_result["years_of_experience"]
+
+        score_result = {**score_result, "rule_score": rule_results[i]["final_score"], "cascade": decisions[i]}
+        scoring_results.inc(method=scoring_method(score_result, ai_attempted=i in shortlisted))
+        scored.append((resume_data, score_result))
+
+    return scored
+
+
+def analysis_text(resume_data: Dict) -> str:
+    """
+    Resume text for AI analysis, condensed from the stored raw_text on first
+    use; only resumes the cascade sends to AI pay for condensation. Parses
+    stored by earlier versions may already carry the condensed fields.
+    """
+    if resume_data.get("condensed_text") is None:
+        resume_data.update(resume_condenser.fields(resume_data.get("raw_text") or ""))
+    resume_tokens.inc(resume_data["text_tokens"], type="original")
+    resume_tokens.inc(resume_data["condensed_tokens"], type="condensed")
+    return resume_data["condensed_text"]
+
+
+def record_skipped_analysis(count: int = 1) -> None:
+    """Count AI analyses the cascade avoided, at the mean observed AI scoring time"""
+    calls = stage_duration.count(stage="score_ai")
+    if calls:
+        cascade_saved_seconds.inc(count * stage_duration.sum(stage="score_ai") / calls)
+
+
+def scoring_method(score_result: Dict, ai_attempted: bool) -> str:
+    """
+    How a result was produced: ai, ai_cached, cascade (AI skipped by the
+    cascade), fallback (AI attempted and failed) or rules (AI not configured,
+    or no resume text to analyze)
+    """
+    if score_result.get("ai_powered"):
+        return "ai_cached" if score_result.get("cached") else "ai"
+    if score_result.get("cascade") in ("below_min_score", "outside_top_k"):
+        return "cascade"
+    return "fallback" if ai_attempted else "rules"
+
+
+def rule_score_of(score_result: Dict) -> Optional[float]:
+    """Rule-based score of a result; results straight from Scorer are their own"""
+    if "rule_score" in score_result:
+        return score_result["rule_score"]
+    return None if score_result.get("ai_powered") else score_result["final_score"]
+
+
+def build_score_breakdown(score_result: Dict) -> Dict:
+    """Build full score breakdown with all AI analysis data"""
+    return {
+        **score_result.get("score_breakdown", {}),
+        "matched_skills": score_result.get("matched_skills", []),
+        "missing_skills": score_result.get("missing_skills", []),
+        "strengths": score_result.get("strengths", []),
+        "concerns": score_result.get("concerns", []),
+        "ai_powered": score_result.get("ai_powered", False),
+        "ai_cached": score_result.get("cached", False),
+        # Which tier produced the final score, and why
+        "tier": "ai" if score_result.get("ai_powered") else "rules",
+        "rule_score": rule_score_of(score_result),
+        "cascade": score_result.get("cascade")
+    }
+
+
+def apply_score(application: Application, resume_data: Dict, score_result: Dict) -> None:
+    """
+    Store score results on an application
+
+    The parsed resume itself lives in the resumes row of the file's hash;
+    only applications without a hash keep it inline.
+    """
+    if application.resume_hash is None:
+        application.resume_parsed = resume_data
+    application.ai_score = score_result["final_score"]
+    application.rule_score = rule_score_of(score_result)
+    application.score_breakdown = build_score_breakdown(score_result)
+    application.explanation = score_result["explanation"]
+    application.scoring_status = "completed"
+    for column, value in search_fields(resume_data, score_result).items():
+        setattr(application, column, value)
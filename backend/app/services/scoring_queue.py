@@ -0,0 +1,200 @@
+"""
+Queues of applications waiting for resume parsing and scoring
+"""
+import queue
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.scoring_task import ScoringTask
+from app.config import get_settings
+
+settings = get_settings()
+
+
+@dataclass
+class ScoringJob:
+    """A unit of scoring work handed to the worker"""
+    application_id: UUID
+    years_of_experience: Optional[int] = None
+    attempts: int = 1
+    task_id: Optional[UUID] = None
+
+
+class ScoringQueue(ABC):
+    """Interface for scoring queues"""
+
+    @abstractmethod
+    def enqueue(self, db: Session, application_id: UUID, years_of_experience: Optional[int] = None) -> None:
+        """Queue an application; the job becomes visible when `db` commits"""
+
+    @abstractmethod
+    def claim(self) -> Optional[ScoringJob]:
+        """Take the next job off the queue, or None if there is nothing to do"""
+
+    @abstractmethod
+    def complete(self, job: ScoringJob) -> None:
+        """Mark a job as done"""
+
+    @abstractmethod
+    def retry(self, job: ScoringJob, error: str, delay: float) -> None:
+        """Put a failed job back on the queue after `delay` seconds"""
+
+    @abstractmethod
+    def fail(self, job: ScoringJob, error: str) -> None:
+        """Give up on a job"""
+
+    def recover(self) -> int:
+        """Re-queue jobs left running by a previous process, return count"""
+        return 0
+
+
+class InMemoryScoringQueue(ScoringQueue):
+    """
+    Process-local queue, used for tests and single-process setups
+
+    Jobs wait in the enqueuing session's info until it commits; a rollback
+    discards them, so a job never points at an application that was not
+    saved.
+    """
+
+    PENDING_KEY = "scoring_queue_pending"
+
+    def __init__(self):
+        self._queue: "queue.Queue[ScoringJob]" = queue.Queue()
+        self.failed: list = []
+        # Bound once so the session listeners can be found again
+        self._on_commit = self._publish_pending
+        self._on_rollback = self._discard_pending
+
+    def enqueue(self, db: Session, application_id: UUID, years_of_experience: Optional[int] = None) -> None:
+        job = ScoringJob(application_id=application_id, years_of_experience=years_of_experience)
+        db.info.setdefault(self.PENDING_KEY, []).append(job)
+        if not event.contains(db, "after_commit", self._on_commit):
+            event.listen(db, "after_commit", self._on_commit)
+            event.listen(db, "after_soft_rollback", self._on_rollback)
+
+    def _publish_pending(self, session: Session) -> None:
+        for job in session.info.pop(self.PENDING_KEY, []):
+            self._queue.put(job)
+
+    def _discard_pending(self, session: Session, previous_transaction) -> None:
+        # Soft rollbacks fire even when no SQL was sent; savepoints keep the outer jobs
+        if not previous_transaction.nested:
+            session.info.pop(self.PENDING_KEY, None)
+
+    def claim(self) -> Optional[ScoringJob]:
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def complete(self, job: ScoringJob) -> None:
+        pass
+
+    def retry(self, job: ScoringJob, error: str, delay: float) -> None:
+        job.attempts += 1
+        self._queue.put(job)
+
+    def fail(self, job: ScoringJob, error: str) -> None:
+        self.failed.append((job, error))
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+
+class DatabaseScoringQueue(ScoringQueue):
+    """Durable queue stored in the scoring_tasks table"""
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+
+    def enqueue(self, db: Session, application_id: UUID, years_of_experience: Optional[int] = None) -> None:
+        db.add(ScoringTask(
+            application_id=application_id,
+            years_of_experience=years_of_experience
+        ))
+
+    def claim(self) -> Optional[ScoringJob]:
+        db = self.session_factory()
+        try:
+            task = db.query(ScoringTask).filter(
+                ScoringTask.status == "queued",
+                ScoringTask.available_at <= datetime.utcnow()
+            ).order_by(
+                ScoringTask.available_at
+            ).with_for_update(skip_locked=True).first()
+
+            if not task:
+                db.rollback()
+                return None
+
+            task.status = "running"
+            task.attempts += 1
+            db.commit()
+
+            return ScoringJob(
+                application_id=task.application_id,
+                years_of_experience=task.years_of_experience,
+                attempts=task.attempts,
+                task_id=task.id
+            )
+        finally:
+            db.close()
+
+    def complete(self, job: ScoringJob) -> None:
+        db = self.session_factory()
+        try:
+            db.query(ScoringTask).filter(ScoringTask.id == job.task_id).delete()
+            db.commit()
+        finally:
+            db.close()
+
+    def retry(self, job: ScoringJob, error: str, delay: float) -> None:
+        self._update(
+            job,
+            status="queued",
+            last_error=error,
+            available_at=datetime.utcnow() + timedelta(seconds=delay)
+        )
+
+    def fail(self, job: ScoringJob, error: str) -> None:
+        self._update(job, status="failed", last_error=error)
+
+    def recover(self) -> int:
+        db = self.session_factory()
+        try:
+            count = db.query(ScoringTask).filter(
+                ScoringTask.status == "running"
+            ).update({"status": "queued"}, synchronize_session=False)
+            db.commit()
+            return count
+        finally:
+            db.close()
+
+    def _update(self, job: ScoringJob, **values) -> None:
+        db = self.session_factory()
+        try:
+            db.query(ScoringTask).filter(
+                ScoringTask.id == job.task_id
+            ).update(values, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+
+def create_scoring_queue(backend: str) -> ScoringQueue:
+    """Create a scoring queue for the configured backend"""
+    if backend == "memory":
+        return InMemoryScoringQueue()
+    if backend == "database":
+        return DatabaseScoringQueue()
+    raise ValueError(f"Unknown scoring queue backend: {backend}")
+
+
+# Singleton instance
+scoring_queue = create_scoring_queue(settings.scoring_queue_backend)
@@ -0,0 +1,263 @@
+"""
+Background worker that parses and scores queued applications
+"""
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, List, Optional
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.application import Application
+from app.ml.parse_cache import extract_and_parse, parse_cache
+from app.services.extraction import ExtractionError, ExtractionPool, extraction_pool
+from app.services.resumes import store_resume, stored_resume
+from app.ml.ai_analyzer import ai_analyzer
+from app.services.scoring import build_job_data, higher_rule_scores_counters, score_resume, score_resumes, apply_score
+from app.services.scoring_queue import ScoringQueue, ScoringJob, scoring_queue
+from app.utils.metrics import stage_timer
+from app.config import get_settings
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class ScoringWorker:
+    """Drain a ScoringQueue, extracting resume text in an ExtractionPool"""
+
+    def __init__(
+        self,
+        queue: ScoringQueue,
+        session_factory: Callable[[], Session] = SessionLocal,
+        threads: int = 2,
+        extractor: Optional[ExtractionPool] = None,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3
+    ):
+        self.queue = queue
+        self.session_factory = session_factory
+        self.threads = threads
+        self.extractor = extractor
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start worker threads; extraction processes start on first use"""
+        if self._threads:
+            return
+
+        self._stop.clear()
+
+        recovered = self.queue.recover()
+        if recovered:
+            logger.info("Re-queued %d interrupted scoring tasks", recovered)
+
+        for i in range(self.threads):
+            thread = threading.Thread(target=self._run, name=f"scoring-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop worker threads and shut down the extraction processes"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+        if self.extractor:
+            self.extractor.shutdown()
+
+    def run_pending(self) -> int:
+        """Process queued jobs on the calling thread until the queue is empty"""
+        processed = 0
+        while self.run_once():
+            processed += 1
+        return processed
+
+    def run_once(self) -> bool:
+        """
+        Claim and process queued jobs, return False if the queue was empty
+
+        With AI configured, up to `ai_batch_size` jobs are claimed at once so
+        resumes for the same job share LLM requests. If the batch fails, each
+        job is processed on its own with the usual retry handling.
+        """
+        job = self.queue.claim()
+        if job is None:
+            return False
+
+        jobs = [job]
+        if settings.ai_batch_size > 1 and ai_analyzer.is_available():
+            while len(jobs) < settings.ai_batch_size:
+                job = self.queue.claim()
+                if job is None:
+                    break
+                jobs.append(job)
+
+        if len(jobs) > 1:
+            try:
+                with stage_timer("scoring_batch"):
+                    unreadable = self.process_batch(jobs)
+                for job in jobs:
+                    if job not in unreadable:
+                        self.queue.complete(job)
+                jobs = unreadable
+            except Exception:
+                logger.exception("Batch scoring error, scoring %d applications one by one", len(jobs))
+
+        for job in jobs:
+            self._run_job(job)
+        return True
+
+    def _run_job(self, job: ScoringJob) -> None:
+        try:
+            with stage_timer("scoring_job"):
+                self.process(job)
+            self.queue.complete(job)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.warning("Scoring error for application %s: %s", job.application_id, error)
+            if job.attempts < self.max_attempts:
+                self.queue.retry(job, error, delay=self.poll_interval * 2 ** job.attempts)
+            else:
+                self.queue.fail(job, error)
+                self._set_status(job, "failed")
+
+    def process(self, job: ScoringJob) -> None:
+        """Parse and score one application"""
+        db = self.session_factory()
+        try:
+            application = db.query(Application).filter(
+                Application.id == job.application_id
+            ).first()
+
+            # Application was deleted while queued
+            if not application:
+                return
+
+            application.scoring_status = "processing"
+            db.commit()
+
+            resume_data = self.resume_data(db, application)
+            job_data = build_job_data(application.job)
+            resume_data, score_result = score_resume(
+                resume_data,
+                job_data,
+                job.years_of_experience,
+                higher_rule_scores_counters(db, job_data, application.job_id, [application.id])[0]
+            )
+
+            apply_score(application, resume_data, score_result)
+            with stage_timer("db_commit"):
+                db.commit()
+        finally:
+            db.close()
+
+    def process_batch(self, jobs: List[ScoringJob]) -> List[ScoringJob]:
+        """
+        Parse and score several applications, batching AI analysis per job posting
+
+        Returns:
+            list: Jobs whose resume text could not be extracted; they are left
+            unscored for the caller to retry one by one
+        """
+        db = self.session_factory()
+        try:
+            years = {job.application_id: job.years_of_experience for job in jobs}
+            applications = db.query(Application).filter(Application.id.in_(list(years))).all()
+            if not applications:
+                return []
+
+            for application in applications:
+                application.scoring_status = "processing"
+            db.commit()
+
+            by_job = defaultdict(list)
+            for application in applications:
+                by_job[application.job_id].append(application)
+
+            unreadable = set()
+            for job_id, applications in by_job.items():
+                group, resumes = [], []
+                for application in applications:
+                    try:
+                        resumes.append(self.resume_data(db, application))
+                        group.append(application)
+                    except ExtractionError as e:
+                        logger.warning("Extraction error for application %s: %s", application.id, e)
+                        unreadable.add(application.id)
+                if not group:
+                    continue
+
+                job_data = build_job_data(group[0].job)
+                scored = score_resumes(
+                    resumes,
+                    job_data,
+                    [years[application.id] for application in group],
+                    higher_rule_scores_counters(db, job_data, job_id, [application.id for application in group])
+                )
+                for application, (resume_data, score_result) in zip(group, scored):
+                    apply_score(application, resume_data, score_result)
+
+            with stage_timer("db_commit"):
+                db.commit()
+            return [job for job in jobs if job.application_id in unreadable]
+        finally:
+            db.close()
+
+    def resume_data(self, db: Session, application: Application) -> dict:
+        """
+        The stored parse of the application's file, parsing and storing it on first use
+
+        Raises:
+            ExtractionError: if no text could be extracted, so the job goes
+                through retry and ends up failed instead of being scored empty
+        """
+        resume_data = stored_resume(db, application.resume_hash)
+        if resume_data is None:
+            resume_data = self.parse(application.resume_path, application.resume_hash)
+            if resume_data.get("error"):
+                raise ExtractionError(resume_data["error"])
+            if application.resume_hash:
+                store_resume(db, application.resume_hash, resume_data)
+        return resume_data
+
+    def parse(self, file_path: str, content_hash: Optional[str] = None) -> dict:
+        """Parse a resume, extracting its text in the extraction pool when one is set"""
+        extract = self.extractor.extract_and_parse if self.extractor else extract_and_parse
+        if settings.parse_cache_enabled:
+            return parse_cache.parse(file_path, content_hash=content_hash, extract=extract)
+        return extract(file_path)[1]
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                worked = self.run_once()
+            except Exception:
+                logger.exception("Scoring worker error")
+                worked = False
+            if not worked:
+                self._stop.wait(self.poll_interval)
+
+    def _set_status(self, job: ScoringJob, scoring_status: str) -> None:
+        db = self.session_factory()
+        try:
+            db.query(Application).filter(
+                Application.id == job.application_id
+            ).update({"scoring_status": scoring_status}, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+
+# Singleton instance
+scoring_worker = ScoringWorker(
+    scoring_queue,
+    threads=settings.scoring_worker_threads,
+    extractor=extraction_pool,
+    poll_interval=settings.scoring_poll_interval,
+    max_attempts=settings.scoring_max_attempts
+)
@@ -0,0 +1,224 @@
+"""
+Candidate search across all jobs of a user
+
+Each resumes row carries a tsvector of its text and each application an
+array of normalized skills, both GIN-indexed on Postgres, so a search only
+touches the rows that match. Other databases fall back to substring matching on
+the stored text, which is fine for local development; skill filters match
+whole normalized skills on every database.
+"""
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+from sqlalchemy import Float, Select, Text, cast, desc, exists, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from app.db.database import engine
+from app.db.types import TEXT_SEARCH_CONFIG
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.models.application import Application
+from app.models.resume import Resume
+from app.services.resumes import merge_resume_data, normalize_skills, resume_data_columns, resume_search_columns
+from app.config import get_settings
+
+settings = get_settings()
+
+POSTGRES = engine.dialect.name == "postgresql"
+
+
+def search_fields(resume_data: Optional[Dict], score_result: Optional[Dict] = None) -> Dict:
+    """
+    Search columns of an application for its parsed resume
+
+    The text document and embedding belong to the file and are stored on
+    its resumes row (app.services.resumes.resume_row).
+
+    Args:
+        resume_data: Parsed resume, as returned by ResumeParser.parse
+        score_result: Scoring result, whose matched skills are indexed too
+
+    Returns:
+        dict: skills and years_of_experience column values
+    """
+    resume_data = resume_data or {}
+    skills = list(resume_data.get("skills") or [])
+    if score_result:
+        skills += score_result.get("matched_skills") or []
+
+    years = resume_data.get("years_of_experience")
+    return {
+        "skills": normalize_skills(skills),
+        "years_of_experience": int(years) if isinstance(years, (int, float)) else None
+    }
+
+
+def _text_query(query: str):
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+
+
+def skill_filters(skills: Iterable[str]) -> list:
+    """
+    Conditions requiring every skill in an application's normalized skills
+
+    Skills are compared whole and case-insensitively: array containment on
+    Postgres, one json_each lookup per skill elsewhere.
+    """
+    skills = normalize_skills(skills)
+    if not skills:
+        return []
+    if POSTGRES:
+        return [Application.skills.op("@>")(cast(literal(skills, ARRAY(Text)), ARRAY(Text)))]
+
+    filters = []
+    for skill in skills:
+        elements = func.json_each(Application.skills).table_valued("value")
+        filters.append(exists(select(literal(1)).select_from(elements).where(elements.c.value == skill)))
+    return filters
+
+
+def search_filters(
+    user_id: UUID,
+    query: Optional[str],
+    skills: List[str],
+    min_experience: Optional[int]
+) -> list:
+    """Conditions on the Application/Job join for a search by one user"""
+    filters = [Job.user_id == user_id]
+    if query:
+        if POSTGRES:
+            filters.append(Resume.search_vector.op("@@")(_text_query(query)))
+        else:
+            for term in query.lower().split():
+                filters.append(Resume.search_vector.contains(term, autoescape=True))
+    filters.extend(skill_filters(skills))
+    if min_experience is not None:
+        filters.append(Application.years_of_experience >= min_experience)
+    return filters
+
+
+def search_sort(query: Optional[str]):
+    """
+    Sort key and its cursor type: text rank for full-text searches on
+    Postgres, otherwise application date
+
+    ts_rank_cd returns real. It is cast to double precision so the value
+    sent in a cursor compares equal to the row it came from; a real widened
+    for the comparison with a float8 parameter would not, and rows tied
+    with the cursor's rank would be skipped.
+    """
+    if query and POSTGRES:
+        return cast(func.ts_rank_cd(Resume.search_vector, _text_query(query)), Float(53)), "rank"
+    return Application.applied_at, "date"
+
+
+def search_statement(filters: list, sort_column) -> Select:
+    """
+    Joined query selecting the columns in a search result; resumes is outer
+    joined for text queries (Postgres drops the join when it is unused)
+    """
+    return select(
+        Application.id,
+        Application.job_id,
+        Job.title.label("job_title"),
+        Application.ai_score,
+        Application.scoring_status,
+        Application.status,
+        Application.applied_at,
+        Application.skills,
+        Application.years_of_experience.label("resume_years_of_experience"),
+        Candidate.id.label("candidate_id"),
+        Candidate.full_name,
+        Candidate.email,
+        Candidate.phone,
+        Candidate.years_of_experience,
+        sort_column.label("sort_value")
+    ).join(
+        Job, Job.id == Application.job_id
+    ).join(
+        Candidate, Candidate.id == Application.candidate_id
+    ).outerjoin(
+        Resume, Resume.content_hash == Application.resume_hash
+    ).where(*filters)
+
+
+def search_page(statement: Select, sort_column, last_value, last_id: Optional[UUID], limit: int) -> Select:
+    """Best matches after the cursor, one extra row to detect more pages"""
+    if last_id is not None:
+        statement = statement.where(tuple_(sort_column, Application.id) < tuple_(last_value, last_id))
+    return statement.order_by(desc(sort_column), desc(Application.id)).limit(limit + 1)
+
+
+def search_count_statement(filters: list) -> Select:
+    return select(func.count(Application.id)).join(Job, Job.id == Application.job_id).outerjoin(
+        Resume, Resume.content_hash == Application.resume_hash
+    ).where(*filters)
+
+
+def reindex_search(
+    db: Session,
+    chunk_size: Optional[int] = None,
+    on_progress: Optional[Callable[[int, float], None]] = None
+) -> Dict:
+    """
+    Fill the search columns of rows stored before search existed: the text
+    document and embedding of resumes rows that lack them, then the skills
+    and experience of every application from its parsed resume and
+    score_breakdown
+
+    Rows are read in primary-key order in chunks and each chunk is written
+    back with one executemany UPDATE and a commit.
+
+    Returns:
+        dict: Number of resumes rows and applications updated
+    """
+    chunk_size = chunk_size or settings.rescore_chunk_size
+    started = time.perf_counter()
+    updated = {"resumes": 0, "applications": 0}
+
+    def report(count: int) -> None:
+        if on_progress:
+            on_progress(count, round(time.perf_counter() - started, 3))
+
+    last_hash = None
+    while True:
+        query = db.query(Resume.content_hash, Resume.text, Resume.parsed).filter(Resume.embedding.is_(None))
+        if last_hash is not None:
+            query = query.filter(Resume.content_hash > last_hash)
+        rows = query.order_by(Resume.content_hash).limit(chunk_size).all()
+        if not rows:
+            break
+
+        db.execute(update(Resume), [
+            {"content_hash": content_hash, **resume_search_columns(merge_resume_data(text, parsed or {}, None))}
+            for content_hash, text, parsed in rows
+        ])
+        db.commit()
+
+        updated["resumes"] += len(rows)
+        last_hash = rows[-1][0]
+        report(updated["resumes"])
+
+    last_id = None
+    while True:
+        query = db.query(Application.id, Application.score_breakdown, *resume_data_columns()).outerjoin(
+            Resume, Resume.content_hash == Application.resume_hash
+        )
+        if last_id is not None:
+            query = query.filter(Application.id > last_id)
+        rows = query.order_by(Application.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        updates = [
+            {"id": application_id, **search_fields(merge_resume_data(*columns), score_breakdown)}
+            for application_id, score_breakdown, *columns in rows
+        ]
+        db.execute(update(Application), updates)
+        db.commit()
+
+        updated["applications"] += len(updates)
+        last_id = rows[-1][0]
+        report(updated["resumes"] + updated["applications"])
+
+    return updated
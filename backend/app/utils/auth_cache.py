@@ -0,0 +1,162 @@
+"""
+In-process cache of decoded access tokens and authenticated users
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from sqlalchemy import event
+from app.models.user import User
+from app.utils.security import decode_token_payload
+from app.config import get_settings
+
+settings = get_settings()
+
+# Columns kept for cached users; the password hash never enters the cache
+USER_FIELDS = ("id", "email", "company_name", "created_at")
+
+
+class _LRU:
+    """Size-bounded mapping of key -> (value, expires_at)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[object, float]]" = OrderedDict()
+
+    def get(self, key: str, now: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AuthCache:
+    """
+    TTL/LRU cache that lets get_current_user skip JWT decoding and the user
+    query for repeat requests
+
+    Tokens map to their user id until the token expires or `ttl_seconds`
+    pass, whichever comes first. Users are cached as detached snapshots for
+    `ttl_seconds` and dropped as soon as a User row is updated or deleted
+    through the ORM in this process. Other processes (and bulk UPDATEs that
+    bypass the ORM) see changes after at most `ttl_seconds`.
+    """
+
+    def __init__(self, ttl_seconds: int = 10, max_entries: int = 10000, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.token_hits = 0
+        self.token_misses = 0
+        self.user_hits = 0
+        self.user_misses = 0
+
+        self._lock = threading.Lock()
+        self._tokens = _LRU(max_entries)
+        self._users = _LRU(max_entries)
+
+    def user_id_for_token(self, token: str) -> Optional[str]:
+        """Return the user id a valid token belongs to, or None"""
+        if not self.enabled:
+            payload = decode_token_payload(token)
+            return payload["sub"] if payload else None
+
+        now = time.time()
+        with self._lock:
+            user_id = self._tokens.get(token, now)
+            if user_id is not None:
+                self.token_hits += 1
+                return user_id
+            self.token_misses += 1
+
+        payload = decode_token_payload(token)
+        if payload is None:
+            return None
+
+        expires_at = now + self.ttl_seconds
+        if payload.get("exp") is not None:
+            expires_at = min(expires_at, float(payload["exp"]))
+        with self._lock:
+            self._tokens.put(token, payload["sub"], expires_at)
+        return payload["sub"]
+
+    def get_user(self, user_id: str) -> Optional[User]:
+        """Return a transient User built from the cached snapshot, or None"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            snapshot = self._users.get(str(user_id), time.time())
+            if snapshot is None:
+                self.user_misses += 1
+                return None
+            self.user_hits += 1
+        return User(**snapshot)
+
+    def put_user(self, user: User) -> None:
+        if not self.enabled:
+            return
+        snapshot = {field: getattr(user, field) for field in USER_FIELDS}
+        with self._lock:
+            self._users.put(str(user.id), snapshot, time.time() + self.ttl_seconds)
+
+    def invalidate(self, user_id) -> None:
+        """Forget a user, e.g. after it was updated or deleted"""
+        with self._lock:
+            self._users.pop(str(user_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+            self._users.clear()
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters, hit rates and current sizes"""
+        with self._lock:
+            token_lookups = self.token_hits + self.token_misses
+            user_lookups = self.user_hits + self.user_misses
+            return {
+                "enabled": self.enabled,
+                "token_hits": self.token_hits,
+                "token_misses": self.token_misses,
+                "token_hit_rate": round(self.token_hits / token_lookups, 4) if token_lookups else 0.0,
+                "user_hits": self.user_hits,
+                "user_misses": self.user_misses,
+                "user_hit_rate": round(self.user_hits / user_lookups, 4) if user_lookups else 0.0,
+                "tokens": len(self._tokens),
+                "users": len(self._users),
+                "ttl_seconds": self.ttl_seconds
+            }
+
+
+# Singleton instance
+auth_cache = AuthCache(
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+    max_entries=settings.auth_cache_max_entries,
+    enabled=settings.auth_cache_enabled
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target) -> None:
+    auth_cache.invalidate(target.id)
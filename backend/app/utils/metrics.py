@@ -0,0 +1,293 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format
+"""
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from fast DB queries up to slow LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(labelnames, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        value = int(value)
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._render_samples()
+        ]
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (e.g. durations) in cumulative buckets"""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the wall-clock duration of the block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return sum(series[0]) if series else 0
+
+    def sum(self, **labels) -> float:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return series[1] if series else 0.0
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+
+        lines = []
+        for key, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(float(bound))}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    """
+    Current values read from a callback at scrape time
+
+    The callback returns a number for an unlabelled gauge, or a dict of
+    label value (or tuple of label values) -> number.
+    """
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _render_samples(self) -> List[str]:
+        try:
+            values = self.callback()
+        except Exception:
+            logger.exception("Error collecting metric %s", self.name)
+            return []
+
+        if not isinstance(values, dict):
+            return [f"{self.name} {_format_value(values)}"]
+        lines = []
+        for key, value in sorted(values.items()):
+            key = key if isinstance(key, tuple) else (key,)
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together for /api/metrics"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, callback: Callable, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, callback, labelnames))
+
+    def render(self) -> str:
+        with self._lock:
+            registered = list(self._metrics.values())
+        lines = []
+        for metric in registered:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+
+# Singleton instance
+metrics = MetricsRegistry()
+
+# Application metrics
+stage_duration = metrics.histogram(
+    "hrai_stage_duration_seconds",
+    "Time spent in each step of the application pipeline",
+    ["stage"]
+)
+stage_errors = metrics.counter(
+    "hrai_stage_errors_total",
+    "Pipeline steps that raised, by exception type",
+    ["stage", "error"]
+)
+http_request_duration = metrics.histogram(
+    "hrai_http_request_duration_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"]
+)
+scoring_results = metrics.counter(
+    "hrai_scoring_total",
+    "Scored resumes by method: ai, ai_cached, cascade (AI skipped by the scoring cascade), "
+    "fallback (AI failed) or rules (AI not configured, or no resume text)",
+    ["method"]
+)
+cascade_decisions = metrics.counter(
+    "hrai_scoring_cascade_total",
+    "Scoring cascade decisions when AI is configured: shortlisted (sent to AI), "
+    "below_min_score or outside_top_k (kept the rule-based score, LLM call saved) or disabled",
+    ["decision"]
+)
+cascade_saved_seconds = metrics.counter(
+    "hrai_scoring_cascade_saved_seconds_total",
+    "Estimated AI scoring time avoided by the cascade: skipped analyses x mean score_ai duration"
+)
+llm_tokens = metrics.counter(
+    "hrai_llm_tokens_total",
+    "Tokens reported by the LLM provider",
+    ["type"]
+)
+llm_batch_entries = metrics.counter(
+    "hrai_llm_batch_entries_total",
+    "Resumes analyzed in batched LLM requests: ok (valid entry in the batch reply) or "
+    "fallback (missing or malformed entry, analyzed individually)",
+    ["result"]
+)
+resume_tokens = metrics.counter(
+    "hrai_llm_resume_tokens_total",
+    "Resume tokens of candidates sent to AI analysis, before (original) and after (condensed) condensation",
+    ["type"]
+)
+llm_errors = metrics.counter(
+    "hrai_llm_errors_total",
+    "AI analyses that failed and fell back to rule-based scoring, by exception type",
+    ["error"]
+)
+db_pool_checkout = metrics.histogram(
+    "hrai_db_pool_checkout_seconds",
+    "Time spent waiting for a database connection from the pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """
+    Record the duration of a pipeline step, and its exception if it raises
+
+        with stage_timer("extract"):
+            text = extract(path)
+
+    Also usable as a decorator: @stage_timer("parse").
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        stage_errors.inc(stage=stage, error=type(e).__name__)
+        raise
+    finally:
+        stage_duration.observe(time.perf_counter() - start, stage=stage)
@@ -0,0 +1,167 @@
+"""
+Retry and circuit breaker helpers for calls to external providers
+"""
+import asyncio
+import collections
+import random
+import threading
+import time
+from typing import Optional
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Exponential backoff with full jitter for a 1-based retry attempt"""
+    return random.uniform(0, min(maximum, base * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Stop calling a provider after repeated failures
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    `allow()` returns False for `reset_seconds`. Then a single trial call is
+    let through (half-open); its success closes the circuit, its failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class ConcurrencyLimiter:
+    """
+    Cap on concurrent calls shared by threads and event loops
+
+    `with limiter:` blocks the calling thread and `async with limiter:`
+    suspends the calling coroutine until one of `limit` slots is free, so
+    sync and async callers count against the same cap. Waiters are served
+    in arrival order; a released slot is handed straight to the next one.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+
+        self._lock = threading.Lock()
+        self._in_use = 0
+        # threading.Event for a thread, (loop, future) for a coroutine
+        self._waiters = collections.deque()
+
+    @property
+    def in_use(self) -> int:
+        with self._lock:
+            return self._in_use
+
+    def _take_free_slot(self) -> bool:
+        if self._in_use < self.limit and not self._waiters:
+            self._in_use += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._take_free_slot():
+                return
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+        waiter.wait()
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._take_free_slot():
+                return
+            future = loop.create_future()
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was handed over before the cancellation; a cancelled
+            # future gives it back in _wake instead
+            if not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._in_use -= 1
+                return
+            waiter = self._waiters.popleft()
+
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+            return
+        loop, future = waiter
+        try:
+            loop.call_soon_threadsafe(self._wake, future)
+        except RuntimeError:
+            # The waiter's event loop is closed
+            self.release()
+
+    def _wake(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.release()
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 import bcrypt
@@ -7,10 +10,10 @@ from app.config import get_settings
 settings = get_settings()
 
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt"""
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
+    """Hash a password using bcrypt with `rounds` (default settings.bcrypt_rounds)"""
     password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or settings.bcrypt_rounds)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -26,6 +29,60 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Cost factor of a bcrypt hash ("$2b$12$..." -> 12), None if unparseable"""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class HashingBusy(Exception):
+    """Raised when too many password hashes are already queued"""
+
+
+class PasswordHasher:
+    """
+    Run bcrypt on a dedicated, size-limited thread pool
+
+    bcrypt releases the GIL, so `workers` hashes run in parallel without
+    holding request threads. At most `max_pending` hashes may be running or
+    queued; beyond that calls fail fast with HashingBusy instead of letting
+    a login burst queue up without bound.
+    """
+
+    def __init__(self, rounds: int = 12, workers: int = 4, max_pending: int = 64):
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def _submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy("Too many password hashing requests in progress")
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def hash(self, password: str) -> str:
+        return self._submit(hash_password, password, self.rounds).result()
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._submit(verify_password, password, hashed_password).result()
+
+    async def hash_async(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit(hash_password, password, self.rounds))
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        return await asyncio.wrap_future(self._submit(verify_password, password, hashed_password))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True if the hash was made with a different cost than configured"""
+        return hash_rounds(hashed_password) != self.rounds
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 def create_access_token(user_id: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     if expires_delta:
@@ -40,13 +97,26 @@ def create_access_token(user_id: str, expires_delta: Optional[timedelta] = None)
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
-def decode_token(token: str) -> Optional[str]:
-    """Decode and validate a JWT token, return user_id if valid"""
+def decode_token_payload(token: str) -> Optional[dict]:
+    """Decode and validate a JWT token, return its claims if valid"""
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-        return user_id
     except JWTError:
         return None
+    if payload.get("sub") is None:
+        return None
+    return payload
+
+
+def decode_token(token: str) -> Optional[str]:
+    """Decode and validate a JWT token, return user_id if valid"""
+    payload = decode_token_payload(token)
+    return payload["sub"] if payload else None
+
+
+# Singleton instance
+password_hasher = PasswordHasher(
+    rounds=settings.bcrypt_rounds,
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending
+)
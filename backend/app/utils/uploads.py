@@ -0,0 +1,172 @@
+"""
+Request body size limits and chunked storage of uploaded files
+"""
+import hashlib
+import os
+import re
+import tempfile
+import uuid
+from dataclasses import dataclass
+from typing import BinaryIO, Sequence, Tuple
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CHUNK_SIZE = 64 * 1024
+
+# Allowance for form fields and multipart boundaries on top of the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size limit"""
+
+
+class BodySizeLimitMiddleware:
+    """
+    Bound request bodies before the application reads them
+
+    Starlette reads a whole multipart body into spooled temporary files
+    before a route runs, so a size check in the route comes too late. This
+    middleware answers 413 when Content-Length exceeds the limit for the
+    path and 411 when a body is sent chunked without one. Received bytes
+    are counted as well; reading stops (the app sees a disconnect) once
+    they pass the limit.
+
+    Args:
+        max_bytes: Limit for paths not in `path_limits`
+        path_limits: (path regex, limit) pairs, first match wins
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int, path_limits: Sequence[Tuple[str, int]] = ()):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_limits = [(re.compile(pattern), limit) for pattern, limit in path_limits]
+
+    def limit_for(self, path: str) -> int:
+        for pattern, limit in self.path_limits:
+            if pattern.match(path):
+                return limit
+        return self.max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limit_for(scope["path"])
+        headers = Headers(scope=scope)
+        content_length = headers.get("content-length")
+        if content_length is None:
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                await self._reject(scope, receive, send, 411, "Content-Length required")
+                return
+        elif not content_length.isdigit():
+            await self._reject(scope, receive, send, 400, "Invalid Content-Length")
+            return
+        elif int(content_length) > limit:
+            await self._reject(
+                scope, receive, send, 413,
+                f"Request too large. Maximum size: {limit // 1024 // 1024}MB"
+            )
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    return {"type": "http.disconnect"}
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, status_code: int, detail: str) -> None:
+        response = JSONResponse({"detail": detail}, status_code=status_code, headers={"Connection": "close"})
+        await response(scope, receive, send)
+
+
+@dataclass
+class StoredUpload:
+    path: str
+    size: int
+    sha256: str
+
+
+class _UploadWriter:
+    """
+    Write chunks to a temporary file in `directory`, hashing and
+    size-checking them, and rename it into place on success
+
+    Memory use is one chunk regardless of file size and a partial file is
+    never visible under its final name.
+    """
+
+    def __init__(self, directory: str, extension: str, max_size: int):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.extension = extension
+        self.max_size = max_size
+        self.digest = hashlib.sha256()
+        self.size = 0
+        fd, self.temp_path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+        self.file = os.fdopen(fd, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise UploadTooLarge(f"Upload exceeds {self.max_size} bytes")
+        self.digest.update(chunk)
+        self.file.write(chunk)
+
+    def finish(self) -> StoredUpload:
+        self.file.close()
+        file_path = os.path.join(self.directory, f"{uuid.uuid4()}.{self.extension}")
+        os.replace(self.temp_path, file_path)
+        return StoredUpload(path=file_path, size=self.size, sha256=self.digest.hexdigest())
+
+    def abort(self) -> None:
+        self.file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+
+async def save_upload(upload: UploadFile, directory: str, extension: str, max_size: int) -> StoredUpload:
+    """
+    Copy an upload (already spooled by Starlette) to disk in chunks
+
+    Raises:
+        UploadTooLarge: if more than `max_size` bytes arrive
+    """
+    writer = _UploadWriter(directory, extension, max_size)
+    try:
+        while True:
+            chunk = await upload.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            writer.write(chunk)
+        return writer.finish()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+def save_stream(source: BinaryIO, directory: str, extension: str, max_size: int) -> StoredUpload:
+    """
+    Copy a readable binary stream (e.g. a ZIP archive member) to disk in chunks
+
+    Raises:
+        UploadTooLarge: if the stream holds more than `max_size` bytes
+    """
+    writer = _UploadWriter(directory, extension, max_size)
+    try:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            writer.write(chunk)
+        return writer.finish()
+    except BaseException:
+        writer.abort()
+        raise
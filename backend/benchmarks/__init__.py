@@ -0,0 +1,8 @@
+"""
+Performance benchmarks for the backend
+
+Run from the backend directory, e.g. `python -m benchmarks.skill_matcher`.
+`python -m benchmarks.suite --output results.json` runs the micro-benchmarks
+and load scenarios together and can compare against a previous run with
+`--baseline`.
+"""
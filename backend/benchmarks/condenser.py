@@ -0,0 +1,112 @@
+"""
+Benchmark: token-budgeted resume condensation vs the previous blind cut of
+resume text at 4000 characters
+
+On generated multi-page resumes (skills and education after a long work
+history, page headers repeated), compares tokens per resume and how much
+signal survives: the share of the full text's skills still present and
+whether the years of experience still parse. Also times condensation:
+
+    python -m benchmarks.condenser [--resumes 500] [--roles 6] [--max-tokens 1000]
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List
+from app.ml.condenser import ResumeCondenser
+from app.ml.resume_parser import resume_parser
+from benchmarks.resumes import resume_text, sectioned_resume_text
+
+# Previous prompt truncation
+MAX_RESUME_LENGTH = 4000
+
+
+def truncate(text: str) -> str:
+    if len(text) > MAX_RESUME_LENGTH:
+        return text[:MAX_RESUME_LENGTH] + "... [truncated]"
+    return text
+
+
+def signal(full: str, kept: str) -> Dict:
+    """Share of skills kept and whether years of experience still parse the same"""
+    skills = set(resume_parser.extract_skills(full))
+    kept_skills = set(resume_parser.extract_skills(kept))
+    return {
+        "skills_kept": len(skills & kept_skills) / len(skills) if skills else 1.0,
+        "years_kept": resume_parser.extract_years_of_experience(kept) == resume_parser.extract_years_of_experience(full)
+    }
+
+
+def summarize(values: List[float]) -> Dict:
+    values = sorted(values)
+    return {
+        "mean": round(statistics.fmean(values), 1),
+        "p50": values[len(values) // 2],
+        "p95": values[min(len(values) - 1, int(0.95 * len(values)))]
+    }
+
+
+def run(resumes: int = 500, roles: int = 6, max_tokens: int = 1000, tokenizer: str = "tiktoken", seed: int = 42) -> Dict:
+    rng = random.Random(seed)
+    condenser = ResumeCondenser(max_tokens=max_tokens, tokenizer=tokenizer)
+    corpora = {
+        "sectioned": [sectioned_resume_text(rng, rng.randint(max(1, roles // 2), roles * 2), index=i)
+                      for i in range(resumes)],
+        # Without headings condensation can only clean up and cut
+        "unsectioned": [resume_text(rng, rng.randint(300, 1500), index=i) for i in range(resumes // 5)]
+    }
+    return {
+        "max_tokens": max_tokens,
+        "tokenizer": "tiktoken" if condenser._get_encoding() is not None else "estimate",
+        **{name: compare(condenser, texts) for name, texts in corpora.items()}
+    }
+
+
+def compare(condenser: ResumeCondenser, texts: List[str]) -> Dict:
+    start = time.perf_counter()
+    condensed = [condenser.condense(text) for text in texts]
+    condense_us = 1e6 * (time.perf_counter() - start) / len(texts)
+
+    truncated_tokens, condensed_tokens, saved = [], [], []
+    truncated_signal, condensed_signal = [], []
+    for text, result in zip(texts, condensed):
+        truncated = truncate(text)
+        truncated_tokens.append(condenser.count_tokens(truncated))
+        condensed_tokens.append(result.tokens)
+        saved.append(result.saved_tokens)
+        truncated_signal.append(signal(text, truncated))
+        condensed_signal.append(signal(text, result.text))
+
+    def share(results: List[Dict], key: str) -> float:
+        return round(statistics.fmean(float(result[key]) for result in results), 3)
+
+    return {
+        "resumes": len(texts),
+        "original_tokens": summarize([result.original_tokens for result in condensed]),
+        "truncated_tokens": summarize(truncated_tokens),
+        "condensed_tokens": summarize(condensed_tokens),
+        "saved_tokens_per_resume": summarize(saved),
+        "truncated_skills_kept": share(truncated_signal, "skills_kept"),
+        "condensed_skills_kept": share(condensed_signal, "skills_kept"),
+        "truncated_years_kept": share(truncated_signal, "years_kept"),
+        "condensed_years_kept": share(condensed_signal, "years_kept"),
+        "condense_us_per_resume": round(condense_us, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--roles", type=int, default=6, help="Typical number of roles per resume")
+    parser.add_argument("--max-tokens", type=int, default=1000)
+    parser.add_argument("--tokenizer", default="tiktoken", choices=["tiktoken", "estimate"])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.resumes, args.roles, args.max_tokens, args.tokenizer, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Local stand-in for the OpenAI chat completions API
+
+Answers POST /v1/chat/completions with a deterministic resume analysis (a
+JSON array of them for batched "## CANDIDATE n" prompts), with configurable
+latency, injected 429/500 errors and malformed batch entries, so the analyzer
+can be exercised offline:
+
+    python -m benchmarks.fake_openai --port 8001 --latency 0.2 --error-rate 0.1
+    OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:8001/v1 uvicorn app.main:app
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+CANDIDATE_HEADING = re.compile(r"^## CANDIDATE (\d+)\n", re.MULTILINE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)"""
+    return max(1, len(text) // 4)
+
+
+def fake_analysis(prompt: str) -> Dict:
+    """Deterministic analysis derived from the prompt contents"""
+    digest = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest(), 16)
+    skills_match = re.search(r"\*\*Required Skills:\*\* (.*)", prompt)
+    skills = [s.strip() for s in skills_match.group(1).split(",")] if skills_match else []
+    resume = prompt.lower()
+    matched = [s for s in skills if s.lower() in resume.split("## candidate resume", 1)[-1]]
+    missing = [s for s in skills if s not in matched]
+
+    skills_score = round(100 * len(matched) / len(skills), 2) if skills else 100
+    experience_score = digest % 101
+    return {
+        "final_score": round(0.4 * skills_score + 0.6 * experience_score, 2),
+        "skills_score": skills_score,
+        "experience_score": experience_score,
+        "matched_skills": matched,
+        "missing_skills": missing,
+        "years_of_experience": digest % 15,
+        "explanation": "Synthetic analysis from the fake OpenAI server.",
+        "strengths": matched[:2],
+        "concerns": missing[:2]
+    }
+
+
+def fake_batch_analysis(prompt: str) -> Optional[List[Dict]]:
+    """One analysis per "## CANDIDATE n" section, or None for single-resume prompts"""
+    headings = list(CANDIDATE_HEADING.finditer(prompt))
+    if not headings:
+        return None
+
+    job_part = prompt[:headings[0].start()]
+    ends = [heading.start() for heading in headings[1:]] + [prompt.find("## ANALYSIS INSTRUCTIONS")]
+    return [
+        {"candidate": int(heading.group(1)),
+         **fake_analysis(f"{job_part}## CANDIDATE RESUME\n{prompt[heading.end():end]}")}
+        for heading, end in zip(headings, ends)
+    ]
+
+
+def malform(entry: Dict, rng: random.Random) -> Optional[Dict]:
+    """Break a batch entry the way a model might: drop it, or mistype a field"""
+    kind = rng.choice(["drop", "score", "skills"])
+    if kind == "drop":
+        return None
+    if kind == "score":
+        return {**entry, "final_score": "high"}
+    return {**entry, "matched_skills": ", ".join(entry["matched_skills"])}
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    server: "FakeOpenAIServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            self._respond()
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if not self.path.endswith("/chat/completions"):
+            return self._send(404, {"error": {"message": "Not found"}})
+
+        if self.server.take_failure() or self.server.rng.random() < self.server.error_rate:
+            status = self.server.rng.choice([429, 500, 503])
+            return self._send(status, {"error": {"message": "Injected failure", "type": "server_error"}})
+
+        messages = body.get("messages", [])
+        prompt = messages[-1]["content"] if messages else ""
+        entries = fake_batch_analysis(prompt)
+        if entries is None:
+            content = json.dumps(fake_analysis(prompt))
+        else:
+            if self.server.malformed_rate:
+                entries = [malform(entry, self.server.rng) if self.server.rng.random() < self.server.malformed_rate
+                           else entry for entry in entries]
+            content = json.dumps([entry for entry in entries if entry is not None])
+        prompt_tokens = sum(estimate_tokens(m.get("content", "")) for m in messages)
+        completion_tokens = estimate_tokens(content)
+
+        # Generation time grows with the reply, as it does for a real model
+        if self.server.token_latency:
+            time.sleep(self.server.token_latency * completion_tokens)
+
+        self._send(200, {
+            "id": f"chatcmpl-fake-{self.server.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-4o-mini"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+    def _send(self, status: int, payload: Dict):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None, malformed_rate: float = 0.0,
+                 token_latency: float = 0.0):
+        super().__init__((host, port), FakeOpenAIHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.token_latency = token_latency
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        # Concurrent requests now and at most, to check client-side limits
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Answer this many upcoming requests with an error, before error_rate applies
+        self.fail_next = 0
+
+    def take_failure(self) -> bool:
+        with self.lock:
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                return True
+            return False
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+def start_fake_openai(**options) -> FakeOpenAIServer:
+    """Start a fake server on a background thread; call .shutdown() to stop"""
+    server = FakeOpenAIServer(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 429/5xx")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--malformed-rate", type=float, default=0.0,
+                        help="Share of batch entries dropped or mistyped")
+    parser.add_argument("--token-latency", type=float, default=0.0,
+                        help="Extra seconds per completion token")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(args.host, args.port, args.latency, args.error_rate, args.seed,
+                              args.malformed_rate, args.token_latency)
+    print(f"Fake OpenAI listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: batched multi-resume AI analysis vs one request per resume
+
+Starts the fake OpenAI server and analyzes the same generated resumes
+against one job twice, with the AI cache off: once with
+AIAnalyzer.analyze_resume per resume, once with analyze_batch over chunks of
+--batch-size, both at the same request concurrency. Prints JSON with
+requests, prompt/completion tokens per resume and resumes per second:
+
+    python -m benchmarks.llm_batch [--resumes 200] [--batch-size 5] [--latency 0.3] [--token-latency 0.002]
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+from benchmarks.fake_openai import start_fake_openai
+from benchmarks.resumes import resume_text
+from benchmarks.scorer import JOB
+
+
+def measure(name: str, analyze: Callable[[], List[Dict]], server, resumes: int) -> Dict:
+    from app.utils.metrics import llm_batch_entries, llm_tokens
+
+    requests = server.requests
+    prompt_tokens = llm_tokens.value(type="prompt")
+    completion_tokens = llm_tokens.value(type="completion")
+    fallbacks = llm_batch_entries.value(result="fallback")
+
+    start = time.perf_counter()
+    results = analyze()
+    seconds = time.perf_counter() - start
+
+    return {
+        "mode": name,
+        "resumes": len(results),
+        "ai_powered": sum(1 for result in results if result.get("ai_powered")),
+        "batch_fallbacks": int(llm_batch_entries.value(result="fallback") - fallbacks),
+        "requests": server.requests - requests,
+        "prompt_tokens_per_resume": round((llm_tokens.value(type="prompt") - prompt_tokens) / resumes, 1),
+        "completion_tokens_per_resume": round(
+            (llm_tokens.value(type="completion") - completion_tokens) / resumes, 1
+        ),
+        "seconds": round(seconds, 3),
+        "resumes_per_second": round(resumes / seconds, 1)
+    }
+
+
+def run(
+    resumes: int = 200,
+    words: int = 600,
+    batch_size: int = 5,
+    concurrency: int = 8,
+    latency: float = 0.3,
+    token_latency: float = 0.002,
+    malformed_rate: float = 0.0,
+    seed: int = 42
+) -> Dict:
+    server = start_fake_openai(latency=latency, token_latency=token_latency, malformed_rate=malformed_rate, seed=seed)
+    # Settings are read once, so configure the analyzer before it is imported
+    os.environ.update({
+        "OPENAI_API_KEY": "fake",
+        "OPENAI_BASE_URL": server.base_url,
+        "OPENAI_MAX_CONCURRENCY": str(concurrency),
+        "AI_CACHE_ENABLED": "false",
+        "AI_BATCH_SIZE": str(batch_size)
+    })
+    from app.config import get_settings
+    get_settings.cache_clear()
+    from app.ml.ai_analyzer import ai_analyzer
+
+    rng = random.Random(seed)
+    texts = [resume_text(rng, words, 0.05, index=i) for i in range(resumes)]
+    chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+
+    try:
+        with ThreadPoolExecutor(concurrency) as pool:
+            single = measure(
+                "single", lambda: list(pool.map(lambda text: ai_analyzer.analyze_resume(text, JOB), texts)),
+                server, resumes
+            )
+            batched = measure(
+                "batch", lambda: [result for results in pool.map(lambda chunk: ai_analyzer.analyze_batch(chunk, JOB), chunks)
+                                  for result in results],
+                server, resumes
+            )
+    finally:
+        server.shutdown()
+
+    return {
+        "batch_size": batch_size,
+        "concurrency": concurrency,
+        "single": single,
+        "batch": batched,
+        "prompt_token_reduction": round(1 - batched["prompt_tokens_per_resume"] / single["prompt_tokens_per_resume"], 3),
+        "throughput_speedup": round(batched["resumes_per_second"] / single["resumes_per_second"], 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--batch-size", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.3, help="Fake provider seconds per request")
+    parser.add_argument("--token-latency", type=float, default=0.002, help="Fake provider seconds per completion token")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Share of batch entries the fake breaks")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(run(
+        args.resumes, args.words, args.batch_size, args.concurrency,
+        args.latency, args.token_latency, args.malformed_rate, args.seed
+    ), indent=2))
+
+
+if __name__ == "__main__":
+    main()
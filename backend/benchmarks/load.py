@@ -0,0 +1,238 @@
+"""
+Benchmark: dashboard read load against the API in sync and async database modes
+
+Seeds a job with applications in DATABASE_URL, then for each mode starts
+uvicorn with DATABASE_ASYNC set accordingly and drives concurrent keep-alive
+clients through the dashboard endpoints:
+
+    python -m benchmarks.load [--mode both] [--concurrency 64] [--duration 20]
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple, Union
+from sqlalchemy import insert
+from app.db.database import Base, SessionLocal, engine
+from app.models.user import User
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.models.application import Application
+from app.utils.security import create_access_token, hash_password
+
+
+def seed(applications: int, seed: int = 42) -> dict:
+    """Create a user and a job with `applications` scored applications"""
+    rng = random.Random(seed)
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        user = User(
+            email=f"load-{uuid.uuid4().hex[:8]}@example.com",
+            password_hash=hash_password("benchmark"),
+            company_name="Load Test"
+        )
+        db.add(user)
+        db.flush()
+
+        job = Job(
+            user_id=user.id,
+            title="Backend Engineer",
+            description="Benchmark job",
+            requirements="Python",
+            skills=["Python", "Docker", "PostgreSQL"],
+            min_experience=3
+        )
+        db.add(job)
+        db.flush()
+
+        now = datetime.utcnow()
+        candidates, rows = [], []
+        for i in range(applications):
+            candidate_id = uuid.uuid4()
+            candidates.append({
+                "id": candidate_id,
+                "email": f"candidate{i}-{candidate_id.hex[:6]}@example.com",
+                "full_name": f"Candidate {i}",
+                "years_of_experience": rng.randint(0, 15),
+                "created_at": now
+            })
+            rows.append({
+                "id": uuid.uuid4(),
+                "job_id": job.id,
+                "candidate_id": candidate_id,
+                "ai_score": round(rng.uniform(0, 100), 2),
+                "score_breakdown": {"skills": 50.0, "experience": 50.0, "matched_skills": ["Python"]},
+                "explanation": "Seeded for the load benchmark",
+                "scoring_status": "completed",
+                "status": "applied",
+                "applied_at": now - timedelta(minutes=i),
+                "updated_at": now
+            })
+        if candidates:
+            db.execute(insert(Candidate), candidates)
+            db.execute(insert(Application), rows)
+        db.commit()
+
+        return {
+            "token": create_access_token(str(user.id)),
+            "job_id": str(job.id),
+            "public_link": job.public_link
+        }
+    finally:
+        db.close()
+
+
+def start_server(port: int, async_mode: bool, env: Optional[dict] = None) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_ASYNC": "true" if async_mode else "false",
+        "SCORING_WORKER_ENABLED": "false",
+        **(env or {})
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env
+    )
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn exited during start-up")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/api/health")
+            if conn.getresponse().status == 200:
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not become healthy within 60s")
+
+
+def drive(port: int, paths: list, token: Optional[str], concurrency: int, duration: float,
+          method: str = "GET", body: Union[dict, Callable[[], Tuple[bytes, str]], None] = None) -> dict:
+    """
+    Run `concurrency` clients for `duration` seconds, return latency stats
+
+    `body` is a dict sent as JSON with every request, or a callable returning
+    (body, content type) for each request, e.g. a multipart upload.
+    """
+    latencies, errors = [], []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    base_headers = {"Authorization": f"Bearer {token}"} if token else {}
+    json_payload = None
+    if isinstance(body, dict):
+        json_payload = json.dumps(body)
+        base_headers["Content-Type"] = "application/json"
+
+    def client(index: int):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        local_latencies, local_errors = [], 0
+        i = index
+        while time.monotonic() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            headers, payload = base_headers, json_payload
+            if callable(body):
+                payload, content_type = body()
+                headers = {**base_headers, "Content-Type": content_type}
+            start = time.perf_counter()
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                ok = 200 <= response.status < 300
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                ok = False
+            if ok:
+                local_latencies.append(time.perf_counter() - start)
+            else:
+                local_errors += 1
+        conn.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors.append(local_errors)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return round(1000 * latencies[min(len(latencies) - 1, int(p * len(latencies)))], 2)
+
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(1000 * statistics.fmean(latencies), 2) if latencies else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99)
+    }
+
+
+def run(modes: list, concurrency: int = 64, duration: float = 20.0, applications: int = 2000,
+        port: int = 8765, warmup: float = 2.0) -> dict:
+    data = seed(applications)
+    job_id = data["job_id"]
+    paths = [
+        "/api/jobs",
+        f"/api/jobs/{job_id}",
+        f"/api/jobs/{job_id}/applications?limit=50",
+        f"/api/jobs/{job_id}/applications?limit=50&sort_by=date",
+        "/api/auth/me"
+    ]
+
+    results = {}
+    for mode in modes:
+        process = start_server(port, async_mode=mode == "async")
+        try:
+            drive(port, paths, data["token"], concurrency, warmup)
+            results[mode] = drive(port, paths, data["token"], concurrency, duration)
+        finally:
+            process.terminate()
+            process.wait(10)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load per mode")
+    parser.add_argument("--applications", type=int, default=2000, help="Applications to seed")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+    results = run(modes, args.concurrency, args.duration, args.applications, args.port)
+    print(json.dumps(results, indent=2))
+
+    if len(results) == 2 and results["sync"]["requests_per_second"]:
+        ratio = results["async"]["requests_per_second"] / results["sync"]["requests_per_second"]
+        print(f"async/sync throughput: {ratio:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
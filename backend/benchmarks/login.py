@@ -0,0 +1,84 @@
+"""
+Benchmark: login throughput and its effect on other requests
+
+Creates a user in DATABASE_URL, then for each mode starts uvicorn with the
+given BCRYPT_ROUNDS and drives a burst of concurrent logins while a second
+set of clients reads the job list, reporting latency for both:
+
+    python -m benchmarks.login [--mode both] [--rounds 12] [--concurrency 32] [--duration 15]
+
+Logins rejected with 503 (hashing pool full) are counted as errors.
+"""
+import argparse
+import json
+import threading
+import uuid
+from app.db.database import Base, SessionLocal, engine
+from app.models.user import User
+from app.utils.security import create_access_token, hash_password
+from benchmarks.load import drive, start_server
+
+PASSWORD = "benchmark-password"
+
+
+def seed(rounds: int) -> dict:
+    """Create a user whose password is hashed with `rounds`"""
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        user = User(
+            email=f"login-{uuid.uuid4().hex[:8]}@example.com",
+            password_hash=hash_password(PASSWORD, rounds),
+            company_name="Login Benchmark"
+        )
+        db.add(user)
+        db.commit()
+        return {"email": user.email, "token": create_access_token(str(user.id))}
+    finally:
+        db.close()
+
+
+def run(modes: list, rounds: int = 12, concurrency: int = 32, readers: int = 8,
+        duration: float = 15.0, port: int = 8766, warmup: float = 2.0) -> dict:
+    data = seed(rounds)
+    credentials = {"email": data["email"], "password": PASSWORD}
+
+    results = {}
+    for mode in modes:
+        process = start_server(port, async_mode=mode == "async", env={"BCRYPT_ROUNDS": str(rounds)})
+        try:
+            drive(port, ["/api/auth/login"], None, concurrency, warmup, method="POST", body=credentials)
+
+            reads = {}
+            reader = threading.Thread(
+                target=lambda: reads.update(drive(port, ["/api/jobs"], data["token"], readers, duration))
+            )
+            reader.start()
+            logins = drive(port, ["/api/auth/login"], None, concurrency, duration, method="POST", body=credentials)
+            reader.join()
+
+            results[mode] = {"login": logins, "jobs_during_logins": reads}
+        finally:
+            process.terminate()
+            process.wait(10)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt work factor for the server and the seeded user")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent login clients")
+    parser.add_argument("--readers", type=int, default=8, help="Concurrent GET /api/jobs clients")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of load per mode")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+    results = run(modes, args.rounds, args.concurrency, args.readers, args.duration, args.port)
+    print(json.dumps({"rounds": args.rounds, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
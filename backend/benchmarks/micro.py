@@ -0,0 +1,116 @@
+"""
+Micro-benchmarks for the resume parsing and scoring hot paths
+
+Times ResumeParser.parse on generated PDF and DOCX files, parse_text,
+extract_skills, extract_years_of_experience, Scorer.score, resume embedding
+and a brute-force top-K over a job's candidate matrix, and prints JSON
+(per-call mean/p50/p95 in microseconds and calls per second):
+
+    python -m benchmarks.micro [--resumes 200] [--words 600] [--skill-density 0.05] [--candidates 100000]
+"""
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Sequence
+import numpy as np
+from app.ml.embeddings import normalize_rows, text_embedder, top_k
+from app.ml.resume_parser import resume_parser
+from app.ml.scorer import Scorer
+from benchmarks.resumes import generate, resume_text
+from benchmarks.scorer import JOB
+
+
+def measure(fn: Callable, inputs: Sequence, min_calls: int = 0, warmup: int = 3) -> Dict:
+    """Call `fn` on every input (cycling up to `min_calls` calls) and summarize per-call time"""
+    for item in inputs[:warmup]:
+        fn(item)
+
+    calls = max(len(inputs), min_calls)
+    latencies = []
+    for i in range(calls):
+        item = inputs[i % len(inputs)]
+        start = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies)
+
+
+def summarize(latencies: List[float]) -> Dict:
+    latencies = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return round(1e6 * latencies[min(len(latencies) - 1, int(p * len(latencies)))], 1)
+
+    total = sum(latencies)
+    return {
+        "calls": len(latencies),
+        "mean_us": round(1e6 * statistics.fmean(latencies), 1),
+        "p50_us": percentile(0.50),
+        "p95_us": percentile(0.95),
+        "calls_per_second": round(len(latencies) / total, 1) if total else None
+    }
+
+
+def run(
+    resumes: int = 200,
+    files: int = 30,
+    words: int = 600,
+    skill_density: float = 0.05,
+    seed: int = 42,
+    candidates: int = 100000
+) -> Dict:
+    rng = random.Random(seed)
+    texts = [resume_text(rng, words, skill_density, index=i) for i in range(resumes)]
+    parsed = [resume_parser.parse_text(text) for text in texts]
+    scorer = Scorer()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="hrai-bench-") as directory:
+        for fmt in ("pdf", "docx"):
+            paths = generate(directory, files, fmt, words, skill_density, seed)
+            results[f"parse_{fmt}"] = measure(resume_parser.parse, paths)
+
+    results["parse_text"] = measure(resume_parser.parse_text, texts, min_calls=1000)
+    results["extract_skills"] = measure(resume_parser.extract_skills, texts, min_calls=1000)
+    results["extract_years_of_experience"] = measure(resume_parser.extract_years_of_experience, texts, min_calls=1000)
+    results["scorer_score"] = measure(lambda resume: scorer.score(resume, JOB), parsed, min_calls=2000)
+    results["embed_resume"] = measure(text_embedder.embed_resume, parsed, min_calls=1000)
+
+    # Top 50 of a job's candidates; random unit vectors cost the same as real ones
+    matrix = normalize_rows(np.random.default_rng(seed).standard_normal(
+        (candidates, text_embedder.dim), dtype=np.float32
+    ))
+    queries = [text_embedder.embed_job(JOB)] + [text_embedder.embed_resume(resume) for resume in parsed[:9]]
+    results["embedding_top_k"] = measure(lambda query: top_k(matrix, query, 50), queries, min_calls=50)
+
+    return {
+        "config": {
+            "resumes": resumes,
+            "files": files,
+            "words": words,
+            "skill_density": skill_density,
+            "seed": seed,
+            "candidates": candidates
+        },
+        "results": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=200, help="Resume texts for the in-memory benchmarks")
+    parser.add_argument("--files", type=int, default=30, help="Generated PDF and DOCX files each")
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--skill-density", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--candidates", type=int, default=100000, help="Rows in the top-K candidate matrix")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.resumes, args.files, args.words, args.skill_density, args.seed, args.candidates), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark: single-pass field extraction in ResumeParser.parse_text vs the
+previous pattern-by-pattern implementation
+
+Checks that every field is identical on a golden corpus of generated
+resumes plus hand-written edge cases, then times both, whole and per field
+(skill matching is shared and dominates parse_text):
+
+    python -m benchmarks.parser_fields [--resumes 2000] [--words 600]
+"""
+import argparse
+import json
+import random
+import re
+import time
+from typing import Dict, List
+from app.ml.resume_parser import resume_parser
+from benchmarks.resumes import resume_text
+
+# Inputs that exercise the ordering and validity rules of the patterns
+EDGE_CASES = [
+    "",
+    "no digits here",
+    "John Smith\njohn@example.com\n(555) 123-4567",
+    "Jane Doe\n+44 20 7946 0958\n\nExperience: 7 years",
+    "0 years experience, then 12 years of experience",
+    "75 years of experience in total, 5+ yrs in Python",
+    "experience - 60 years; experience: 4 years",
+    "I have 3 years working with Go and 2 yrs of Rust",
+    "Worked 10 years in banking. Professional experience 8 years.",
+    "12345678901 not a phone?\n          \n\n  555 123 4567",
+    "  \n\n\n    \n\n     (555)123-4567 and 5551234567",
+    "Contact: a.b-c@d-e.co.uk, second@x.io",
+    "ÉMILE ZOLA\nemile@ex.fr\n10 YEARS EXPERIENCE",
+    "inexperienced 5 years? experience:9 year",
+    "2019 - 2023 Senior Engineer\n4 years of professional experience",
+    "Skills: Python, C++, C#, Node.js, CI/CD, React Native, Go",
+    "١٢ years of experience with ٣ yrs in Rust",
+]
+
+TRICKY_TOKENS = [
+    "years", "year", "yrs", "yr", "experience", "professional", "of", "in", "working",
+    "+", ":", "-", "(", ")", "@", "\n", "  ", "0", "3", "12", "51", "555", "1234",
+    "(555)", "123-4567", "Python", "Go", "C++", "Node.js", "a@b.co", "Jane", "Doe",
+]
+
+
+class LegacyParser:
+    """Field extraction as it was before the single-pass rewrite"""
+
+    def extract_email(self, text):
+        match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+        return match.group() if match else None
+
+    def extract_phone(self, text):
+        patterns = [
+            r'\+?[\d\s\-\(\)]{10,}',
+            r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}',
+            r'\d{3}[-\s]?\d{3}[-\s]?\d{4}'
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, text)
+            if match:
+                phone = match.group().strip()
+                digits = re.sub(r'\D', '', phone)
+                if len(digits) >= 9:
+                    return phone
+        return None
+
+    def extract_years_of_experience(self, text):
+        patterns = [
+            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
+            r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?experience',
+            r'experience\s*[:\-]?\s*(\d+)\s*years?',
+            r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:in|of|working)',
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, text.lower())
+            if match:
+                years = int(match.group(1))
+                if 0 < years <= 50:
+                    return years
+        return None
+
+    def extract_name(self, text):
+        lines = text.strip().split('\n')
+        for line in lines[:5]:
+            line = line.strip()
+            if '@' in line or re.search(r'\d{5,}', line):
+                continue
+            if len(line) < 50 and len(line.split()) <= 4:
+                words = line.split()
+                if len(words) >= 2:
+                    if all(w[0].isupper() for w in words if w):
+                        return line
+        return None
+
+    def parse_text(self, text):
+        if not text:
+            return resume_parser.parse_text(text)
+        return {
+            "raw_text": text[:5000],
+            "email": self.extract_email(text),
+            "phone": self.extract_phone(text),
+            "name": self.extract_name(text),
+            "skills": resume_parser.skill_matcher.find(text),
+            "years_of_experience": self.extract_years_of_experience(text)
+        }
+
+
+def golden_corpus(resumes: int, words: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    corpus = list(EDGE_CASES)
+    for i in range(resumes):
+        density = rng.choice([0.0, 0.02, 0.05, 0.15])
+        corpus.append(resume_text(rng, rng.randint(words // 4, words * 2), density, index=i))
+    # Random sequences of pattern fragments, to hit orderings no template would
+    for _ in range(resumes):
+        corpus.append(" ".join(rng.choice(TRICKY_TOKENS) for _ in range(rng.randint(5, 60))))
+    return corpus
+
+
+# Field extractors timed on their own, in microseconds per text
+FIELDS = ("extract_email", "extract_phone", "extract_name", "extract_years_of_experience")
+
+
+def time_per_text(fn, corpus: List[str]) -> float:
+    start = time.perf_counter()
+    for text in corpus:
+        fn(text)
+    return round(1e6 * (time.perf_counter() - start) / len(corpus), 2)
+
+
+def run(resumes: int = 2000, words: int = 600, seed: int = 42) -> Dict:
+    corpus = golden_corpus(resumes, words, seed)
+    legacy = LegacyParser()
+
+    start = time.perf_counter()
+    expected = [legacy.parse_text(text) for text in corpus]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [resume_parser.parse_text(text) for text in corpus]
+    current_seconds = time.perf_counter() - start
+
+    mismatches = [
+        {"text": text[:200], "field": field, "expected": old[field], "actual": new[field]}
+        for text, old, new in zip(corpus, expected, actual)
+        for field in old
+        if old[field] != new[field]
+    ]
+
+    fields = {
+        field: {
+            "legacy_us": time_per_text(getattr(legacy, field), corpus),
+            "current_us": time_per_text(getattr(resume_parser, field), corpus)
+        }
+        for field in FIELDS
+    }
+
+    return {
+        "texts": len(corpus),
+        "legacy_seconds": round(legacy_seconds, 4),
+        "current_seconds": round(current_seconds, 4),
+        "legacy_texts_per_second": round(len(corpus) / legacy_seconds, 1),
+        "current_texts_per_second": round(len(corpus) / current_seconds, 1),
+        "speedup": round(legacy_seconds / current_seconds, 2) if current_seconds else None,
+        "fields": fields,
+        "mismatches": len(mismatches),
+        "first_mismatches": mismatches[:5]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.resumes, args.words, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Synthetic resumes for benchmarks: resume-like text written as PDF or DOCX
+
+Length is set in words and skill density as the share of words that are
+known skills. Output is deterministic for a given seed:
+
+    python -m benchmarks.resumes --count 100 --format pdf --words 800 --skill-density 0.05 --out /tmp/resumes
+"""
+import argparse
+import os
+import random
+import textwrap
+from typing import List, Optional
+from docx import Document
+from app.ml.resume_parser import SKILLS_DATABASE
+
+FIRST_NAMES = ["Alex", "Maria", "James", "Priya", "Chen", "Fatima", "Lucas", "Olga", "Daniel", "Aisha"]
+LAST_NAMES = ["Smith", "Garcia", "Kowalski", "Nguyen", "Okafor", "Larsen", "Rossi", "Tanaka", "Cohen", "Silva"]
+FILLER = (
+    "Responsible for delivering features across the stack, working with "
+    "product and design to ship reliable software. Led code reviews, "
+    "mentored engineers and improved deployment pipelines for the team."
+).split()
+
+# Page layout of the generated PDFs
+PDF_LINE_CHARS = 95
+PDF_LINES_PER_PAGE = 60
+
+
+def resume_text(
+    rng: random.Random,
+    words: int = 600,
+    skill_density: float = 0.05,
+    years: Optional[int] = None,
+    index: int = 0
+) -> str:
+    """
+    Resume-like text with a contact header, experience summary and body
+
+    Args:
+        rng: Random source; the same seed gives the same resume
+        words: Approximate number of body words
+        skill_density: Share of body words drawn from SKILLS_DATABASE
+        years: Years of experience stated in the summary (random if None)
+        index: Makes the email address unique within a batch
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    years = rng.randint(0, 15) if years is None else years
+
+    body = []
+    for _ in range(words):
+        if rng.random() < skill_density:
+            body.append(rng.choice(SKILLS_DATABASE))
+        else:
+            body.append(rng.choice(FILLER))
+
+    paragraphs = [" ".join(body[start:start + 80]) for start in range(0, len(body), 80)]
+    return "\n".join([
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}{index}@example.com",
+        f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        "",
+        "SUMMARY",
+        f"Software engineer with {years} years of experience.",
+        "",
+        "EXPERIENCE",
+        *paragraphs
+    ])
+
+
+def sectioned_resume_text(
+    rng: random.Random,
+    roles: int = 6,
+    skill_density: float = 0.05,
+    index: int = 0
+) -> str:
+    """
+    Resume laid out like a real multi-page one: contact header, summary,
+    most recent roles first, then education, skills and interests, with the
+    page header and a page number repeated every PDF_LINES_PER_PAGE lines
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    contact = f"{first} {last} | {first.lower()}.{last.lower()}{index}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}"
+    skills = rng.sample(SKILLS_DATABASE, 8)
+
+    lines = [f"{first} {last}", contact, "", "SUMMARY", f"Software engineer with {2 * roles + 1} years of experience.", "", "EXPERIENCE"]
+    year = 2024
+    for role in range(roles):
+        lines.append(f"Senior Engineer, Company {role} ({year - 2} - {year})")
+        for _ in range(rng.randint(4, 10)):
+            words = [rng.choice(skills) if rng.random() < skill_density else rng.choice(FILLER) for _ in range(rng.randint(12, 30))]
+            lines.append("- " + " ".join(words))
+        lines.append("")
+        year -= 2
+    lines += [
+        "EDUCATION", "BSc Computer Science, State University", "",
+        "SKILLS", ", ".join(skills), "",
+        "INTERESTS", "Chess, hiking, open source", "",
+        "References available upon request"
+    ]
+
+    paged = []
+    for start in range(0, len(lines), PDF_LINES_PER_PAGE):
+        if start:
+            paged.append(contact)
+        paged += lines[start:start + PDF_LINES_PER_PAGE]
+        paged.append(f"Page {start // PDF_LINES_PER_PAGE + 1}")
+    return "\n".join(paged)
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def pdf_bytes(text: str) -> bytes:
+    """Render text as a Helvetica PDF, wrapped and paginated"""
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(textwrap.wrap(paragraph, PDF_LINE_CHARS) or [""])
+    pages = [lines[start:start + PDF_LINES_PER_PAGE] for start in range(0, len(lines), PDF_LINES_PER_PAGE)] or [[]]
+
+    # 1: catalog, 2: page tree, 3: font, then a content stream and page per page
+    objects = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page in pages:
+        content = "BT /F1 9 Tf 40 770 Td 12 TL " + " ".join(f"({_pdf_escape(line)}) '" for line in page) + " ET"
+        stream = content.encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+        page_ids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def write_pdf(path: str, text: str) -> None:
+    """Write text as a PDF file"""
+    with open(path, "wb") as f:
+        f.write(pdf_bytes(text))
+
+
+def write_docx(path: str, text: str) -> None:
+    """Write text as a DOCX with one paragraph per line"""
+    document = Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def generate(
+    directory: str,
+    count: int,
+    fmt: str = "pdf",
+    words: int = 600,
+    skill_density: float = 0.05,
+    seed: int = 42
+) -> List[str]:
+    """Write `count` resumes to `directory` and return their paths"""
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(seed)
+    writer = write_pdf if fmt == "pdf" else write_docx
+
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"resume-{i:05d}.{fmt}")
+        writer(path, resume_text(rng, words, skill_density, index=i))
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--format", choices=["pdf", "docx"], default="pdf")
+    parser.add_argument("--words", type=int, default=600, help="Body words per resume")
+    parser.add_argument("--skill-density", type=float, default=0.05, help="Share of words that are skills")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", required=True, help="Output directory")
+    args = parser.parse_args()
+
+    paths = generate(args.out, args.count, args.format, args.words, args.skill_density, args.seed)
+    print(f"Wrote {len(paths)} resumes to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+End-to-end load scenarios: apply, list applications and list jobs
+
+Seeds DATABASE_URL (local Postgres, or e.g. sqlite:///./bench.db as a
+stand-in), starts a fake OpenAI server and uvicorn with the scoring worker
+enabled, then drives each scenario in turn and prints JSON:
+
+    python -m benchmarks.scenarios [--scenario all] [--concurrency 16] [--duration 15] [--openai-latency 0.3]
+
+`apply` posts a freshly generated PDF resume per request to the public apply endpoint, so the
+background worker parses and AI-scores them while the scenarios run.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import tempfile
+import time
+import uuid
+from typing import Dict, List, Tuple
+from sqlalchemy import func
+from app.db.database import SessionLocal, engine
+from app.models.application import Application
+from benchmarks.fake_openai import start_fake_openai
+from benchmarks.load import drive, seed, start_server
+from benchmarks.resumes import pdf_bytes, resume_text
+
+SCENARIOS = ("apply", "list_applications", "list_jobs")
+
+
+def multipart(fields: Dict[str, str], file_field: str, filename: str, content: bytes) -> Tuple[bytes, str]:
+    """Encode form fields and one file as multipart/form-data"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+        f'Content-Type: application/pdf\r\n\r\n'.encode() + content + b"\r\n"
+    )
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def scoring_counts(job_id: str) -> Dict[str, int]:
+    db = SessionLocal()
+    try:
+        rows = db.query(Application.scoring_status, func.count(Application.id)).filter(
+            Application.job_id == uuid.UUID(job_id)
+        ).group_by(Application.scoring_status)
+        return {scoring_status: count for scoring_status, count in rows}
+    finally:
+        db.close()
+
+
+def run(
+    scenarios: List[str],
+    concurrency: int = 16,
+    duration: float = 15.0,
+    applications: int = 2000,
+    openai_latency: float = 0.3,
+    words: int = 600,
+    skill_density: float = 0.05,
+    async_mode: bool = False,
+    port: int = 8767,
+    seed_value: int = 42
+) -> Dict:
+    data = seed(applications, seed_value)
+    job_id = data["job_id"]
+    fake_openai = start_fake_openai(latency=openai_latency, seed=seed_value)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="hrai-scenarios-") as directory:
+        counter = itertools.count()
+
+        def apply_body() -> Tuple[bytes, str]:
+            # A distinct resume per request, so the parse and AI caches don't absorb the load
+            i = next(counter)
+            text = resume_text(random.Random(seed_value + i), words, skill_density, index=i)
+            return multipart(
+                {"full_name": f"Applicant {i}", "email": f"applicant-{uuid.uuid4().hex[:12]}@example.com"},
+                "resume", "resume.pdf", pdf_bytes(text)
+            )
+
+        requests = {
+            "apply": ([f"/api/public/apply/{data['public_link']}"], None, "POST", apply_body),
+            "list_applications": ([
+                f"/api/jobs/{job_id}/applications?limit=50",
+                f"/api/jobs/{job_id}/applications?limit=50&sort_by=date"
+            ], data["token"], "GET", None),
+            "list_jobs": (["/api/jobs"], data["token"], "GET", None)
+        }
+
+        process = start_server(port, async_mode, env={
+            "SCORING_WORKER_ENABLED": "true",
+            "OPENAI_API_KEY": "fake",
+            "OPENAI_BASE_URL": fake_openai.base_url,
+            "UPLOAD_DIR": os.path.join(directory, "uploads"),
+            "PARSE_CACHE_PATH": os.path.join(directory, "parse_cache.sqlite3"),
+            "AI_CACHE_PATH": os.path.join(directory, "ai_cache.sqlite3")
+        })
+        try:
+            for scenario in scenarios:
+                paths, token, method, body = requests[scenario]
+                results[scenario] = drive(port, paths, token, concurrency, duration, method=method, body=body)
+
+            # Let the worker catch up briefly, then report how far scoring got
+            time.sleep(1)
+            results["scoring"] = {
+                **scoring_counts(job_id),
+                "openai_requests": fake_openai.requests
+            }
+        finally:
+            process.terminate()
+            process.wait(10)
+            fake_openai.shutdown()
+
+    return {
+        "config": {
+            "database": engine.url.get_backend_name(),
+            "async": async_mode,
+            "concurrency": concurrency,
+            "duration": duration,
+            "applications": applications,
+            "openai_latency": openai_latency
+        },
+        "results": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "all"], default="all")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of load per scenario")
+    parser.add_argument("--applications", type=int, default=2000, help="Applications to seed")
+    parser.add_argument("--openai-latency", type=float, default=0.3, help="Seconds per fake OpenAI response")
+    parser.add_argument("--async", dest="async_mode", action="store_true", help="Serve with DATABASE_ASYNC")
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    scenarios = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    results = run(
+        scenarios, args.concurrency, args.duration, args.applications,
+        args.openai_latency, async_mode=args.async_mode, port=args.port
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: Scorer.score per candidate vs the vectorized batch API
+
+    python -m benchmarks.scorer [--candidates 100000]
+"""
+import argparse
+import random
+import time
+from app.ml.resume_parser import SKILLS_DATABASE
+from app.ml.scorer import SKILL_REVERSE_LOOKUP, Scorer
+
+JOB = {
+    "title": "Backend Engineer",
+    "skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "AWS", "Redis", "CI/CD"],
+    "min_experience": 4,
+}
+
+
+def synthetic_resumes(count: int, seed: int = 42) -> list:
+    """Parsed-resume dicts with random skills (including synonyms) and experience"""
+    rng = random.Random(seed)
+    pool = SKILLS_DATABASE + list(SKILL_REVERSE_LOOKUP)
+    resumes = []
+    for _ in range(count):
+        years = rng.choice([None, *range(0, 16)])
+        resumes.append({
+            "skills": rng.sample(pool, rng.randint(0, 25)),
+            "years_of_experience": years,
+        })
+    return resumes
+
+
+def run(candidates: int = 100_000, seed: int = 42) -> dict:
+    scorer = Scorer()
+    resumes = synthetic_resumes(candidates, seed)
+
+    start = time.perf_counter()
+    single = [scorer.score(r, JOB) for r in resumes]
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = scorer.score_many(resumes, JOB)
+    batch_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    final_scores = scorer.score_arrays(resumes, JOB)[0]
+    arrays_seconds = time.perf_counter() - start
+
+    return {
+        "candidates": candidates,
+        "score_seconds": round(single_seconds, 4),
+        "score_many_seconds": round(batch_seconds, 4),
+        "score_arrays_seconds": round(arrays_seconds, 4),
+        "score_many_speedup": round(single_seconds / batch_seconds, 2),
+        "score_arrays_speedup": round(single_seconds / arrays_seconds, 2),
+        "identical": single == batch and all(
+            round(float(f), 2) == s["final_score"] for f, s in zip(final_scores, single)
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for key, value in run(args.candidates, args.seed).items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
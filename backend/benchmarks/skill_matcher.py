@@ -0,0 +1,76 @@
+"""
+Benchmark: single-pass SkillMatcher vs the per-skill regex loop
+
+    python -m benchmarks.skill_matcher [--resumes 1000]
+"""
+import argparse
+import random
+import re
+import time
+from app.ml.resume_parser import SKILLS_DATABASE, resume_parser
+
+FILLER = (
+    "Responsible for delivering features across the stack, working with "
+    "product and design to ship reliable software. Led code reviews, "
+    "mentored engineers and improved deployment pipelines. "
+).split()
+
+
+def legacy_extract_skills(text: str) -> list:
+    """Previous implementation: one regex search per known skill"""
+    text_lower = text.lower()
+    found_skills = []
+    for skill in SKILLS_DATABASE:
+        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
+        if re.search(pattern, text_lower):
+            found_skills.append(skill)
+    return list(set(found_skills))
+
+
+def synthetic_resume(rng: random.Random, words: int = 600, skill_density: float = 0.05) -> str:
+    """Generate resume-like text with a given share of skill mentions"""
+    tokens = []
+    for _ in range(words):
+        if rng.random() < skill_density:
+            tokens.append(rng.choice(SKILLS_DATABASE))
+        else:
+            tokens.append(rng.choice(FILLER))
+    return " ".join(tokens)
+
+
+def run(resumes: int = 1000, seed: int = 42) -> dict:
+    rng = random.Random(seed)
+    corpus = [synthetic_resume(rng) for _ in range(resumes)]
+
+    start = time.perf_counter()
+    legacy = [legacy_extract_skills(text) for text in corpus]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = [resume_parser.extract_skills(text) for text in corpus]
+    current_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy, current) if set(a) != set(b))
+
+    return {
+        "resumes": resumes,
+        "skills": len(SKILLS_DATABASE),
+        "legacy_seconds": round(legacy_seconds, 4),
+        "matcher_seconds": round(current_seconds, 4),
+        "speedup": round(legacy_seconds / current_seconds, 2) if current_seconds else None,
+        "mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for key, value in run(args.resumes, args.seed).items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
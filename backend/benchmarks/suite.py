@@ -0,0 +1,120 @@
+"""
+Run the micro-benchmarks and load scenarios, save JSON and flag regressions
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --output new.json --baseline results.json [--tolerance 0.15]
+
+With --baseline, every latency that rose or throughput that fell by more
+than the tolerance is reported and the exit status is 1. Compare runs made
+on the same machine and database.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+from benchmarks import micro, scenarios
+
+# Metric name suffixes and whether a larger value is better
+HIGHER_IS_BETTER = ("_per_second",)
+LOWER_IS_BETTER = ("_us", "_ms", "_seconds")
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(results: Dict, prefix: str = "") -> Dict[str, float]:
+    """{"micro": {"parse_pdf": {"p95_us": 1}}} -> {"micro.parse_pdf.p95_us": 1}"""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """Metrics in `current` that are worse than `baseline` by more than `tolerance`"""
+    regressions = []
+    old_metrics = flatten(baseline["results"])
+    for name, new in flatten(current["results"]).items():
+        old = old_metrics.get(name)
+        if not old:
+            continue
+        if name.endswith(HIGHER_IS_BETTER):
+            change = (old - new) / old
+        elif name.endswith(LOWER_IS_BETTER):
+            change = (new - old) / old
+        else:
+            continue
+        if change > tolerance:
+            regressions.append({"metric": name, "baseline": old, "current": new, "worse_by": round(change, 3)})
+    return regressions
+
+
+def run(include_scenarios: bool = True, duration: float = 10.0, concurrency: int = 16) -> Dict:
+    results = {"micro": micro.run()["results"]}
+    if include_scenarios:
+        scenario_run = scenarios.run(list(scenarios.SCENARIOS), concurrency=concurrency, duration=duration)
+        results["scenarios"] = scenario_run["results"]
+        database = scenario_run["config"]["database"]
+    else:
+        database = None
+
+    return {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": database
+        },
+        "results": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Write results to this JSON file (default: stdout)")
+    parser.add_argument("--baseline", help="Previous results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative slowdown, e.g. 0.15 = 15%%")
+    parser.add_argument("--micro-only", action="store_true", help="Skip the load scenarios")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    current = run(not args.micro_only, args.duration, args.concurrency)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            current["regressions"] = compare(current, json.load(f), args.tolerance)
+
+    output = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    for regression in current.get("regressions", []):
+        print(
+            f"REGRESSION {regression['metric']}: {regression['baseline']} -> {regression['current']} "
+            f"({regression['worse_by']:+.0%})",
+            file=sys.stderr
+        )
+    if current.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Shared fixtures: a throwaway SQLite database, the API test client and an
+authenticated user
+
+Settings are read once when app modules are imported, so the environment
+is set here before anything from app is imported.
+"""
+import os
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix="hrai-tests-")
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{TEST_DIR}/test.db",
+    "DATABASE_ASYNC": "false",
+    "SCORING_QUEUE_BACKEND": "memory",
+    "SCORING_WORKER_ENABLED": "false",
+    "UPLOAD_DIR": f"{TEST_DIR}/uploads",
+    "PARSE_CACHE_ENABLED": "false",
+    "AI_CACHE_ENABLED": "false",
+    "OPENAI_API_KEY": "",
+    "BCRYPT_ROUNDS": "4",
+})
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.database import Base, SessionLocal, engine
+from app.utils.auth_cache import auth_cache
+
+
+@pytest.fixture
+def db():
+    """A session on freshly created tables"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    auth_cache.clear()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    # One lifespan for the whole run: shutdown stops the password hashing pool
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(app_client, db):
+    """The API test client on fresh tables"""
+    return app_client
+
+
+@pytest.fixture
+def auth_headers(client):
+    response = client.post("/api/auth/register", json={
+        "email": "recruiter@example.com",
+        "password": "secret-password",
+        "company_name": "Example Co"
+    })
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,278 @@
+"""
+AIAnalyzer against the local fake OpenAI server: retries with backoff, the
+circuit breaker, the cap on concurrent requests, cache keys of batches and
+cache hits in the score breakdown
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.config import get_settings
+from app.ml import ai_analyzer as ai_analyzer_module
+from app.ml.ai_analyzer import AIAnalyzer
+from app.ml.analysis_cache import AnalysisCache
+from app.services import scoring
+from app.utils.resilience import CircuitBreaker, ConcurrencyLimiter, backoff_delay
+from benchmarks.fake_openai import start_fake_openai
+
+settings = get_settings()
+
+JOB = {
+    "title": "Backend Developer",
+    "description": "Build APIs",
+    "requirements": "Python services in production",
+    "skills": ["Python", "Docker"],
+    "min_experience": 3
+}
+RESUME = "Jane Doe\njane@example.com\nBackend developer with 5 years of experience in Python and Docker."
+
+
+@pytest.fixture
+def fake_openai():
+    server = start_fake_openai(seed=1)
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def make_analyzer(monkeypatch, fake_openai):
+    """Build an AIAnalyzer on the fake server with the given settings overrides"""
+    def make(**overrides) -> AIAnalyzer:
+        overrides = {
+            "openai_api_key": "fake",
+            "openai_base_url": fake_openai.base_url,
+            "openai_backoff_base_seconds": 0.01,
+            "openai_backoff_max_seconds": 0.02,
+            **overrides
+        }
+        for name, value in overrides.items():
+            monkeypatch.setattr(settings, name, value)
+        return AIAnalyzer()
+    return make
+
+
+def record_delays(monkeypatch, analyzer: AIAnalyzer) -> list:
+    delays = []
+    retry_delay = analyzer._retry_delay
+
+    def recording(error, attempt):
+        delays.append((attempt, retry_delay(error, attempt)))
+        return delays[-1][1]
+
+    monkeypatch.setattr(analyzer, "_retry_delay", recording)
+    return delays
+
+
+def test_retries_with_backoff_then_succeeds(make_analyzer, fake_openai, monkeypatch):
+    analyzer = make_analyzer(openai_max_retries=3)
+    delays = record_delays(monkeypatch, analyzer)
+    fake_openai.fail_next = 2
+
+    result = analyzer.analyze_resume(RESUME, JOB)
+
+    assert result["ai_powered"]
+    assert fake_openai.requests == 3
+    assert [attempt for attempt, _ in delays] == [1, 2]
+    for attempt, delay in delays:
+        assert 0 <= delay <= min(0.02, 0.01 * 2 ** (attempt - 1))
+    assert analyzer.circuit_breaker.state == "closed"
+
+
+def test_gives_up_after_max_retries_and_falls_back(make_analyzer, fake_openai, monkeypatch):
+    analyzer = make_analyzer(openai_max_retries=2, openai_circuit_failure_threshold=100)
+    delays = record_delays(monkeypatch, analyzer)
+    fake_openai.error_rate = 1.0
+
+    result = analyzer.analyze_resume(RESUME, JOB)
+
+    assert not result["ai_powered"]
+    assert "Python" in result["matched_skills"]
+    assert fake_openai.requests == 3
+    assert len(delays) == 2
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    for attempt in range(1, 8):
+        cap = min(1.0, 0.1 * 2 ** (attempt - 1))
+        delays = [backoff_delay(attempt, 0.1, 1.0) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_circuit_breaker_opens_and_half_opens(make_analyzer, fake_openai):
+    analyzer = make_analyzer(
+        openai_max_retries=0,
+        openai_circuit_failure_threshold=2,
+        openai_circuit_reset_seconds=0.2
+    )
+    fake_openai.error_rate = 1.0
+
+    for _ in range(2):
+        assert not analyzer.analyze_resume(RESUME, JOB)["ai_powered"]
+    assert analyzer.circuit_breaker.state == "open"
+
+    # Open: falls back to the rule-based scorer without calling the provider
+    requests = fake_openai.requests
+    result = analyzer.analyze_resume(RESUME, JOB)
+    assert not result["ai_powered"]
+    assert result["final_score"] > 0
+    assert fake_openai.requests == requests
+
+    # Half-open: one trial call; its failure opens the circuit again
+    time.sleep(0.25)
+    assert analyzer.circuit_breaker.state == "half_open"
+    assert not analyzer.analyze_resume(RESUME, JOB)["ai_powered"]
+    assert fake_openai.requests == requests + 1
+    assert analyzer.circuit_breaker.state == "open"
+
+    # A successful trial closes it
+    time.sleep(0.25)
+    fake_openai.error_rate = 0.0
+    assert analyzer.analyze_resume(RESUME, JOB)["ai_powered"]
+    assert analyzer.circuit_breaker.state == "closed"
+
+
+def test_circuit_breaker_allows_one_trial_when_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow()
+
+
+def test_concurrent_requests_are_capped(make_analyzer, fake_openai):
+    analyzer = make_analyzer(openai_max_concurrency=3)
+    fake_openai.latency = 0.1
+
+    with ThreadPoolExecutor(12) as pool:
+        results = list(pool.map(lambda i: analyzer.analyze_resume(f"{RESUME}\nCandidate {i}", JOB), range(12)))
+
+    assert all(result["ai_powered"] for result in results)
+    assert fake_openai.requests == 12
+    assert fake_openai.max_in_flight == 3
+
+
+def test_async_retries_with_backoff_then_succeeds(make_analyzer, fake_openai, monkeypatch):
+    analyzer = make_analyzer(openai_max_retries=3)
+    delays = record_delays(monkeypatch, analyzer)
+    fake_openai.fail_next = 2
+
+    result = asyncio.run(analyzer.analyze_resume_async(RESUME, JOB))
+
+    assert result["ai_powered"]
+    assert result == {**analyzer.analyze_resume(RESUME, JOB), "cached": False}
+    assert fake_openai.requests == 4
+    assert [attempt for attempt, _ in delays] == [1, 2]
+
+
+def test_async_falls_back_when_circuit_is_open(make_analyzer, fake_openai):
+    analyzer = make_analyzer(openai_max_retries=0, openai_circuit_failure_threshold=1)
+    fake_openai.error_rate = 1.0
+
+    assert not asyncio.run(analyzer.analyze_resume_async(RESUME, JOB))["ai_powered"]
+    assert analyzer.circuit_breaker.state == "open"
+    assert not asyncio.run(analyzer.analyze_resume_async(RESUME, JOB))["ai_powered"]
+    assert fake_openai.requests == 1
+
+
+def test_sync_and_async_requests_share_one_cap(make_analyzer, fake_openai):
+    analyzer = make_analyzer(openai_max_concurrency=3)
+    fake_openai.latency = 0.1
+
+    async def analyze_async():
+        return await asyncio.gather(*(
+            analyzer.analyze_resume_async(f"{RESUME}\nAsync candidate {i}", JOB) for i in range(8)
+        ))
+
+    with ThreadPoolExecutor(8) as pool:
+        sync_results = pool.map(lambda i: analyzer.analyze_resume(f"{RESUME}\nCandidate {i}", JOB), range(8))
+        async_results = asyncio.run(analyze_async())
+        results = list(sync_results) + async_results
+
+    assert all(result["ai_powered"] for result in results)
+    assert fake_openai.requests == 16
+    assert fake_openai.max_in_flight == 3
+    assert analyzer._slots.in_use == 0
+
+
+def test_limiter_hands_slots_over_and_survives_cancellation():
+    limiter = ConcurrencyLimiter(1)
+
+    async def scenario():
+        await limiter.acquire_async()
+        cancelled = asyncio.create_task(limiter.acquire_async())
+        waiting = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        # A thread releasing the slot wakes the remaining coroutine
+        threading.Thread(target=limiter.release).start()
+        await asyncio.wait_for(waiting, 1)
+        assert limiter.in_use == 1
+
+        # A thread waits behind the coroutine holding the slot
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+        await asyncio.sleep(0.05)
+        assert not acquired.is_set()
+        limiter.release()
+        await asyncio.to_thread(thread.join)
+        assert acquired.is_set()
+        limiter.release()
+
+    asyncio.run(scenario())
+    assert limiter.in_use == 0
+    with limiter:
+        assert limiter.in_use == 1
+
+
+@pytest.fixture
+def cached_analyzer(make_analyzer, monkeypatch, tmp_path):
+    monkeypatch.setattr(ai_analyzer_module, "analysis_cache", AnalysisCache(str(tmp_path / "analysis.sqlite3"), 3600))
+    return make_analyzer(ai_cache_enabled=True, ai_batch_size=4)
+
+
+def test_batch_results_are_not_served_as_single_analyses(cached_analyzer, fake_openai):
+    resumes = [f"{RESUME}\nCandidate {i}" for i in range(3)]
+
+    assert not any(result["cached"] for result in cached_analyzer.analyze_batch(resumes, JOB))
+    assert fake_openai.requests == 1
+
+    # The same batch again is served from the batch entries
+    assert all(result["cached"] for result in cached_analyzer.analyze_batch(resumes, JOB))
+    assert fake_openai.requests == 1
+
+    # A single-resume analysis makes its own request despite the batch entry
+    assert not cached_analyzer.analyze_resume(resumes[0], JOB)["cached"]
+    assert fake_openai.requests == 2
+    assert cached_analyzer.analyze_resume(resumes[0], JOB)["cached"]
+    assert fake_openai.requests == 2
+
+
+def test_batch_reuses_single_analyses(cached_analyzer, fake_openai):
+    resumes = [f"{RESUME}\nCandidate {i}" for i in range(3)]
+    single = cached_analyzer.analyze_resume(resumes[1], JOB)
+
+    results = cached_analyzer.analyze_batch(resumes, JOB)
+
+    assert fake_openai.requests == 2
+    assert [result["cached"] for result in results] == [False, True, False]
+    assert results[1]["final_score"] == single["final_score"]
+
+
+def test_score_breakdown_records_cache_hits(cached_analyzer, fake_openai, monkeypatch):
+    monkeypatch.setattr(scoring, "ai_analyzer", cached_analyzer)
+    job_data = {**JOB, "cascade_min_rule_score": None, "cascade_top_k": None}
+
+    results = [scoring.score_resume({"raw_text": RESUME, "skills": ["Python"]}, job_data)[1] for _ in range(2)]
+
+    assert fake_openai.requests == 1
+    breakdowns = [scoring.build_score_breakdown(result) for result in results]
+    assert [breakdown["ai_cached"] for breakdown in breakdowns] == [False, True]
+    assert all(breakdown["ai_powered"] for breakdown in breakdowns)
@@ -0,0 +1,82 @@
+"""
+AnalysisCache expires entries after their TTL, batches recency updates of
+hits and evicts least recently used entries only once over the limit
+"""
+import time
+import pytest
+from app.ml import analysis_cache as analysis_cache_module
+from app.ml.analysis_cache import AnalysisCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def make_cache(tmp_path, **kwargs) -> AnalysisCache:
+    return AnalysisCache(str(tmp_path / "analysis.sqlite3"), **{"ttl_seconds": 3600, **kwargs})
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("a", {"final_score": 80})
+
+    clock[0] += 3599
+    assert cache.get("a") == {"final_score": 80}
+
+    clock[0] += 2
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_swept_by_puts(tmp_path, clock, monkeypatch):
+    cache = make_cache(tmp_path)
+    cache.put("old", {"final_score": 1})
+    clock[0] += 3601
+    monkeypatch.setattr(analysis_cache_module, "EXPIRE_SWEEP_SECONDS", 0)
+
+    cache.put("new", {"final_score": 2})
+
+    assert cache.stats()["entries"] == 1
+    assert cache._entries == 1
+
+
+def test_hits_do_not_write_until_flushed(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    for key in ("a", "b"):
+        cache.put(key, {"key": key})
+    statements = []
+    event_conn = cache._connect()
+    event_conn.set_trace_callback(statements.append)
+
+    clock[0] += 10
+    for _ in range(5):
+        assert cache.get("a") == {"key": "a"}
+
+    assert not [statement for statement in statements if not statement.strip().startswith("SELECT")]
+    assert cache._touched == {"a": clock[0]}
+
+
+def test_evicts_least_recently_used_only_over_the_limit(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=10)
+    for i in range(10):
+        clock[0] += 1
+        cache.put(str(i), {"i": i})
+    statements = []
+    cache._connect().set_trace_callback(statements.append)
+
+    # "0" is the oldest put but was read since; the hit is flushed before evicting
+    clock[0] += 1
+    cache.get("0")
+    assert not any(statement.strip().startswith("DELETE") for statement in statements)
+    clock[0] += 1
+    cache.put("10", {"i": 10})
+
+    assert cache.stats()["entries"] == 9
+    assert cache._entries == 9
+    assert cache.get("0") == {"i": 0}
+    assert [cache.get(str(i)) for i in (1, 2)] == [None, None]
+    assert sum(statement.strip().startswith("DELETE") for statement in statements) == 2
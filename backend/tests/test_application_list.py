@@ -0,0 +1,74 @@
+"""
+Keyset paging of a job's applications: every row is returned once, in
+(score, id) order, across score ties and the unscored rows after them
+"""
+import uuid
+import pytest
+from app.models.application import Application
+from app.models.candidate import Candidate
+
+SCORES = [90, 80, 80, 80, 80, 70, None, None, None]
+
+
+@pytest.fixture
+def job_id(client, auth_headers):
+    response = client.post("/api/jobs", json={
+        "title": "Backend Developer",
+        "description": "Build APIs",
+        "requirements": "Python",
+        "skills": ["Python"],
+        "min_experience": 2
+    }, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    return uuid.UUID(response.json()["id"])
+
+
+@pytest.fixture
+def expected_order(db, job_id):
+    """Application ids as the list orders them: best score first, then unscored, ties by id"""
+    rows = []
+    for i, score in enumerate(SCORES):
+        candidate = Candidate(full_name=f"Candidate {i}", email=f"candidate{i}@example.com")
+        db.add(candidate)
+        db.flush()
+        application = Application(job_id=job_id, candidate_id=candidate.id, ai_score=score,
+                                  scoring_status="completed" if score is not None else "pending")
+        db.add(application)
+        db.flush()
+        rows.append((score, application.id))
+    db.commit()
+
+    scored = sorted((row for row in rows if row[0] is not None), reverse=True)
+    unscored = sorted((row for row in rows if row[0] is None), key=lambda row: row[1], reverse=True)
+    return [application_id for _, application_id in scored + unscored]
+
+
+def all_pages(client, auth_headers, job_id, limit: int) -> list:
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(f"/api/jobs/{job_id}/applications", params=params, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert page["total"] == len(SCORES)
+        pages.append([uuid.UUID(application["id"]) for application in page["applications"]])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return pages
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 6, 9, 50])
+def test_pages_cover_ties_and_unscored_rows_once(client, auth_headers, job_id, expected_order, limit):
+    pages = all_pages(client, auth_headers, job_id, limit)
+
+    assert [application_id for page in pages for application_id in page] == expected_order
+    assert all(len(page) == limit for page in pages[:-1])
+    assert len(pages) == -(-len(SCORES) // limit)
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers, job_id):
+    response = client.get(f"/api/jobs/{job_id}/applications", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
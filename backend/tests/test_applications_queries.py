@@ -0,0 +1,75 @@
+"""
+Query count of the application list: one joined query per page, however
+many applications a job has
+"""
+import uuid
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event
+from app.db.database import engine
+from app.models.application import Application
+from app.models.candidate import Candidate
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def job_id(client, auth_headers):
+    response = client.post("/api/jobs", json={
+        "title": "Backend Developer",
+        "description": "Build APIs",
+        "requirements": "Python",
+        "skills": ["Python", "Docker"],
+        "min_experience": 2
+    }, headers=auth_headers)
+    assert response.status_code in (200, 201), response.text
+    return uuid.UUID(response.json()["id"])
+
+
+def add_applications(db, job_id: uuid.UUID, count: int) -> None:
+    for i in range(count):
+        candidate = Candidate(full_name=f"Candidate {i}", email=f"candidate{uuid.uuid4().hex}@example.com")
+        db.add(candidate)
+        db.flush()
+        db.add(Application(
+            job_id=job_id,
+            candidate_id=candidate.id,
+            ai_score=i % 100,
+            score_breakdown={"matched_skills": ["Python"], "missing_skills": ["Docker"]},
+            scoring_status="completed"
+        ))
+    db.commit()
+
+
+def list_query_count(client, auth_headers, job_id: uuid.UUID, expected: int) -> int:
+    with count_queries() as statements:
+        response = client.get(f"/api/jobs/{job_id}/applications?limit=200", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()["applications"]) == expected
+    return len(statements)
+
+
+def test_list_query_count_does_not_grow_with_applications(client, auth_headers, db, job_id):
+    # Warm the authenticated user cache so every request does the same lookups
+    list_query_count(client, auth_headers, job_id, 0)
+
+    counts = {}
+    total = 0
+    for count in (1, 10, 100):
+        add_applications(db, job_id, count - total)
+        total = count
+        counts[count] = list_query_count(client, auth_headers, job_id, count)
+
+    assert counts[1] == counts[10] == counts[100], counts
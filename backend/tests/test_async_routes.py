@@ -0,0 +1,129 @@
+"""
+The async routers answer like the sync ones: same responses for the same
+data, and the same writes and errors, over an aiosqlite session
+"""
+import uuid
+from contextlib import asynccontextmanager
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.api.async_routes import applications, auth, jobs
+from app.config import get_settings
+from app.db.database import async_database_url, get_async_db
+from app.models.application import Application
+from app.models.job import Job
+
+settings = get_settings()
+
+SCORES = [None, 72.5, 72.5, 91]
+
+
+@pytest.fixture
+def async_client(app_client, db):
+    """A client of an app serving only the async routers, on the test database"""
+    engine = create_async_engine(async_database_url(settings.database_url))
+    sessions = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def get_db():
+        async with sessions() as session:
+            yield session
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await engine.dispose()
+
+    async_app = FastAPI(lifespan=lifespan)
+    for module in (auth, jobs, applications):
+        async_app.include_router(module.router, prefix="/api")
+    async_app.dependency_overrides[get_async_db] = get_db
+    with TestClient(async_app) as test_client:
+        yield test_client
+
+
+def create_job(client, headers) -> dict:
+    response = client.post("/api/jobs", json={
+        "title": "Backend Developer",
+        "description": "Build APIs",
+        "requirements": "Python",
+        "skills": ["Python", "Docker"],
+        "min_experience": 2
+    }, headers=headers)
+    assert response.status_code == 201, response.text
+    response = client.patch(f"/api/jobs/{response.json()['id']}", json={"status": "published"}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def apply(client, public_link: str, email: str):
+    return client.post(
+        f"/api/public/apply/{public_link}",
+        data={"full_name": "Jane Doe", "email": email},
+        files={"resume": ("resume.pdf", b"%PDF-1.4 tiny", "application/pdf")}
+    )
+
+
+def test_reads_match_the_sync_routes(client, async_client, auth_headers, db):
+    job = create_job(client, auth_headers)
+    ids = []
+    for i, score in enumerate(SCORES):
+        response = apply(client, job["public_link"], f"candidate{i}@example.com")
+        assert response.status_code == 200, response.text
+        application = db.get(Application, uuid.UUID(response.json()["application_id"]))
+        application.ai_score = score
+        application.skills = ["python"]
+        ids.append(application.id)
+    db.commit()
+
+    first_page = client.get(f"/api/jobs/{job['id']}/applications", params={"limit": 2}, headers=auth_headers)
+    paths = [
+        ("/api/auth/me", {}),
+        ("/api/jobs", {}),
+        (f"/api/jobs/{job['id']}", {}),
+        (f"/api/jobs/{uuid.uuid4()}", {}),
+        (f"/api/public/jobs/{job['public_link']}", {}),
+        (f"/api/jobs/{job['id']}/applications", {"limit": 2}),
+        (f"/api/jobs/{job['id']}/applications", {"limit": 2, "cursor": first_page.json()["next_cursor"]}),
+        (f"/api/jobs/{job['id']}/applications", {"sort_by": "date", "min_score": 80}),
+        (f"/api/jobs/{job['id']}/applications", {"cursor": "not-a-cursor"}),
+        (f"/api/applications/{ids[1]}", {}),
+        ("/api/applications/search", {"skill": "python", "limit": 3}),
+    ]
+    for path, params in paths:
+        expected = client.get(path, params=params, headers=auth_headers)
+        response = async_client.get(path, params=params, headers=auth_headers)
+
+        assert (response.status_code, response.json()) == (expected.status_code, expected.json()), path
+
+
+def test_writes_and_errors(async_client, db):
+    user = {"email": "async@example.com", "password": "secret-password", "company_name": "Async Co"}
+    assert async_client.post("/api/auth/register", json=user).status_code == 201
+    assert async_client.post("/api/auth/register", json=user).status_code == 400
+    assert async_client.post("/api/auth/login", json={**user, "password": "wrong"}).status_code == 401
+    response = async_client.post("/api/auth/login", json=user)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    job = create_job(async_client, headers)
+    response = apply(async_client, job["public_link"], "jane@example.com")
+    assert response.status_code == 200, response.text
+    application_id = response.json()["application_id"]
+    assert apply(async_client, job["public_link"], "jane@example.com").status_code == 400
+
+    assert async_client.put(f"/api/applications/{application_id}/notes", json={"note": "Call back"},
+                            headers=headers).status_code == 200
+    assert async_client.post(f"/api/applications/{application_id}/action", json={"action": "interview"},
+                             headers=headers).status_code == 200
+    assert async_client.post(f"/api/applications/{application_id}/action", json={"action": "promote"},
+                             headers=headers).status_code == 400
+
+    application = db.get(Application, uuid.UUID(application_id))
+    assert (application.notes, application.status, application.scoring_status) == ("Call back", "interview", "pending")
+    response = async_client.get(f"/api/jobs/{job['id']}", headers=headers)
+    assert response.json()["applications_by_status"] == {"interview": 1}
+
+    assert async_client.delete(f"/api/jobs/{job['id']}", headers=headers).status_code == 204
+    db.expire_all()
+    assert db.get(Job, uuid.UUID(job["id"])) is None
+    assert async_client.get(f"/api/jobs/{job['id']}", headers=headers).status_code == 404
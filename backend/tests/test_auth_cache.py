@@ -0,0 +1,45 @@
+"""
+Cached users follow ORM changes at once and other changes within the TTL
+"""
+import time
+import pytest
+from sqlalchemy import text
+from app.models.user import User
+from app.utils import auth_cache as auth_cache_module
+from app.utils.auth_cache import auth_cache
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(auth_cache_module, "time", clock)
+    return clock
+
+
+def test_orm_update_invalidates_cached_user(client, auth_headers, db):
+    assert client.get("/api/auth/me", headers=auth_headers).json()["company_name"] == "Example Co"
+
+    user = db.query(User).filter(User.email == "recruiter@example.com").one()
+    user.company_name = "Globex"
+    db.commit()
+
+    assert client.get("/api/auth/me", headers=auth_headers).json()["company_name"] == "Globex"
+
+
+def test_raw_delete_is_seen_after_ttl(client, auth_headers, db, clock):
+    assert client.get("/api/auth/me", headers=auth_headers).status_code == 200
+
+    db.execute(text("DELETE FROM users"))
+    db.commit()
+    assert client.get("/api/auth/me", headers=auth_headers).status_code == 200
+
+    clock.now += auth_cache.ttl_seconds + 1
+    assert client.get("/api/auth/me", headers=auth_headers).status_code == 401
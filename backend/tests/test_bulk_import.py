@@ -0,0 +1,85 @@
+"""
+Bulk import matches resumes to existing candidates by email address,
+whatever the case of the stored address, and keeps queries off the event loop
+"""
+import asyncio
+import random
+import uuid
+import pytest
+from sqlalchemy import event
+from app.db.database import engine
+from app.models.application import Application
+from app.models.candidate import Candidate
+from benchmarks.resumes import pdf_bytes, resume_text
+
+
+@pytest.fixture
+def job_id(client, auth_headers):
+    response = client.post("/api/jobs", json={
+        "title": "Backend Developer",
+        "description": "Build APIs",
+        "requirements": "Python",
+        "skills": ["Python", "Docker"],
+        "min_experience": 2
+    }, headers=auth_headers)
+    assert response.status_code in (200, 201), response.text
+    return uuid.UUID(response.json()["id"])
+
+
+def import_resume(client, auth_headers, job_id: uuid.UUID, email: str) -> dict:
+    pdf = pdf_bytes(f"Jane Doe\n{email}\n" + resume_text(random.Random(0), 200))
+    response = client.post(
+        f"/api/jobs/{job_id}/applications/import",
+        files=[("files", ("jane.pdf", pdf, "application/pdf"))],
+        headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_import_reuses_mixed_case_candidate(client, auth_headers, db, job_id):
+    candidate = Candidate(full_name="Jane Doe", email="Jane.Doe@Example.com")
+    db.add(candidate)
+    db.commit()
+
+    report = import_resume(client, auth_headers, job_id, "jane.doe@example.com")
+
+    assert report["imported"] == 1, report
+    db.expire_all()
+    assert db.query(Candidate).count() == 1
+    application = db.query(Application).filter(Application.job_id == job_id).one()
+    assert application.candidate_id == candidate.id
+
+
+def test_import_reports_mixed_case_duplicate(client, auth_headers, db, job_id):
+    candidate = Candidate(full_name="Jane Doe", email="Jane.Doe@Example.com")
+    db.add(candidate)
+    db.flush()
+    db.add(Application(job_id=job_id, candidate_id=candidate.id, scoring_status="completed"))
+    db.commit()
+
+    report = import_resume(client, auth_headers, job_id, "jane.doe@example.com")
+
+    assert report["duplicates"] == 1, report
+    db.expire_all()
+    assert db.query(Application).filter(Application.job_id == job_id).count() == 1
+
+
+def test_import_queries_run_off_the_event_loop(client, auth_headers, job_id):
+    on_event_loop = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(statement)
+        except RuntimeError:
+            pass
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        report = import_resume(client, auth_headers, job_id, "jane.doe@example.com")
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert report["imported"] == 1
+    assert on_event_loop == []
@@ -0,0 +1,98 @@
+"""
+ResumeCondenser keeps dated content, splits sections only at real headings
+and packs the most useful sections into the token budget
+"""
+import pytest
+from app.ml.condenser import TRUNCATION_MARKER, ResumeCondenser
+from app.ml.resume_parser import resume_parser
+from app.services.scoring import analysis_text
+
+condenser = ResumeCondenser(max_tokens=1000, tokenizer="estimate")
+
+RESUME = """Jane Doe
+jane@example.com | +1 555 0100
+
+Summary
+Backend engineer building payment APIs.
+
+Experience
+Senior Engineer, Acme Payments
+2021
+Led the migration of the ledger service to PostgreSQL.
+Engineer, Globex
+2017
+Built the fraud scoring pipeline in Python.
+
+Page 1 of 2
+
+Skills
+Python
+Tools
+Docker
+
+EDUCATION
+BSc Computer Science, State University
+2016
+2/2"""
+
+
+def kept_lines(text: str) -> list:
+    return [line for section in condenser.sections(text) for line in section.lines]
+
+
+@pytest.mark.parametrize("line", ["Page 2", "page 2 of 3", "PAGE 3/4", "1 of 2", "2/2", "-----"])
+def test_page_numbers_and_separators_are_dropped(line):
+    assert kept_lines(f"Jane Doe\n{line}\nBackend engineer") == ["Jane Doe", "Backend engineer"]
+
+
+@pytest.mark.parametrize("line", ["2021", "2019/2021", "2019 - 2021", "12 years"])
+def test_years_are_kept(line):
+    assert line in kept_lines(f"Jane Doe\n{line}\nBackend engineer")
+
+
+def test_sections_split_at_headings_only():
+    sections = condenser.sections(RESUME)
+
+    assert [section.kind for section in sections] == ["header", "summary", "experience", "skills", "education"]
+    assert sections[3].lines == ["Python", "Tools", "Docker"]
+    assert sections[2].lines[1] == "2021" and sections[4].lines[-1] == "2016"
+
+
+@pytest.mark.parametrize("line, kind", [
+    ("TOOLS", "skills"),
+    ("Tools:", "skills"),
+    ("Career", None),
+    ("CAREER", "experience"),
+    ("Leadership", None),
+    ("Training", None),
+    ("Training:", "certifications"),
+    ("Work Experience", "experience"),
+])
+def test_ambiguous_headings_need_heading_formatting(line, kind):
+    assert condenser._heading_kind(line) == kind
+
+
+def test_condense_fits_budget_in_original_order():
+    experience = "\n".join(f"Engineer at Company {i}, built service {i} in Python and Go" for i in range(60))
+    text = RESUME.replace("Experience\n", f"Experience\n{experience}\n")
+
+    condensed = condenser.condense(text, max_tokens=200)
+
+    assert condensed.tokens <= 200 < condensed.original_tokens
+    assert condensed.truncated_sections == ["experience"]
+    assert TRUNCATION_MARKER in condensed.text
+    lines = condensed.text.splitlines()
+    # Short sections are kept whole, around the cut experience section
+    assert lines.index("Summary") < lines.index("Experience") < lines.index("Skills") < lines.index("EDUCATION")
+    assert "2016" in lines
+
+
+def test_parsing_does_not_condense():
+    resume_data = resume_parser.parse_text(RESUME)
+    assert "condensed_text" not in resume_data
+
+    text = analysis_text(resume_data)
+
+    assert text == resume_data["condensed_text"]
+    assert "2021" in text.splitlines()
+    assert resume_data["condensed_tokens"] <= resume_data["text_tokens"]
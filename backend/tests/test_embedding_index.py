@@ -0,0 +1,118 @@
+"""
+EmbeddingIndex ranks a job's applications by similarity to the job,
+rebuilds its cached matrix when they change and caps the cache by size
+"""
+import uuid
+import numpy as np
+import pytest
+from app.ml.embeddings import TextEmbedder, top_k
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.services.embedding_index import EmbeddingIndex
+
+embedder = TextEmbedder(dim=64)
+
+RESUMES = [
+    "Kubernetes Terraform site reliability engineer on call",
+    "Pastry chef, sourdough and croissants",
+    "Kubernetes operator written in Go",
+]
+
+
+@pytest.fixture
+def user(db):
+    user = User(email="owner@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def make_job(db, user) -> Job:
+    job = Job(user_id=user.id, title="Site Reliability Engineer", description="Kubernetes and Terraform",
+              requirements="On call", skills=["Kubernetes"], public_link=uuid.uuid4().hex)
+    db.add(job)
+    db.commit()
+    return job
+
+
+def add_application(db, job: Job, text: str, embedding: bytes = None) -> uuid.UUID:
+    content_hash = uuid.uuid4().hex * 2
+    candidate = Candidate(full_name="Candidate", email=f"{content_hash[:8]}@example.com")
+    db.add_all([candidate, Resume(
+        content_hash=content_hash, parser_version="test", text=text, parsed={},
+        embedding=embedding if embedding is not None else embedder.to_bytes(embedder.embed(text))
+    )])
+    db.flush()
+    application = Application(job_id=job.id, candidate_id=candidate.id, resume_hash=content_hash)
+    db.add(application)
+    db.commit()
+    return application.id
+
+
+def test_top_k_returns_best_rows_first():
+    matrix = np.array([[0.1, 0], [0.9, 0], [0.5, 0], [0.7, 0]], dtype=np.float32)
+
+    assert [row for row, _ in top_k(matrix, np.array([1, 0], dtype=np.float32), 3)] == [1, 3, 2]
+    assert top_k(matrix, np.array([1, 0], dtype=np.float32), 0) == []
+
+
+def test_rank_orders_applications_by_similarity(db, user):
+    job = make_job(db, user)
+    ids = [add_application(db, job, text) for text in RESUMES]
+
+    ranked = EmbeddingIndex(embedder).rank(db, job, 2)
+
+    assert [application_id for application_id, _ in ranked] == [ids[0], ids[2]]
+    assert ranked[0][1] > ranked[1][1] > 0
+
+
+def test_matrix_is_rebuilt_when_applications_change(db, user):
+    job = make_job(db, user)
+    add_application(db, job, RESUMES[1])
+    index = EmbeddingIndex(embedder)
+
+    index.rank(db, job, 5)
+    index.rank(db, job, 5)
+    assert (index.hits, index.misses) == (1, 1)
+
+    added = add_application(db, job, RESUMES[0])
+    ranked = index.rank(db, job, 5)
+
+    assert (index.hits, index.misses) == (1, 2)
+    assert ranked[0][0] == added
+
+
+def test_vectors_of_another_dimension_are_skipped(db, user):
+    job = make_job(db, user)
+    kept = add_application(db, job, RESUMES[0])
+    add_application(db, job, RESUMES[2], embedding=TextEmbedder(dim=32).to_bytes(np.ones(32)))
+
+    assert embedder.from_bytes(TextEmbedder(dim=32).to_bytes(np.ones(32))) is None
+    assert embedder.from_bytes(None) is None
+    assert [application_id for application_id, _ in EmbeddingIndex(embedder).rank(db, job, 5)] == [kept]
+
+
+def test_cache_is_capped_by_bytes(db, user):
+    jobs = [make_job(db, user) for _ in range(4)]
+    for job, count in zip(jobs, (1, 1, 1, 4)):
+        for _ in range(count):
+            add_application(db, job, RESUMES[0])
+    # 64 float32s per row plus the IDF vector: 512 bytes per one-application job
+    index = EmbeddingIndex(embedder, max_bytes=1200)
+
+    for job in jobs[:2]:
+        index.job_matrix(db, job.id)
+    assert index.stats()["size_bytes"] == 1024
+
+    # Too large to keep, but still returned
+    assert len(index.job_matrix(db, jobs[3].id).application_ids) == 4
+    assert index.stats()["jobs"] == 2
+
+    # A third small matrix evicts the least recently used one
+    index.job_matrix(db, jobs[0].id)
+    index.job_matrix(db, jobs[2].id)
+    assert list(index._matrices) == [jobs[0].id, jobs[2].id]
+    assert index.stats()["size_bytes"] == 1024
@@ -0,0 +1,92 @@
+"""
+ExtractionPool against real worker processes: a document over its time
+limit gets its worker killed, a dead worker is replaced, and workers are
+recycled after max_tasks_per_worker documents
+"""
+import os
+import threading
+import time
+import pytest
+from app.services.extraction import ExtractionError, ExtractionPool, ExtractionTimeout
+from benchmarks.resumes import pdf_bytes
+
+RESUME = "Jane Doe\njane@example.com\nBackend developer, 5 years of Python"
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+
+
+@pytest.fixture
+def resume_path(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(pdf_bytes(RESUME))
+    return str(path)
+
+
+@pytest.fixture
+def stuck_path(tmp_path):
+    """A "PDF" that blocks whoever opens it, as no one ever writes to it"""
+    path = tmp_path / "stuck.pdf"
+    os.mkfifo(path)
+    return str(path)
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs) -> ExtractionPool:
+        pools.append(ExtractionPool(**{"processes": 1, "timeout": 20.0, **kwargs}))
+        return pools[-1]
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+def worker_pids(pool: ExtractionPool) -> list:
+    return [worker.process.pid for worker in pool._workers]
+
+
+def test_timeout_kills_the_worker_and_the_next_document_gets_a_new_one(make_pool, resume_path, stuck_path):
+    pool = make_pool()
+    assert "Jane Doe" in pool.extract_text(resume_path)
+    stuck = pool._workers[0].process
+
+    with pytest.raises(ExtractionTimeout):
+        pool.extract_text(stuck_path, timeout=0.5)
+
+    assert not stuck.is_alive()
+    assert pool._workers == []
+    assert "Jane Doe" in pool.extract_text(resume_path)
+    assert worker_pids(pool) != [stuck.pid]
+    assert pool.stats() == {"extracted": 2, "errors": 0, "timeouts": 1, "recycled": 0, "processes": 1, "alive": 1}
+
+
+def test_worker_dying_mid_document_is_an_error(make_pool, resume_path, stuck_path):
+    pool = make_pool()
+    pool.extract_text(resume_path)
+    worker = pool._workers[0].process
+
+    # Kill the worker while it is blocked on the document
+    threading.Timer(0.5, worker.kill).start()
+    started = time.monotonic()
+    with pytest.raises(ExtractionError, match="died"):
+        pool.extract_text(stuck_path)
+
+    assert time.monotonic() - started < 10
+    assert pool.stats()["errors"] == 1
+    assert "Jane Doe" in pool.extract_text(resume_path)
+    assert worker_pids(pool) != [worker.pid]
+
+
+def test_workers_are_recycled_after_max_tasks(make_pool, resume_path):
+    pool = make_pool(max_tasks_per_worker=2)
+
+    pids = []
+    for _ in range(3):
+        pool.extract_text(resume_path)
+        pids.append(worker_pids(pool))
+
+    # The second document retires the first worker; the third starts a new one
+    assert pids[0] != [] and pids[1] == [] and pids[2] not in ([], pids[0])
+    assert pool.stats()["recycled"] == 1
@@ -0,0 +1,94 @@
+"""
+Job application counts per status come from one grouped query, whatever
+the number of jobs, and only count the job's own applications
+"""
+import uuid
+import pytest
+from sqlalchemy import event
+from app.db.database import engine
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.user import User
+
+STATUSES = ["applied", "applied", "applied", "interview", "rejected"]
+
+
+def create_job(client, auth_headers, title: str) -> uuid.UUID:
+    response = client.post("/api/jobs", json={
+        "title": title,
+        "description": "Build APIs",
+        "requirements": "Python",
+        "skills": ["Python"],
+        "min_experience": 2
+    }, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    return uuid.UUID(response.json()["id"])
+
+
+def add_applications(db, job_id: uuid.UUID, statuses) -> None:
+    for app_status in statuses:
+        candidate = Candidate(full_name="Candidate", email=f"{uuid.uuid4().hex}@example.com")
+        db.add(candidate)
+        db.flush()
+        db.add(Application(job_id=job_id, candidate_id=candidate.id, status=app_status))
+    db.commit()
+
+
+def list_jobs(client, auth_headers) -> tuple:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get("/api/jobs", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert response.status_code == 200, response.text
+    return {uuid.UUID(job["id"]): job for job in response.json()["jobs"]}, len(statements)
+
+
+@pytest.fixture
+def other_job(db):
+    """Another recruiter's job with applications of its own"""
+    user = User(email="other@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    job = Job(user_id=user.id, title="Other", description="d", requirements="r", public_link=uuid.uuid4().hex)
+    db.add(job)
+    db.commit()
+    add_applications(db, job.id, ["applied", "interview"])
+    return job.id
+
+
+def test_counts_by_status(client, auth_headers, db, other_job):
+    busy = create_job(client, auth_headers, "Busy")
+    empty = create_job(client, auth_headers, "Empty")
+    add_applications(db, busy, STATUSES)
+
+    jobs, _ = list_jobs(client, auth_headers)
+
+    assert set(jobs) == {busy, empty}
+    assert jobs[busy]["applications_by_status"] == {"applied": 3, "interview": 1, "rejected": 1}
+    assert jobs[busy]["applications_count"] == len(STATUSES)
+    assert (jobs[empty]["applications_by_status"], jobs[empty]["applications_count"]) == ({}, 0)
+
+    response = client.get(f"/api/jobs/{busy}", headers=auth_headers)
+    assert response.json()["applications_by_status"] == jobs[busy]["applications_by_status"]
+
+
+def test_list_query_count_does_not_grow_with_jobs(client, auth_headers, db):
+    # Warm the authenticated user cache so every request does the same lookups
+    list_jobs(client, auth_headers)
+
+    counts = {}
+    created = 0
+    for total in (1, 5, 20):
+        for i in range(created, total):
+            add_applications(db, create_job(client, auth_headers, f"Job {i}"), STATUSES[:2])
+        created = total
+        counts[total] = list_jobs(client, auth_headers)[1]
+
+    assert counts[1] == counts[5] == counts[20], counts
@@ -0,0 +1,109 @@
+"""
+/api/metrics is served only to scrapers with METRICS_TOKEN, renders the
+Prometheus text format with cumulative histogram buckets, and metrics that
+fail to collect are logged instead of breaking the scrape
+"""
+import logging
+import uuid
+import pytest
+from app.config import get_settings
+from app.utils.metrics import Histogram, MetricsRegistry
+
+settings = get_settings()
+
+TOKEN = "scrape-token"
+
+
+@pytest.fixture
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(settings, "metrics_token", TOKEN)
+    return TOKEN
+
+
+def test_metrics_are_off_without_a_token(client):
+    assert client.get("/api/metrics").status_code == 404
+    assert client.get("/api/metrics", headers={"Authorization": "Bearer "}).status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer wrong"}, {"Authorization": f"Basic {TOKEN}"}])
+def test_metrics_need_the_token(client, metrics_token, headers):
+    response = client.get("/api/metrics", headers=headers)
+
+    assert response.status_code == 401
+    assert "hrai_" not in response.text
+
+
+def test_metrics_with_the_token(client, metrics_token, auth_headers):
+    response = client.get("/api/metrics", headers={"Authorization": f"Bearer {TOKEN}"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    # A user's API token is not a metrics token
+    assert client.get("/api/metrics", headers=auth_headers).status_code == 401
+
+
+def test_failing_gauge_is_logged_and_skipped(caplog):
+    registry = MetricsRegistry()
+    registry.gauge("broken", "Raises", lambda: 1 / 0)
+    registry.counter("requests_total", "Requests").inc()
+
+    with caplog.at_level(logging.ERROR, logger="app.utils.metrics"):
+        rendered = registry.render()
+
+    assert "requests_total 1" in rendered
+    assert "# TYPE broken gauge" in rendered and "\nbroken " not in rendered
+    assert "Error collecting metric broken" in caplog.text
+    assert "ZeroDivisionError" in caplog.text
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    histogram = Histogram("latency_seconds", "Latency", ["route"], buckets=(0.5, 0.1, 1.0))
+    for value in (0.05, 0.1, 0.3, 0.5, 2.0):
+        histogram.observe(value, route="/a")
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="0.5"} 4',
+        'latency_seconds_bucket{route="/a",le="1.0"} 4',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 5',
+        'latency_seconds_sum{route="/a"} 2.95',
+        'latency_seconds_count{route="/a"} 5',
+    ]
+    assert (histogram.count(route="/a"), histogram.count(route="/b")) == (5, 0)
+
+
+def test_labels_are_checked_and_escaped():
+    registry = MetricsRegistry()
+    counter = registry.counter("errors_total", "Errors", ["error"])
+    counter.inc(error='Bad "quote"\\n')
+
+    assert 'errors_total{error="Bad \\"quote\\"\\\\n"} 1' in registry.render()
+    with pytest.raises(ValueError):
+        counter.inc(kind="x")
+    with pytest.raises(ValueError):
+        registry.counter("errors_total", "Again")
+
+
+def test_scrape_reports_requests_by_route_template(client, metrics_token, auth_headers):
+    job_id = uuid.uuid4()
+    assert client.get(f"/api/jobs/{job_id}", headers=auth_headers).status_code == 404
+
+    response = client.get("/api/metrics", headers={"Authorization": f"Bearer {TOKEN}"})
+    lines = response.text.splitlines()
+
+    route = 'method="GET",route="/api/jobs/{job_id}",status="404"'
+    count = next(line for line in lines if line.startswith(f"hrai_http_request_duration_seconds_count{{{route}}}"))
+    assert int(count.rsplit(" ", 1)[1]) >= 1
+    assert f'hrai_http_request_duration_seconds_bucket{{{route},le="+Inf"}} {count.rsplit(" ", 1)[1]}' in lines
+    for name, kind in [
+        ("hrai_http_request_duration_seconds", "histogram"),
+        ("hrai_stage_duration_seconds", "histogram"),
+        ("hrai_scoring_total", "counter"),
+        ("hrai_db_pool_connections", "gauge"),
+    ]:
+        assert f"# TYPE {name} {kind}" in lines
+    assert any(line.startswith('hrai_db_pool_connections{engine="sync",state="idle"}') for line in lines)
+    # Path parameter values never become label values
+    assert str(job_id) not in response.text
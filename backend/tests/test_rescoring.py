@@ -0,0 +1,70 @@
+"""
+Registration of re-scoring runs, and which applications a run re-scores
+"""
+import hashlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from app.ml.resume_parser import resume_parser
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.user import User
+from app.services.rescoring import get_rescore_progress, rescore_job, start_rescore
+from app.services.resumes import store_resume
+
+RESUME = "Jane Doe\njane@example.com\nBackend developer with 5 years of experience in Python and Docker."
+
+
+def test_only_one_run_per_job_starts():
+    job_id = uuid.uuid4()
+
+    with ThreadPoolExecutor(8) as pool:
+        runs = list(pool.map(lambda _: start_rescore(job_id), range(32)))
+
+    started = [run for run in runs if run is not None]
+    assert len(started) == 1
+    assert get_rescore_progress(job_id) is started[0]
+
+
+def test_finished_run_is_replaced():
+    job_id = uuid.uuid4()
+    first = start_rescore(job_id)
+    first.status = "completed"
+
+    second = start_rescore(job_id, use_ai=True)
+
+    assert second is not None and second is not first
+    assert second.use_ai
+
+
+def test_queued_applications_are_skipped(db):
+    user = User(email="owner@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    job = Job(user_id=user.id, title="Dev", description="d", requirements="r", skills=["Python"],
+              min_experience=2, public_link=uuid.uuid4().hex)
+    db.add(job)
+    db.flush()
+
+    # Three uploads of the same file; its resumes row already exists
+    content_hash = hashlib.sha256(RESUME.encode()).hexdigest()
+    store_resume(db, content_hash, resume_parser.parse_text(RESUME))
+    applications = {}
+    for scoring_status in ("completed", "pending", "processing"):
+        candidate = Candidate(full_name=scoring_status, email=f"{scoring_status}@example.com")
+        db.add(candidate)
+        db.flush()
+        applications[scoring_status] = Application(
+            job_id=job.id, candidate_id=candidate.id, resume_hash=content_hash, scoring_status=scoring_status
+        )
+        db.add(applications[scoring_status])
+    db.commit()
+
+    progress = rescore_job(db, job)
+
+    assert (progress.total, progress.processed, progress.updated, progress.skipped) == (3, 3, 1, 2)
+    db.expire_all()
+    assert applications["completed"].ai_score is not None
+    for scoring_status in ("pending", "processing"):
+        assert applications[scoring_status].scoring_status == scoring_status
+        assert applications[scoring_status].ai_score is None
@@ -0,0 +1,39 @@
+"""
+ResumeParser fields on the golden corpus of benchmarks.parser_fields:
+every field matches the pattern-by-pattern implementation it replaced
+"""
+import random
+import pytest
+from app.ml.resume_parser import resume_parser
+from benchmarks.parser_fields import EDGE_CASES, LegacyParser, golden_corpus
+from benchmarks.resumes import pdf_bytes, resume_text
+
+legacy = LegacyParser()
+
+
+def mismatched_fields(text: str) -> dict:
+    expected = legacy.parse_text(text)
+    actual = resume_parser.parse_text(text)
+    return {field: (expected[field], actual[field]) for field in expected if expected[field] != actual[field]}
+
+
+@pytest.mark.parametrize("text", EDGE_CASES, ids=range(len(EDGE_CASES)))
+def test_edge_cases(text):
+    assert mismatched_fields(text) == {}
+
+
+def test_golden_corpus():
+    mismatches = [(text[:200], fields) for text in golden_corpus(200, 300, seed=42) if (fields := mismatched_fields(text))]
+    assert mismatches == []
+
+
+def test_parse_pdf(tmp_path):
+    for i in range(5):
+        path = tmp_path / f"resume{i}.pdf"
+        path.write_bytes(pdf_bytes(resume_text(random.Random(i), 300, 0.05, years=i + 2, index=i)))
+
+        parsed = resume_parser.parse(str(path))
+        expected = legacy.parse_text(resume_parser.extract_text(str(path)))
+
+        assert parsed["email"] is not None
+        assert {field: parsed[field] for field in expected} == expected
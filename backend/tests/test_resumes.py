@@ -0,0 +1,106 @@
+"""
+Per-file data lives once on resumes: duplicate uploads share one text
+search document and embedding, and older databases move theirs over
+"""
+import random
+import uuid
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+from app.db.database import Base
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.services.resumes import migrate_resumes
+from app.services.search import reindex_search
+from benchmarks.resumes import pdf_bytes, resume_text
+
+RESUME = "Jane Doe\njane@example.com\nSite reliability engineer, 6 years of Python, Kubernetes and Terraform."
+
+
+def create_job(client, auth_headers, title: str) -> str:
+    response = client.post("/api/jobs", json={
+        "title": title,
+        "description": "Run production infrastructure",
+        "requirements": "Kubernetes",
+        "skills": ["Python", "Kubernetes"],
+        "min_experience": 2
+    }, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_duplicate_uploads_share_search_columns(client, auth_headers, db):
+    pdf = pdf_bytes(RESUME + "\n" + resume_text(random.Random(0), 150))
+    job_ids = [create_job(client, auth_headers, title) for title in ("SRE", "Platform Engineer")]
+    for job_id in job_ids:
+        response = client.post(
+            f"/api/jobs/{job_id}/applications/import",
+            files=[("files", ("jane.pdf", pdf, "application/pdf"))],
+            headers=auth_headers
+        )
+        assert response.json()["imported"] == 1, response.text
+
+    columns = {column["name"] for column in inspect(db.get_bind()).get_columns("applications")}
+    assert not columns & {"search_vector", "embedding"}
+    resume = db.query(Resume).one()
+    assert resume.embedding and "kubernetes" in resume.search_vector
+
+    response = client.get("/api/applications/search", params={"q": "kubernetes terraform"}, headers=auth_headers)
+    assert {result["job_id"] for result in response.json()["results"]} == set(job_ids)
+
+    for job_id in job_ids:
+        response = client.get(f"/api/jobs/{job_id}/applications/similar", headers=auth_headers)
+        assert [application["similarity"] > 0 for application in response.json()["applications"]] == [True]
+
+
+@pytest.fixture
+def previous_version_db(tmp_path):
+    """A database of the version that kept search columns on applications"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'previous.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE applications ADD COLUMN search_vector TEXT"))
+        conn.execute(text("ALTER TABLE applications ADD COLUMN embedding BLOB"))
+        conn.execute(text("CREATE INDEX ix_applications_search_vector ON applications (search_vector)"))
+
+    with Session(engine) as db:
+        user = User(email="owner@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+        job = Job(user_id=user.id, title="SRE", description="d", requirements="r", public_link=uuid.uuid4().hex)
+        candidates = [Candidate(full_name=f"C{i}", email=f"c{i}@example.com") for i in range(2)]
+        db.add_all([job, *candidates])
+        db.flush()
+        # One application parsed inline, one whose resumes row predates search columns
+        db.add(Application(
+            job_id=job.id, candidate_id=candidates[0].id,
+            resume_parsed={"raw_text": RESUME, "name": "Jane Doe", "skills": ["Python", "Kubernetes"]}
+        ))
+        db.add(Resume(content_hash="a" * 64, parser_version="legacy", text="Go developer", parsed={"skills": ["Go"]}))
+        db.add(Application(job_id=job.id, candidate_id=candidates[1].id, resume_hash="a" * 64))
+        db.commit()
+        yield db
+    engine.dispose()
+
+
+def test_migration_moves_search_columns_to_resumes(previous_version_db):
+    db = previous_version_db
+
+    result = migrate_resumes(db)
+
+    assert result["dropped_columns"] == ["search_vector", "embedding"]
+    columns = {column["name"] for column in inspect(db.get_bind()).get_columns("applications")}
+    assert not columns & {"search_vector", "embedding"}
+    assert migrate_resumes(db)["dropped_columns"] == []
+
+    # The migrated inline resume is indexed when stored; the older row by index-search
+    assert db.query(Resume).filter(Resume.embedding.is_(None)).count() == 1
+    assert reindex_search(db) == {"resumes": 1, "applications": 2}
+    assert db.query(Resume).filter(Resume.embedding.is_(None)).count() == 0
+    assert {document for (document,) in db.query(Resume.search_vector)} == {
+        "jane doe\n" + RESUME.lower() + "\npython, kubernetes",
+        "go developer\ngo"
+    }
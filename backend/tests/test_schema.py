@@ -0,0 +1,78 @@
+"""
+upgrade_schema brings a database created by the first release up to the
+current models, and does nothing on a current one
+"""
+import uuid
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session
+from app.db.database import Base
+from app.db.schema import upgrade_schema
+from app.models.application import Application
+
+# Tables as the first release created them
+OLD_SCHEMA = [
+    """CREATE TABLE users (
+        id CHAR(32) PRIMARY KEY, email VARCHAR(255) NOT NULL UNIQUE, password_hash VARCHAR(255) NOT NULL,
+        company_name VARCHAR(255), created_at DATETIME)""",
+    """CREATE TABLE jobs (
+        id CHAR(32) PRIMARY KEY, user_id CHAR(32) NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+        title VARCHAR(255) NOT NULL, description TEXT NOT NULL, requirements TEXT NOT NULL, skills JSON,
+        min_experience INTEGER, public_link VARCHAR(20) UNIQUE, status VARCHAR(20),
+        created_at DATETIME, updated_at DATETIME)""",
+    """CREATE TABLE candidates (
+        id CHAR(32) PRIMARY KEY, email VARCHAR(255) NOT NULL, phone VARCHAR(50), full_name VARCHAR(255) NOT NULL,
+        years_of_experience INTEGER, current_company VARCHAR(255), created_at DATETIME)""",
+    """CREATE TABLE applications (
+        id CHAR(32) PRIMARY KEY, job_id CHAR(32) NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+        candidate_id CHAR(32) NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+        resume_path VARCHAR(500), resume_parsed JSON, ai_score NUMERIC(5, 2), score_breakdown JSON,
+        explanation TEXT, status VARCHAR(30), notes TEXT, applied_at DATETIME, updated_at DATETIME,
+        CONSTRAINT unique_job_candidate UNIQUE (job_id, candidate_id))""",
+]
+
+
+@pytest.fixture
+def old_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    ids = {name: uuid.uuid4().hex for name in ("user", "job", "candidate", "application")}
+    with engine.begin() as conn:
+        for statement in OLD_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text("INSERT INTO users (id, email, password_hash) VALUES (:user, 'a@example.com', 'x')"), ids)
+        conn.execute(text(
+            "INSERT INTO jobs (id, user_id, title, description, requirements, public_link) "
+            "VALUES (:job, :user, 'Dev', 'd', 'r', 'abc')"
+        ), ids)
+        conn.execute(text("INSERT INTO candidates (id, email, full_name) VALUES (:candidate, 'c@example.com', 'C')"), ids)
+        conn.execute(text(
+            "INSERT INTO applications (id, job_id, candidate_id, ai_score) VALUES (:application, :job, :candidate, 70)"
+        ), ids)
+    yield engine
+    engine.dispose()
+
+
+def test_upgrades_old_database(old_engine):
+    applied = upgrade_schema(old_engine)
+
+    assert any("scoring_status" in statement for statement in applied)
+    assert any("cascade_top_k" in statement for statement in applied)
+
+    inspector = inspect(old_engine)
+    with old_engine.connect() as conn:
+        # The inspector leaves out expression indexes on SQLite
+        indexes = set(conn.scalars(text("SELECT name FROM sqlite_master WHERE type = 'index'")))
+    for table in Base.metadata.sorted_tables:
+        assert {column.name for column in table.columns} <= {column["name"] for column in inspector.get_columns(table.name)}
+        assert {index.name for index in table.indexes} <= indexes
+
+    with Session(old_engine) as db:
+        application = db.scalars(select(Application)).one()
+        assert application.scoring_status == "completed"
+        assert application.rule_score is None
+
+    assert upgrade_schema(old_engine) == []
+
+
+def test_current_database_is_unchanged(db):
+    assert upgrade_schema(db.get_bind()) == []
@@ -0,0 +1,93 @@
+"""
+Scoring cascade: the top-K gate reads a job's best rule scores once, and
+results are labelled with how they were produced
+"""
+import uuid
+import pytest
+from sqlalchemy import event
+from app.db.database import engine
+from app.ml.ai_analyzer import ai_analyzer
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.user import User
+from app.services import scoring
+from app.services.scoring import cascade_decision, higher_rule_scores_counters, score_resume
+from app.utils.metrics import scoring_results
+
+RULE_SCORES = [90, 80, 80, 70, 60, 50, None]
+
+
+@pytest.fixture
+def job(db):
+    user = User(email="owner@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    job = Job(user_id=user.id, title="Dev", description="d", requirements="r", skills=["Python"], public_link=uuid.uuid4().hex)
+    db.add(job)
+    db.commit()
+    return job
+
+
+@pytest.fixture
+def application_ids(db, job):
+    ids = []
+    for i, rule_score in enumerate(RULE_SCORES):
+        candidate = Candidate(full_name=f"Candidate {i}", email=f"candidate{i}@example.com")
+        db.add(candidate)
+        db.flush()
+        application = Application(job_id=job.id, candidate_id=candidate.id, rule_score=rule_score)
+        db.add(application)
+        db.flush()
+        ids.append(application.id)
+    db.commit()
+    return ids
+
+
+@pytest.mark.parametrize("top_k", [1, 2, 3, 5])
+def test_counters_decide_like_a_full_count(db, job, application_ids, top_k):
+    job_data = {"cascade_top_k": top_k}
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    counters = higher_rule_scores_counters(db, job_data, job.id, application_ids)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        decisions = [
+            cascade_decision(rule_score, job_data, counter)
+            for counter in counters
+            for rule_score in (95, 85, 80, 75, 55, 0)
+        ]
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    expected = [
+        "outside_top_k" if sum(
+            1 for other_id, other in zip(application_ids, RULE_SCORES)
+            if other_id != application_id and other is not None and other > rule_score
+        ) >= top_k else "shortlisted"
+        for application_id in application_ids
+        for rule_score in (95, 85, 80, 75, 55, 0)
+    ]
+    assert decisions == expected
+    assert len(statements) == 1
+
+
+def test_no_counters_without_top_k(db, job, application_ids):
+    assert higher_rule_scores_counters(db, {"cascade_top_k": None}, job.id, application_ids) == [None] * len(application_ids)
+
+
+def test_empty_resume_is_not_counted_as_fallback(monkeypatch):
+    monkeypatch.setattr(ai_analyzer, "is_available", lambda: True)
+    monkeypatch.setattr(ai_analyzer, "analyze_resume", lambda *args: pytest.fail("AI called without resume text"))
+    before = {method: scoring_results.value(method=method) for method in ("rules", "fallback")}
+
+    _, score_result = score_resume({"raw_text": "", "skills": []}, scoring.build_job_data(Job(
+        title="Dev", description="d", requirements="r", skills=["Python"], min_experience=2
+    )))
+
+    assert not score_result.get("ai_powered")
+    assert scoring_results.value(method="rules") == before["rules"] + 1
+    assert scoring_results.value(method="fallback") == before["fallback"]
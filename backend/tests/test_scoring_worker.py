@@ -0,0 +1,79 @@
+"""
+ScoringWorker handling of resumes whose text cannot be extracted
+"""
+import uuid
+import pytest
+from app.ml.resume_parser import resume_parser
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.user import User
+from app.services.extraction import ExtractionTimeout
+from app.services.scoring_queue import InMemoryScoringQueue
+from app.services.scoring_worker import ScoringWorker
+
+RESUME = "Jane Doe\njane@example.com\nBackend developer, 6 years of experience with Python and Docker."
+
+
+class FlakyExtractor:
+    """Stands in for ExtractionPool: times out `failures` times, then extracts RESUME"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def extract_and_parse(self, file_path: str):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ExtractionTimeout("Extraction exceeded 20s")
+        return RESUME, resume_parser.parse_text(RESUME)
+
+
+@pytest.fixture
+def application_id(db, tmp_path):
+    user = User(email=f"{uuid.uuid4().hex}@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    job = Job(user_id=user.id, title="Backend Developer", description="APIs", requirements="Python",
+              skills=["Python", "Docker"], min_experience=3)
+    candidate = Candidate(full_name="Jane Doe", email="jane@example.com")
+    db.add_all([job, candidate])
+    db.flush()
+
+    resume_path = tmp_path / "resume.pdf"
+    resume_path.write_bytes(b"not a pdf")
+    application = Application(job_id=job.id, candidate_id=candidate.id, resume_path=str(resume_path),
+                              resume_hash=uuid.uuid4().hex, scoring_status="pending")
+    db.add(application)
+    db.commit()
+    return application.id
+
+
+def run_worker(db, application_id, extractor=None):
+    queue = InMemoryScoringQueue()
+    worker = ScoringWorker(queue, extractor=extractor, poll_interval=0, max_attempts=3)
+    queue.enqueue(db, application_id)
+    db.commit()
+    worker.run_pending()
+    db.expire_all()
+    return queue, db.get(Application, application_id)
+
+
+def test_unreadable_resume_fails_instead_of_scoring_empty(db, application_id):
+    queue, application = run_worker(db, application_id)
+
+    assert application.scoring_status == "failed"
+    assert application.ai_score is None
+    assert len(queue.failed) == 1
+    assert queue.failed[0][0].attempts == 3
+
+
+def test_transient_extraction_error_is_retried(db, application_id):
+    extractor = FlakyExtractor(failures=2)
+
+    queue, application = run_worker(db, application_id, extractor)
+
+    assert extractor.calls == 3
+    assert application.scoring_status == "completed"
+    assert application.ai_score is not None
+    assert not queue.failed
@@ -0,0 +1,81 @@
+"""
+Candidate search pages with keyset cursors without skipping or repeating
+rows whose sort value ties with the cursor's
+"""
+import struct
+import uuid
+from datetime import datetime
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.user import User
+from app.services import search
+from app.services.applications import decode_cursor, encode_cursor
+
+APPLIED_AT = datetime(2024, 1, 15, 9, 30)
+
+
+@pytest.fixture
+def application_ids(client, auth_headers, db):
+    user = db.query(User).filter(User.email == "recruiter@example.com").one()
+    job = Job(user_id=user.id, title="Dev", description="d", requirements="r", skills=["Python"],
+              min_experience=2, public_link=uuid.uuid4().hex)
+    db.add(job)
+    db.flush()
+
+    ids = []
+    for i in range(7):
+        candidate = Candidate(full_name=f"Candidate {i}", email=f"candidate{i}@example.com")
+        db.add(candidate)
+        db.flush()
+        # Five applications share one timestamp
+        application = Application(
+            job_id=job.id, candidate_id=candidate.id, scoring_status="completed", skills=["python"],
+            applied_at=APPLIED_AT if i < 5 else datetime(2024, 1, 10 + i)
+        )
+        db.add(application)
+        db.flush()
+        ids.append(application.id)
+    db.commit()
+    return ids
+
+
+def test_pages_cover_tied_rows_once(client, auth_headers, application_ids):
+    seen = []
+    cursor = None
+    while True:
+        params = {"skill": "python", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/applications/search", params=params, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        seen += [uuid.UUID(result["application_id"]) for result in page["results"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(application_ids)
+    assert len(seen) == len(set(seen))
+
+
+def test_rank_is_selected_and_compared_in_double_precision(monkeypatch):
+    monkeypatch.setattr(search, "POSTGRES", True)
+    sort_column, sort_by = search.search_sort("python")
+    filters = search.search_filters(uuid.uuid4(), "python", [], None)
+    statement = search.search_page(search.search_statement(filters, sort_column), sort_column, 0.1, uuid.uuid4(), 20)
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sort_by == "rank"
+    # Selected, compared with the cursor and ordered by, always as float8
+    assert sql.count("CAST(ts_rank_cd(") == 3
+    assert sql.count("AS FLOAT(53))") == 3
+
+
+def test_rank_cursor_round_trips_exactly():
+    # A real rank widened to double, as Postgres returns the cast value
+    rank = struct.unpack("f", struct.pack("f", 0.1))[0]
+    application_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(rank, application_id), "rank") == (rank, application_id)
@@ -0,0 +1,82 @@
+"""
+Password hashing: logins upgrade hashes of another bcrypt cost, and a
+saturated hashing pool fails fast with 503 instead of queueing
+"""
+import threading
+import pytest
+from app.models.user import User
+from app.utils.security import HashingBusy, PasswordHasher, hash_password, hash_rounds, password_hasher
+
+PASSWORD = "secret-password"
+
+
+@pytest.mark.parametrize("hashed, rounds", [
+    ("$2b$12$" + "a" * 53, 12),
+    ("$2b$04$" + "a" * 53, 4),
+    ("not-a-hash", None),
+    ("", None),
+])
+def test_hash_rounds(hashed, rounds):
+    assert hash_rounds(hashed) == rounds
+
+
+def test_needs_rehash_compares_with_configured_cost():
+    hasher = PasswordHasher(rounds=5, workers=1)
+    try:
+        assert not hasher.needs_rehash(hash_password(PASSWORD, rounds=5))
+        assert hasher.needs_rehash(hash_password(PASSWORD, rounds=4))
+        assert hasher.needs_rehash("not-a-hash")
+    finally:
+        hasher.shutdown()
+
+
+def test_login_upgrades_hash_of_another_cost(client, db):
+    user = User(email="old@example.com", password_hash=hash_password(PASSWORD, rounds=password_hasher.rounds + 1))
+    db.add(user)
+    db.commit()
+
+    response = client.post("/api/auth/login", json={"email": "old@example.com", "password": PASSWORD})
+
+    assert response.status_code == 200, response.text
+    db.refresh(user)
+    assert hash_rounds(user.password_hash) == password_hasher.rounds
+    upgraded = user.password_hash
+
+    # Wrong passwords and hashes already at the configured cost are left alone
+    assert client.post("/api/auth/login", json={"email": "old@example.com", "password": "wrong"}).status_code == 401
+    assert client.post("/api/auth/login", json={"email": "old@example.com", "password": PASSWORD}).status_code == 200
+    db.refresh(user)
+    assert user.password_hash == upgraded
+
+
+def test_pool_rejects_hashes_beyond_max_pending():
+    hasher = PasswordHasher(rounds=4, workers=1, max_pending=1)
+    release = threading.Event()
+    try:
+        running = hasher._submit(release.wait)
+        with pytest.raises(HashingBusy):
+            hasher.hash(PASSWORD)
+
+        release.set()
+        running.result()
+        assert hash_rounds(hasher.hash(PASSWORD)) == 4
+    finally:
+        release.set()
+        hasher.shutdown()
+
+
+def test_busy_pool_is_503(client, auth_headers, monkeypatch):
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    monkeypatch.setattr(password_hasher, "_slots", slots)
+
+    responses = [
+        client.post("/api/auth/login", json={"email": "recruiter@example.com", "password": PASSWORD}),
+        client.post("/api/auth/register", json={"email": "new@example.com", "password": PASSWORD, "company_name": "New Co"}),
+    ]
+
+    for response in responses:
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    # Requests that do not hash are unaffected
+    assert client.get("/api/auth/me", headers=auth_headers).status_code == 200
@@ -0,0 +1,59 @@
+"""
+Skill filters of the application list and candidate search match whole,
+normalized skills
+"""
+import uuid
+import pytest
+from app.models.application import Application
+from app.models.candidate import Candidate
+
+SKILLS = {
+    "python": ["python", "docker"],
+    "javascript": ["javascript", "react"],
+    "java": ["java", "docker"],
+}
+
+
+@pytest.fixture
+def job_id(client, auth_headers, db):
+    response = client.post("/api/jobs", json={
+        "title": "Backend Developer",
+        "description": "Build APIs",
+        "requirements": "Python",
+        "skills": ["Python", "Docker"],
+        "min_experience": 2
+    }, headers=auth_headers)
+    assert response.status_code in (200, 201), response.text
+    job_id = uuid.UUID(response.json()["id"])
+
+    for name, skills in SKILLS.items():
+        candidate = Candidate(full_name=name, email=f"{name}@example.com")
+        db.add(candidate)
+        db.flush()
+        db.add(Application(job_id=job_id, candidate_id=candidate.id, skills=skills, scoring_status="completed"))
+    db.commit()
+    return job_id
+
+
+def listed(client, auth_headers, job_id, *skills) -> set:
+    response = client.get(f"/api/jobs/{job_id}/applications", params={"skill": list(skills)}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return {application["candidate"]["full_name"] for application in response.json()["applications"]}
+
+
+def searched(client, auth_headers, *skills) -> set:
+    response = client.get("/api/applications/search", params={"skill": list(skills)}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return {result["candidate"]["full_name"] for result in response.json()["results"]}
+
+
+@pytest.mark.parametrize("skills, expected", [
+    (["Java"], {"java"}),
+    (["  PYTHON "], {"python"}),
+    (["docker"], {"python", "java"}),
+    (["Docker", "Java"], {"java"}),
+    (["script"], set()),
+])
+def test_list_and_search_agree(client, auth_headers, job_id, skills, expected):
+    assert listed(client, auth_headers, job_id, *skills) == expected
+    assert searched(client, auth_headers, *skills) == expected
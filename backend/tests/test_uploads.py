@@ -0,0 +1,115 @@
+"""
+Request bodies are bounded before Starlette buffers them: declared sizes
+over the limit get 413, chunked bodies without a Content-Length 411, and
+bodies that outgrow their limit stop being read
+"""
+import asyncio
+import os
+import uuid
+import pytest
+from app.config import get_settings
+from app.models.application import Application
+from app.models.job import Job
+from app.utils.uploads import MULTIPART_OVERHEAD, BodySizeLimitMiddleware
+
+settings = get_settings()
+
+
+@pytest.fixture
+def public_link(client, auth_headers, db):
+    response = client.post("/api/jobs", json={
+        "title": "Backend Developer",
+        "description": "Build APIs",
+        "requirements": "Python",
+        "skills": ["Python"],
+        "min_experience": 2
+    }, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    job = db.get(Job, uuid.UUID(response.json()["id"]))
+    job.status = "published"
+    db.commit()
+    return job.public_link
+
+
+def apply(client, public_link: str, resume: bytes, **kwargs):
+    return client.post(
+        f"/api/public/apply/{public_link}",
+        data={"full_name": "Jane Doe", "email": "jane@example.com"},
+        files={"resume": ("resume.pdf", resume, "application/pdf")},
+        **kwargs
+    )
+
+
+def stored_uploads() -> list:
+    if not os.path.isdir(settings.upload_dir):
+        return []
+    return os.listdir(settings.upload_dir)
+
+
+def test_small_upload_is_accepted(client, public_link, db):
+    response = apply(client, public_link, b"%PDF-1.4 tiny")
+
+    assert response.status_code == 200, response.text
+    assert db.query(Application).count() == 1
+
+
+def test_oversized_upload_is_rejected_before_the_route(client, public_link, db):
+    before = stored_uploads()
+
+    response = apply(client, public_link, b"x" * (settings.max_file_size + MULTIPART_OVERHEAD))
+
+    assert response.status_code == 413
+    assert "Maximum size" in response.json()["detail"]
+    assert db.query(Application).count() == 0
+    assert stored_uploads() == before
+
+
+def test_chunked_upload_without_content_length_is_rejected(client, public_link, db):
+    def chunks():
+        yield b"--boundary\r\n"
+        yield b"x" * 1024
+
+    response = client.post(
+        f"/api/public/apply/{public_link}",
+        content=chunks(),
+        headers={"Content-Type": "multipart/form-data; boundary=boundary"}
+    )
+
+    assert response.status_code == 411
+    assert db.query(Application).count() == 0
+
+
+def test_import_path_has_its_own_limit():
+    middleware = BodySizeLimitMiddleware(None, 100, [(r"^/api/jobs/[^/]+/applications/import$", 1000)])
+
+    assert middleware.limit_for(f"/api/jobs/{uuid.uuid4()}/applications/import") == 1000
+    assert middleware.limit_for("/api/public/apply/abc") == 100
+
+
+def test_reading_stops_when_body_outgrows_the_limit():
+    seen = []
+
+    async def app(scope, receive, send):
+        while True:
+            message = await receive()
+            seen.append(message)
+            if message["type"] == "http.disconnect" or not message.get("more_body"):
+                return
+
+    messages = iter([
+        {"type": "http.request", "body": b"x" * 60, "more_body": True},
+        {"type": "http.request", "body": b"x" * 60, "more_body": True},
+        {"type": "http.request", "body": b"x" * 60, "more_body": False},
+    ])
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        raise AssertionError("nothing should be sent")
+
+    # Declares less than it sends, as a misbehaving proxy might
+    scope = {"type": "http", "path": "/api/public/apply/abc", "headers": [(b"content-length", b"60")]}
+    asyncio.run(BodySizeLimitMiddleware(app, 100)(scope, receive, send))
+
+    assert [message["type"] for message in seen] == ["http.request", "http.disconnect"]
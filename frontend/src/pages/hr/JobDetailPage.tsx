@@ -16,6 +16,9 @@ function JobDetailPage() {
   const navigate = useNavigate();
   const [job, setJob] = useState<Job | null>(null);
   const [applications, setApplications] = useState<Application[]>([]);
+  const [totalApplications, setTotalApplications] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [copied, setCopied] = useState(false);
   const [selectedApplicationId, setSelectedApplicationId] = useState<string | null>(null);
@@ -43,6 +46,8 @@ function JobDetailPage() {
       ]);
       setJob(jobData);
       setApplications(appsData.applications);
+      setTotalApplications(appsData.total ?? appsData.applications.length);
+      setNextCursor(appsData.next_cursor);
     } catch (error) {
       toast.error('Failed to load job');
       navigate('/jobs');
@@ -51,6 +56,20 @@ function JobDetailPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const appsData = await applicationsApi.list(id!, undefined, 'score', nextCursor);
+      setApplications(prev => [...prev, ...appsData.applications]);
+      setNextCursor(appsData.next_cursor);
+    } catch (error) {
+      toast.error('Failed to load more candidates');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const copyLink = () => {
     if (job) {
       const link = `${window.location.origin}/job/${job.public_link}`;
@@ -200,7 +219,7 @@ function JobDetailPage() {
         <div>
           <div className="flex items-center gap-2 mb-4">
             <Users className="w-5 h-5 text-gray-600" />
-            <h2 className="text-lg font-semibold">Candidates ({applications.length})</h2>
+            <h2 className="text-lg font-semibold">Candidates ({totalApplications})</h2>
           </div>
 
           {applications.length === 0 ? (
@@ -299,6 +318,13 @@ function JobDetailPage() {
                   </div>
                 </Card>
               ))}
+              {nextCursor && (
+                <div className="text-center">
+                  <Button variant="secondary" onClick={loadMore} loading={loadingMore}>
+                    Load more candidates
+                  </Button>
+                </div>
+              )}
             </div>
           )}
         </div>
@@ -109,9 +109,15 @@ export const publicApi = {
 
 // Applications API
 export const applicationsApi = {
-  list: async (jobId: string, status?: string, sortBy: string = 'score'): Promise<ApplicationListResponse> => {
+  list: async (
+    jobId: string,
+    status?: string,
+    sortBy: string = 'score',
+    cursor?: string
+  ): Promise<ApplicationListResponse> => {
     const params: Record<string, string> = { sort_by: sortBy };
     if (status) params.status = status;
+    if (cursor) params.cursor = cursor;
     const response = await api.get<ApplicationListResponse>(`/jobs/${jobId}/applications`, { params });
     return response.data;
   },
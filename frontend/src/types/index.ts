@@ -24,6 +24,7 @@ export interface Job {
   status: string;
   created_at: string;
   applications_count?: number;
+  applications_by_status?: Record<string, number>;
 }
 
 export interface JobPublic {
@@ -58,6 +59,7 @@ export interface ScoreBreakdown {
   strengths?: string[];
   concerns?: string[];
   ai_powered?: boolean;
+  ai_cached?: boolean;
 }
 
 export interface ParsedResume {
@@ -75,6 +77,7 @@ export interface Application {
   ai_score: number | null;
   score_breakdown: ScoreBreakdown | null;
   explanation: string | null;
+  scoring_status: 'pending' | 'processing' | 'completed' | 'failed';
   status: string;
   applied_at: string;
   resume_path: string | null;
@@ -91,7 +94,8 @@ export interface ApplicationDetail extends Application {
 
 export interface ApplicationListResponse {
   applications: Application[];
-  total: number;
+  total: number | null;
+  next_cursor: string | null;
 }
 
 // Form types